@@ -3,16 +3,71 @@ DynamoDB Adapter for Chat Messages
 - 로컬/AWS DynamoDB 모두 지원 (환경변수로 전환)
 - 채팅 메시지 저장 및 조회
 - 일단위 회의록 관리
+- CHAT_HOT_ROOMS로 지정한 핫 채팅방은 pk에 샤드 접미사(#S{n})를 붙여 여러 파티션에 나눠 쓰고
+  조회 시 모든 샤드를 병렬로 읽어 시간순으로 병합
+- CHAT_ARCHIVE_ENABLED면 CHAT_ARCHIVE_AFTER_DAYS일 지난 날짜는 S3 일별 파일
+  (teams/{team_id}/chats/{date}/project_{project_id}.jsonl.gz)에서 읽고, 파일이 없는 날만 DynamoDB 조회
+  (compact_archives()가 파일 저장에 성공한 뒤에만 DynamoDB 항목에 TTL(expire_at)을 붙여 삭제)
+- 회의 중 메시지에만 meeting_pk/meeting_sk를 넣어 sparse GSI(meeting-index)를 구성
+  → meeting_only 조회(회의록 생성)는 그날 전체 메시지가 아니라 회의 메시지만 읽음
 """
+import asyncio
+import gzip
+import hashlib
 import logging
-from datetime import datetime, date
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, date, timedelta
 from typing import Optional
 import json
-import aioboto3
 from app.core.config import settings
+from app.core.database import aws_manager
+from app.utils.s3_paths import s3_path_manager
+from app.utils.sort_keys import iso_to_us, sort_key_generator
 
 logger = logging.getLogger(__name__)
 
+# 회의 중 메시지만 들어가는 sparse GSI (meeting_pk = pk, meeting_sk = {date_key}#{sk})
+MEETING_INDEX = 'meeting-index'
+
+
+def _parse_hot_rooms(value: str) -> dict[int, int]:
+    rooms: dict[int, int] = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            room, shards = part.split(":", 1)
+            rooms[int(room)] = max(1, min(int(shards), settings.CHAT_SHARD_MAX))
+        except ValueError:
+            logger.warning(f"잘못된 CHAT_HOT_ROOMS 항목 무시: {part}")
+    return rooms
+
+
+def _archive_cutoff() -> str:
+    """이 날짜(date_key 기준)보다 이전은 아카이브 대상"""
+    return (date.today() - timedelta(days=settings.CHAT_ARCHIVE_AFTER_DAYS)).isoformat()
+
+
+def _days_between(start_day: str, end_day: str) -> list[str]:
+    start, end = date.fromisoformat(start_day), date.fromisoformat(end_day)
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+def _item_to_message(item: dict) -> dict:
+    """DynamoDB 항목 → 메시지 dict (아카이브 병합/정렬용 sk 포함)"""
+    return {
+        'sk': item['sk']['S'],
+        'user': item['user']['S'],
+        'msg': item['message']['S'],
+        'time': item['time']['S'],
+        'timestamp': int(item['timestamp']['N']),
+        'is_in_meeting': item.get('is_in_meeting', {}).get('BOOL', False),
+        'date': item['date_key']['S']
+    }
+
 
 class DynamoDBAdapter:
     """DynamoDB 어댑터 - 채팅 메시지 및 회의록 관리"""
@@ -20,24 +75,32 @@ class DynamoDBAdapter:
     def __init__(self):
         self.table_name = settings.DDB_TABLE_NAME
         self.endpoint_url = settings.DDB_ENDPOINT_URL or None  # 비어있으면 AWS 사용
-        self._session = None
-    
-    @property
-    def session(self):
-        if not self._session:
-            self._session = aioboto3.Session(
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
-            )
-        return self._session
+        self.hot_rooms = _parse_hot_rooms(settings.CHAT_HOT_ROOMS)
+    
+    def _pks(self, team_id: int, project_id: int) -> list[str]:
+        """조회할 pk 목록 (샤드 0은 기존 pk 그대로)"""
+        base = f"TEAM#{team_id}#PROJECT#{project_id}"
+        shards = self.hot_rooms.get(project_id, 1)
+        return [base] + [f"{base}#S{n}" for n in range(1, shards)]
+    
+    def _pk_for_write(self, team_id: int, project_id: int, client_msg_id: Optional[str]) -> str:
+        """이번 메시지를 쓸 pk (재전송은 같은 샤드로 가도록 client_msg_id 해시 사용)"""
+        pks = self._pks(team_id, project_id)
+        if len(pks) == 1:
+            return pks[0]
+        if client_msg_id:
+            return pks[int(hashlib.sha256(client_msg_id.encode()).hexdigest()[:8], 16) % len(pks)]
+        return random.choice(pks)
     
     def _get_client(self):
-        """DynamoDB 클라이언트 컨텍스트 매니저 반환"""
-        return self.session.client(
+        """공유 DynamoDB 클라이언트 컨텍스트 반환 (프로세스당 1개, 종료 시 닫지 않음)"""
+        return aws_manager.clients.client(
+            'dynamodb:chat',
             'dynamodb',
             endpoint_url=self.endpoint_url,
-            region_name=settings.AWS_REGION
+            region_name=settings.AWS_REGION,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None
         )
     
     async def ensure_table_exists(self):
@@ -62,6 +125,8 @@ class DynamoDBAdapter:
                             {'AttributeName': 'pk', 'AttributeType': 'S'},
                             {'AttributeName': 'sk', 'AttributeType': 'S'},
                             {'AttributeName': 'date_key', 'AttributeType': 'S'},  # GSI용
+                            {'AttributeName': 'meeting_pk', 'AttributeType': 'S'},  # 회의 메시지 GSI용
+                            {'AttributeName': 'meeting_sk', 'AttributeType': 'S'},
                         ],
                         GlobalSecondaryIndexes=[
                             {
@@ -75,7 +140,8 @@ class DynamoDBAdapter:
                                     'ReadCapacityUnits': 5,
                                     'WriteCapacityUnits': 5
                                 }
-                            }
+                            },
+                            self._meeting_index_spec()
                         ],
                         ProvisionedThroughput={
                             'ReadCapacityUnits': 5,
@@ -87,13 +153,79 @@ class DynamoDBAdapter:
                     logger.error(f"Error checking/creating table: {e}")
                     raise
     
+    @staticmethod
+    def _meeting_index_spec() -> dict:
+        return {
+            'IndexName': MEETING_INDEX,
+            'KeySchema': [
+                {'AttributeName': 'meeting_pk', 'KeyType': 'HASH'},
+                {'AttributeName': 'meeting_sk', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'},
+            'ProvisionedThroughput': {
+                'ReadCapacityUnits': 5,
+                'WriteCapacityUnits': 5
+            }
+        }
+    
+    async def migrate_meeting_index(self) -> dict:
+        """
+        기존 테이블에 meeting-index 추가 + 기존 회의 메시지에 meeting_pk/meeting_sk 채우기
+        (migrate_meeting_index.py로 한 번 실행, 여러 번 실행해도 안전)
+        """
+        async with self._get_client() as client:
+            desc = await client.describe_table(TableName=self.table_name)
+            indexes = {gsi['IndexName'] for gsi in desc['Table'].get('GlobalSecondaryIndexes', [])}
+            if MEETING_INDEX not in indexes:
+                spec = self._meeting_index_spec()
+                if desc['Table'].get('BillingModeSummary', {}).get('BillingMode') == 'PAY_PER_REQUEST':
+                    spec.pop('ProvisionedThroughput')
+                await client.update_table(
+                    TableName=self.table_name,
+                    AttributeDefinitions=[
+                        {'AttributeName': 'meeting_pk', 'AttributeType': 'S'},
+                        {'AttributeName': 'meeting_sk', 'AttributeType': 'S'},
+                    ],
+                    GlobalSecondaryIndexUpdates=[{'Create': spec}]
+                )
+                logger.info(f"{self.table_name}: {MEETING_INDEX} 생성 요청")
+            
+            backfilled = 0
+            params = {
+                'TableName': self.table_name,
+                'FilterExpression': 'is_in_meeting = :meeting AND attribute_not_exists(meeting_pk)',
+                'ExpressionAttributeValues': {':meeting': {'BOOL': True}}
+            }
+            while True:
+                resp = await client.scan(**params)
+                for item in resp.get('Items', []):
+                    await client.update_item(
+                        TableName=self.table_name,
+                        Key={'pk': item['pk'], 'sk': item['sk']},
+                        UpdateExpression='SET meeting_pk = :mpk, meeting_sk = :msk',
+                        ExpressionAttributeValues={
+                            ':mpk': item['pk'],
+                            ':msk': {'S': f"{item['date_key']['S']}#{item['sk']['S']}"}
+                        }
+                    )
+                    backfilled += 1
+                if not resp.get('LastEvaluatedKey'):
+                    break
+                params['ExclusiveStartKey'] = resp['LastEvaluatedKey']
+        
+        result = {'index': MEETING_INDEX, 'created': MEETING_INDEX not in indexes, 'backfilled': backfilled}
+        logger.info(f"meeting-index 마이그레이션 완료: {result}")
+        return result
+    
     async def save_chat_message(
         self,
         team_id: int,
         project_id: int,
         user: str,
         message: str,
-        is_in_meeting: bool = False
+        is_in_meeting: bool = False,
+        client_msg_id: Optional[str] = None,
+        client_timestamp: Optional[str] = None
     ) -> dict:
         """
         채팅 메시지를 DynamoDB에 저장
@@ -104,17 +236,23 @@ class DynamoDBAdapter:
             user: 발신자
             message: 메시지 내용
             is_in_meeting: 회의 중 여부
+            client_msg_id: 재전송 중복 방지용 클라이언트 메시지 ID
+            client_timestamp: 클라이언트 전송 시각 (ISO, client_msg_id와 함께일 때만 키에 사용)
         
         Returns:
             저장된 메시지 정보
         """
-        now = datetime.now()
-        timestamp = int(now.timestamp() * 1000)  # 밀리초 단위
+        # sk = MSG#{마이크로초 16자리}#{노드 ID 또는 idempotency 접미사}
+        # - 앞 13자리가 기존 MSG#{밀리초}와 같아 기존 항목과 시간순 정렬 유지
+        # - 같은 밀리초에 들어온 메시지도 덮어쓰지 않음, 재전송은 같은 sk로 저장
+        us, suffix = sort_key_generator.next(client_msg_id, iso_to_us(client_timestamp))
+        now = datetime.fromtimestamp(us / 1_000_000)
+        timestamp = us // 1000  # 밀리초 단위
         time_str = now.strftime("%H:%M")
         date_str = now.strftime("%Y-%m-%d")
         
-        pk = f"TEAM#{team_id}#PROJECT#{project_id}"
-        sk = f"MSG#{timestamp}"
+        pk = self._pk_for_write(team_id, project_id, client_msg_id)
+        sk = f"MSG#{us:016d}#{suffix}"
         
         item = {
             'pk': {'S': pk},
@@ -129,6 +267,12 @@ class DynamoDBAdapter:
             'is_in_meeting': {'BOOL': is_in_meeting},
             'created_at': {'S': now.isoformat()}
         }
+        if client_msg_id:
+            item['client_msg_id'] = {'S': client_msg_id}
+        if is_in_meeting:
+            # 회의 메시지만 meeting-index에 들어감 (sparse)
+            item['meeting_pk'] = {'S': pk}
+            item['meeting_sk'] = {'S': f"{date_str}#{sk}"}
         
         async with self._get_client() as client:
             await client.put_item(
@@ -170,48 +314,272 @@ class DynamoDBAdapter:
         Returns:
             메시지 목록
         """
-        pk = f"TEAM#{team_id}#PROJECT#{project_id}"
+        if settings.CHAT_ARCHIVE_ENABLED and (start_date or '') < _archive_cutoff():
+            messages = await self._get_with_archive(team_id, project_id, start_date, end_date, meeting_only)
+        else:
+            messages = await self._get_from_table(team_id, project_id, start_date, end_date, meeting_only)
+        for message in messages:
+            message.pop('sk', None)
+        return messages
+    
+    async def _get_from_table(
+        self,
+        team_id: int,
+        project_id: int,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        meeting_only: bool
+    ) -> list[dict]:
+        """DynamoDB에서 조회 (sk 포함 메시지 목록)"""
+        pks = self._pks(team_id, project_id)
         
         async with self._get_client() as client:
-            # 기본 쿼리
+            # 핫 채팅방은 샤드별 pk를 병렬로 조회 후 시간순 병합
+            results = await asyncio.gather(*[
+                self._query_messages(client, pk, start_date, end_date, meeting_only) for pk in pks
+            ])
+        
+        items = [item for shard_items in results for item in shard_items]
+        if len(pks) > 1:
+            items.sort(key=lambda item: item['sk']['S'])
+        
+        return [_item_to_message(item) for item in items]
+    
+    async def _get_with_archive(
+        self,
+        team_id: int,
+        project_id: int,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        meeting_only: bool
+    ) -> list[dict]:
+        """
+        아카이브 경계 이전 날짜는 S3 일별 파일에서, 이후는 DynamoDB에서 조회해 이어 붙임
+        (파일이 없는 날은 아직 compaction 전이므로 DynamoDB에서 그 날짜만 조회)
+        """
+        cutoff = _archive_cutoff()
+        last_archived = (date.fromisoformat(cutoff) - timedelta(days=1)).isoformat()
+        if end_date and end_date < last_archived:
+            last_archived = end_date
+        
+        if start_date:
+            days = _days_between(start_date, last_archived)
+        else:
+            # 전체 기간 조회: 아카이브 파일 목록으로 날짜 확인
+            days = [day for day in await self._list_archive_days(team_id, project_id) if day <= last_archived]
+        
+        sem = asyncio.Semaphore(settings.CHAT_ARCHIVE_READ_CONCURRENCY)
+        
+        async def read_day(day: str) -> list[dict]:
+            async with sem:
+                archived = await self._read_archive(team_id, project_id, day)
+                if archived is None:
+                    return await self._get_from_table(team_id, project_id, day, day, meeting_only)
+            if meeting_only:
+                archived = [m for m in archived if m.get('is_in_meeting')]
+            return archived
+        
+        messages = [m for day_messages in await asyncio.gather(*[read_day(day) for day in days]) for m in day_messages]
+        if end_date is None or end_date >= cutoff:
+            messages += await self._get_from_table(team_id, project_id, cutoff, end_date, meeting_only)
+        return messages
+    
+    # -----------------------------------------------------------------
+    # S3 일별 아카이브
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _archive_key(team_id: int, project_id: int, day: str) -> str:
+        return s3_path_manager.team_chat_archive(team_id, day, f"project_{project_id}")
+    
+    async def _read_archive(self, team_id: int, project_id: int, day: str) -> Optional[list[dict]]:
+        """아카이브 파일 읽기 (없으면 None)"""
+        async with aws_manager.get_s3_client() as s3:
+            try:
+                resp = await s3.get_object(Bucket=settings.S3_BUCKET_TEAM, Key=self._archive_key(team_id, project_id, day))
+            except Exception as e:
+                if 'NoSuchKey' in str(e) or '404' in str(e):
+                    return None
+                raise
+            body = await resp['Body'].read()
+        text = gzip.decompress(body).decode('utf-8')
+        return [json.loads(line) for line in text.splitlines() if line]
+    
+    async def _write_archive(self, team_id: int, project_id: int, day: str, messages: list[dict]) -> None:
+        lines = ''.join(json.dumps(m, ensure_ascii=False, separators=(',', ':')) + '\n' for m in messages)
+        async with aws_manager.get_s3_client() as s3:
+            await s3.put_object(
+                Bucket=settings.S3_BUCKET_TEAM,
+                Key=self._archive_key(team_id, project_id, day),
+                Body=gzip.compress(lines.encode('utf-8')),
+                ContentType='application/x-ndjson',
+                ContentEncoding='gzip'
+            )
+    
+    async def _list_archive_days(self, team_id: int, project_id: int) -> list[str]:
+        """프로젝트의 아카이브 날짜 목록"""
+        prefix = f"{s3_path_manager.prefix}/teams/{team_id}/chats/"
+        suffix = f"/project_{project_id}.jsonl.gz"
+        days = []
+        params = {'Bucket': settings.S3_BUCKET_TEAM, 'Prefix': prefix}
+        async with aws_manager.get_s3_client() as s3:
+            while True:
+                resp = await s3.list_objects_v2(**params)
+                for obj in resp.get('Contents', []):
+                    if obj['Key'].endswith(suffix):
+                        days.append(obj['Key'][len(prefix):-len(suffix)])
+                if not resp.get('IsTruncated'):
+                    break
+                params['ContinuationToken'] = resp['NextContinuationToken']
+        return sorted(days)
+    
+    async def compact_archives(self, start_day: Optional[str] = None, end_day: Optional[str] = None) -> dict:
+        """
+        start_day ~ end_day(포함, date_key 기준) 메시지를 프로젝트/날짜별 S3 파일로 이전
+        기본값: 아카이브 경계 전날까지 아직 아카이브되지 않은(TTL 없는) 모든 날짜 (compact_chats.py로 매일 실행)
+        - 이미 파일이 있으면 sk 기준으로 합쳐 다시 저장 (여러 번 실행해도 결과 동일)
+        - 파일 저장에 성공한 항목에만 CHAT_ARCHIVE_GRACE_DAYS 뒤 만료되도록 TTL 설정
+        - 실패한 프로젝트/날짜는 반환값 failed에 담김 (compact_chats.py가 0이 아닌 코드로 종료)
+        """
+        last_archivable = (date.fromisoformat(_archive_cutoff()) - timedelta(days=1)).isoformat()
+        end_day = min(end_day or last_archivable, last_archivable)
+        
+        groups: dict[tuple[int, int, str], list[dict]] = defaultdict(list)
+        if start_day:
+            params = {
+                'TableName': self.table_name,
+                'FilterExpression': 'date_key BETWEEN :start AND :end',
+                'ExpressionAttributeValues': {':start': {'S': start_day}, ':end': {'S': end_day}}
+            }
+        else:
             params = {
                 'TableName': self.table_name,
-                'KeyConditionExpression': 'pk = :pk',
-                'ExpressionAttributeValues': {
-                    ':pk': {'S': pk}
-                },
-                'ScanIndexForward': True  # 시간순 정렬
+                'FilterExpression': 'date_key <= :end AND attribute_not_exists(expire_at)',
+                'ExpressionAttributeValues': {':end': {'S': end_day}}
             }
+        async with self._get_client() as client:
+            desc = await client.describe_time_to_live(TableName=self.table_name)
+            if desc.get('TimeToLiveDescription', {}).get('TimeToLiveStatus') not in ('ENABLED', 'ENABLING'):
+                await client.update_time_to_live(
+                    TableName=self.table_name,
+                    TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expire_at'}
+                )
             
-            # 날짜 필터가 있는 경우 GSI 사용
-            if start_date:
-                params['IndexName'] = 'date-index'
-                params['KeyConditionExpression'] = 'pk = :pk AND date_key >= :start_date'
-                params['ExpressionAttributeValues'][':start_date'] = {'S': start_date}
-                
-                if end_date:
-                    params['KeyConditionExpression'] = 'pk = :pk AND date_key BETWEEN :start_date AND :end_date'
-                    params['ExpressionAttributeValues'][':end_date'] = {'S': end_date}
+            while True:
+                resp = await client.scan(**params)
+                for item in resp.get('Items', []):
+                    if not item.get('sk', {}).get('S', '').startswith('MSG#'):
+                        continue
+                    key = (int(item['team_id']['N']), int(item['project_id']['N']), item['date_key']['S'])
+                    groups[key].append(item)
+                if not resp.get('LastEvaluatedKey'):
+                    break
+                params['ExclusiveStartKey'] = resp['LastEvaluatedKey']
             
-            # 회의 메시지만 필터
-            if meeting_only:
-                params['FilterExpression'] = 'is_in_meeting = :meeting'
-                params['ExpressionAttributeValues'][':meeting'] = {'BOOL': True}
+            archived = expired = 0
+            failed = []
+            expires = str(int(time.time()) + settings.CHAT_ARCHIVE_GRACE_DAYS * 86400)
+            for (team_id, project_id, day), items in sorted(groups.items()):
+                try:
+                    merged = {m['sk']: m for m in await self._read_archive(team_id, project_id, day) or []}
+                    merged.update({item['sk']['S']: _item_to_message(item) for item in items})
+                    await self._write_archive(team_id, project_id, day, [merged[sk] for sk in sorted(merged)])
+                    archived += len(merged)
+                    
+                    for item in items:
+                        if 'expire_at' in item:
+                            continue
+                        await client.update_item(
+                            TableName=self.table_name,
+                            Key={'pk': item['pk'], 'sk': item['sk']},
+                            UpdateExpression='SET expire_at = :exp',
+                            ExpressionAttributeValues={':exp': {'N': expires}}
+                        )
+                        expired += 1
+                except Exception:
+                    # 실패한 프로젝트/날짜는 TTL을 붙이지 않으므로 삭제되지 않고 다음 실행에서 다시 시도됨
+                    logger.exception(f"채팅 아카이브 실패: team={team_id}, project={project_id}, day={day}")
+                    failed.append(f"{team_id}/{project_id}/{day}")
+        
+        result = {
+            'start_day': start_day, 'end_day': end_day, 'files': len(groups),
+            'messages': archived, 'ttl_set': expired, 'failed': failed
+        }
+        logger.info(f"채팅 compaction 완료: {result}")
+        return result
+    
+    async def _query_messages(
+        self,
+        client,
+        pk: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        meeting_only: bool
+    ) -> list[dict]:
+        """pk 하나에 대한 메시지 조회 (원본 항목 반환)"""
+        if meeting_only:
+            return await self._query_meeting_messages(client, pk, start_date, end_date)
+        
+        # 기본 쿼리
+        params = {
+            'TableName': self.table_name,
+            'KeyConditionExpression': 'pk = :pk',
+            'ExpressionAttributeValues': {
+                ':pk': {'S': pk}
+            },
+            'ScanIndexForward': True  # 시간순 정렬
+        }
+        
+        # 날짜 필터가 있는 경우 GSI 사용
+        if start_date:
+            params['IndexName'] = 'date-index'
+            params['KeyConditionExpression'] = 'pk = :pk AND date_key >= :start_date'
+            params['ExpressionAttributeValues'][':start_date'] = {'S': start_date}
             
+            if end_date:
+                params['KeyConditionExpression'] = 'pk = :pk AND date_key BETWEEN :start_date AND :end_date'
+                params['ExpressionAttributeValues'][':end_date'] = {'S': end_date}
+        
+        return await self._query_all(client, params)
+    
+    async def _query_meeting_messages(
+        self,
+        client,
+        pk: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> list[dict]:
+        """meeting-index로 회의 메시지만 조회 (읽기 비용이 회의 메시지 수에 비례)"""
+        params = {
+            'TableName': self.table_name,
+            'IndexName': MEETING_INDEX,
+            'KeyConditionExpression': 'meeting_pk = :pk',
+            'ExpressionAttributeValues': {
+                ':pk': {'S': pk}
+            },
+            'ScanIndexForward': True
+        }
+        
+        # meeting_sk = {date_key}#{sk} 이므로 날짜 범위를 키 조건으로 처리
+        if start_date and end_date:
+            params['KeyConditionExpression'] = 'meeting_pk = :pk AND meeting_sk BETWEEN :start AND :end'
+            params['ExpressionAttributeValues'][':start'] = {'S': start_date}
+            params['ExpressionAttributeValues'][':end'] = {'S': f"{end_date}#~"}
+        elif start_date:
+            params['KeyConditionExpression'] = 'meeting_pk = :pk AND meeting_sk >= :start'
+            params['ExpressionAttributeValues'][':start'] = {'S': start_date}
+        
+        return await self._query_all(client, params)
+    
+    @staticmethod
+    async def _query_all(client, params: dict) -> list[dict]:
+        """LastEvaluatedKey를 따라 모든 페이지 조회"""
+        items = []
+        while True:
             response = await client.query(**params)
-            
-            messages = []
-            for item in response.get('Items', []):
-                messages.append({
-                    'user': item['user']['S'],
-                    'msg': item['message']['S'],
-                    'time': item['time']['S'],
-                    'timestamp': int(item['timestamp']['N']),
-                    'is_in_meeting': item.get('is_in_meeting', {}).get('BOOL', False),
-                    'date': item['date_key']['S']
-                })
-            
-            return messages
+            items.extend(response.get('Items', []))
+            if not response.get('LastEvaluatedKey'):
+                return items
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
     
     async def get_meeting_messages_by_date(
         self,
@@ -220,7 +588,7 @@ class DynamoDBAdapter:
         target_date: str
     ) -> list[dict]:
         """
-        특정 날짜의 회의 메시지만 조회
+        특정 날짜의 회의 메시지만 조회 (meeting-index 사용, 회의록 생성용)
         
         Args:
             team_id: 팀 ID
@@ -1,7 +1,7 @@
 from typing import Dict, Any, List
-import httpx
 import logging
 from app.core.config import settings
+from app.utils.http_pool import http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,7 @@ class ProjectAdapter:
         Project Service API 호출하여 프로젝트 상세 정보 조회
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_pool.target("project", timeout=10.0) as client:
                 # Project Service는 /projects/{id} 경로 사용 (api/v1 prefix 없음)
                 response = await client.get(f"{settings.PROJECT_SERVICE_URL}/projects/{project_id}")
                 logger.info(f"Project API response status: {response.status_code}")
@@ -72,7 +72,7 @@ class TeamAdapter:
         Team Service API 호출하여 팀 멤버 목록 조회
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_pool.target("team", timeout=10.0) as client:
                 response = await client.get(f"{settings.TEAM_SERVICE_URL}/api/v1/teams/{team_id}/members")
                 if response.status_code == 200:
                     return response.json()
@@ -87,7 +87,7 @@ class AuthAdapter:
         Auth Service API 호출하여 사용자 프로필 조회
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with http_pool.target("auth", timeout=10.0) as client:
                 response = await client.get(f"{settings.AUTH_SERVICE_URL}/auth/users/{user_id}")
                 if response.status_code == 200:
                     return response.json()
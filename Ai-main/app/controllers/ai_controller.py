@@ -14,8 +14,10 @@ from app.schemas.ai_schema import (
 from app.services.ai_service import ai_service
 from app.services.meeting_service import meeting_service
 from app.services.portfolio_service import portfolio_service
+from app.adapters.dynamodb_adapter import dynamodb_adapter
 from app.repositories.ai_repository import TestRepository
 from app.core.exceptions import BusinessException, ErrorCode
+from app.utils.rate_limit import rate_limit
 
 router = APIRouter()
 
@@ -23,15 +25,18 @@ router = APIRouter()
 class MinutesRequest(BaseModel):
     team_id: int
     project_id: int
-    messages: List[Dict[str, Any]]
+    messages: List[Dict[str, Any]] = []  # 비우면 meeting_date의 회의 메시지를 DynamoDB에서 조회
     attendees: Optional[List[str]] = None  # 명시적 참석자 목록
     meeting_date: Optional[str] = None  # 회의 날짜 (YYYY-MM-DD)
 
+# Bedrock 호출 엔드포인트 공통 요청 제한
+AI_GENERATE_LIMIT = Depends(rate_limit("ai_generate"))
+
 async def get_repository(db: AsyncSession = Depends(get_db)): # type: ignore
     return TestRepository(db)
 
 # --- Test API ---
-@router.post("/test/questions", response_model=QuestionResponse)
+@router.post("/test/questions", response_model=QuestionResponse, dependencies=[AI_GENERATE_LIMIT])
 async def generate_test_questions(
     request: QuestionRequest, 
     repo: TestRepository = Depends(get_repository)
@@ -41,14 +46,14 @@ async def generate_test_questions(
         raise BusinessException(ErrorCode.INVALID_INPUT, "기술 스택(stack)은 필수 입력값입니다.")
     return await ai_service.generate_questions(request, repo, user_id)
 
-@router.post("/test/analyze", response_model=AnalysisResponse)
+@router.post("/test/analyze", response_model=AnalysisResponse, dependencies=[AI_GENERATE_LIMIT])
 async def analyze_test_results(
     request: AnalysisRequest,
     repo: TestRepository = Depends(get_repository)
 ):
     return await ai_service.analyze_results(request, repo, request.user_id)
 
-@router.post("/test/grade", response_model=GradeResponse)
+@router.post("/test/grade", response_model=GradeResponse, dependencies=[AI_GENERATE_LIMIT])
 async def grade_test_answer(
     request: GradeRequest
 ):
@@ -69,14 +74,14 @@ async def get_user_test_result(
 ):
     return await ai_service.get_latest_result(user_id, repo)
 
-@router.post("/recruit/analyze", response_model=ApplicantAnalysisResponse)
+@router.post("/recruit/analyze", response_model=ApplicantAnalysisResponse, dependencies=[AI_GENERATE_LIMIT])
 async def analyze_applicants(request: ApplicantAnalysisRequest):
     data = [applicant.model_dump() for applicant in request.applicants]
     analysis = await ai_service.predict_applicant_suitability(data)
     return ApplicantAnalysisResponse(analysis=analysis)
 
 # --- Portfolio API ---
-@router.post("/portfolio/generate", response_model=PortfolioResponse)
+@router.post("/portfolio/generate", response_model=PortfolioResponse, dependencies=[AI_GENERATE_LIMIT])
 async def generate_portfolio(
     request: PortfolioRequest,
     db: AsyncSession = Depends(get_db)
@@ -98,12 +103,22 @@ async def delete_portfolio(
     result = await portfolio_service.delete_portfolio(db, portfolio_id)
     return result
 
-@router.post("/minutes")
+@router.post("/minutes", dependencies=[AI_GENERATE_LIMIT])
 async def generate_minutes(request: MinutesRequest):
     lines: List[str] = []
     attendees_set: set = set()
     
-    for msg in request.messages:
+    from datetime import datetime
+    messages = request.messages
+    if not messages:
+        # 메시지를 넘기지 않으면 회의 메시지 인덱스에서 해당 날짜 회의 메시지만 조회
+        messages = await dynamodb_adapter.get_meeting_messages_by_date(
+            team_id=request.team_id,
+            project_id=request.project_id,
+            target_date=request.meeting_date or datetime.now().strftime("%Y-%m-%d")
+        )
+    
+    for msg in messages:
         user = msg.get("user") or msg.get("senderName") or "Unknown"
         content = msg.get("msg") or msg.get("message") or msg.get("content") or ""
         if not content:
@@ -121,7 +136,6 @@ async def generate_minutes(request: MinutesRequest):
     final_attendees = request.attendees if request.attendees else list(attendees_set)
     
     # 명시적 날짜가 있으면 사용, 없으면 오늘 날짜
-    from datetime import datetime
     final_date = request.meeting_date if request.meeting_date else datetime.now().strftime("%Y-%m-%d")
 
     result = await meeting_service.generate_meeting_minutes_from_chat(
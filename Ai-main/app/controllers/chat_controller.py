@@ -21,6 +21,8 @@ class ChatMessageRequest(BaseModel):
     user: str
     message: str
     is_in_meeting: bool = False
+    client_msg_id: Optional[str] = None  # 재전송 중복 방지 (재시도 시 같은 값)
+    timestamp: Optional[str] = None      # 클라이언트 전송 시각 (ISO)
 
 
 class ChatMessageResponse(BaseModel):
@@ -49,7 +51,9 @@ async def save_chat_message(
             project_id=request.project_id,
             user=request.user,
             message=request.message,
-            is_in_meeting=request.is_in_meeting
+            is_in_meeting=request.is_in_meeting,
+            client_msg_id=request.client_msg_id,
+            client_timestamp=request.timestamp
         )
         return ChatMessageResponse(**result)
     except Exception as e:
@@ -22,6 +22,17 @@ class Settings(BaseSettings):
     # [DynamoDB 설정]
     DDB_ENDPOINT_URL: str = ""
     DDB_TABLE_NAME: str = "team_chats"
+    # 정렬 키에 클라이언트 시각(client_msg_id와 함께)을 허용하는 오차(초)
+    CHAT_CLIENT_TS_SKEW: float = 300.0
+    # 핫 채팅방 쓰기 샤딩: "프로젝트ID:샤드수,..." (pk 뒤에 #S{n}을 붙여 파티션 분산)
+    CHAT_HOT_ROOMS: str = ""
+    CHAT_SHARD_MAX: int = 16
+    # 채팅 계층 저장: CHAT_ARCHIVE_AFTER_DAYS일 지난 날짜는 S3 일별 파일(gzip JSONL)로 이전 후 조회 시 read-through
+    # (DynamoDB 항목은 compact_chats.py가 S3 저장에 성공한 뒤에만 TTL로 삭제되므로 매일 실행 권장)
+    CHAT_ARCHIVE_ENABLED: bool = False
+    CHAT_ARCHIVE_AFTER_DAYS: int = 30
+    CHAT_ARCHIVE_GRACE_DAYS: int = 7
+    CHAT_ARCHIVE_READ_CONCURRENCY: int = 8
 
     # [AWS 설정]
     AWS_ACCESS_KEY_ID: str = ""
@@ -48,6 +59,38 @@ class Settings(BaseSettings):
     AI_SERVICE_URL: str = "http://ai-service"
     SUPPORT_SERVICE_URL: str = "http://support-service"
     
+    # [MSA HTTP Connection Pool]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_HTTP_CONNECT_TIMEOUT: float = 5.0
+    MSA_HTTP_MAX_CONNECTIONS: int = 100
+    MSA_HTTP_MAX_KEEPALIVE: int = 20
+    MSA_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    MSA_HTTP_PER_TARGET_LIMIT: int = 50
+    MSA_HTTP2: bool = False
+    
+    # [AWS Client Registry - aioboto3 클라이언트 재사용]
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_HEALTH_TIMEOUT: float = 3.0
+    
+    # [Rate Limit - 사용자/IP 토큰 버킷]
+    # 정책 형식: "user=횟수/초,ip=횟수/초" (해당 scope를 빼면 그 기준으로는 제한 안 함)
+    # BACKEND=redis면 모든 Pod가 버킷을 공유 (Redis 장애 시 RATE_LIMIT_REDIS_RETRY초 동안 Pod 로컬 버킷 사용)
+    # TRUSTED_PROXIES: X-Forwarded-For 오른쪽에서 몇 번째 값을 클라이언트 IP로 볼지
+    #   (ALB 1단 = 1, 헤더 없는 요청은 내부 호출로 보고 IP 제한 안 함 / 0이면 헤더 무시하고 접속 IP 사용)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_REDIS_URL: str = ""
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.5
+    RATE_LIMIT_REDIS_POOL: int = 4
+    RATE_LIMIT_REDIS_RETRY: float = 10.0
+    RATE_LIMIT_KEY_PREFIX: str = "portforge:rl:"
+    RATE_LIMIT_MEMORY_KEYS: int = 100000
+    RATE_LIMIT_TRUSTED_PROXIES: int = 1
+    # 모든 쓰기 요청(POST/PUT/PATCH/DELETE) 공통 상한
+    RATE_LIMIT_WRITE: str = "user=120/60,ip=300/60"
+    # AI 생성 요청 (Bedrock 호출 - 비용/쿼터가 크므로 엄격하게)
+    RATE_LIMIT_AI_GENERATE: str = "user=10/60,ip=30/60"
+    
     # [CORS]
     CORS_ORIGINS: str = "*"
 
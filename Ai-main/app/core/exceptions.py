@@ -6,6 +6,7 @@ class ErrorCode(Enum):
     SUCCESS = ("COMMON_000", "정상 처리되었습니다.", status.HTTP_200_OK)
     INVALID_INPUT = ("COMMON_001", "입력값이 유효하지 않습니다.", status.HTTP_400_BAD_REQUEST)
     UNAUTHORIZED = ("COMMON_002", "인증에 실패했습니다.", status.HTTP_401_UNAUTHORIZED)
+    TOO_MANY_REQUESTS = ("COMMON_429", "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", status.HTTP_429_TOO_MANY_REQUESTS)
     INTERNAL_SERVER_ERROR = ("COMMON_999", "서버 내부 오류가 발생했습니다.", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     # [AI Service Errors]
@@ -22,6 +23,8 @@ class ErrorCode(Enum):
 
 class BusinessException(Exception):
     """팀원들이 raise BusinessException(...)으로 던질 예외 객체"""
-    def __init__(self, error_code: ErrorCode, detail: str = None or "Unknown error"):
+    def __init__(self, error_code: ErrorCode, detail: str = None or "Unknown error", headers: dict = None):
         self.error_code = error_code
-        self.message = detail or error_code.default_message
\ No newline at end of file
+        self.message = detail or error_code.default_message
+        # 응답에 추가할 헤더 (예: 429의 Retry-After)
+        self.headers = headers
\ No newline at end of file
@@ -1,8 +1,8 @@
-import httpx
 from jose import jwt, jwk
 from jose.utils import base64url_decode
 from fastapi import HTTPException, status
 from app.core.config import settings
+from app.utils.http_pool import http_pool
 
 class CognitoVerifier:
     def __init__(self):
@@ -11,7 +11,7 @@ class CognitoVerifier:
     async def _get_jwks(self):
         """AWS에서 공개키 목록을 비동기로 가져와 캐싱합니다."""
         if not self.jwks:
-            async with httpx.AsyncClient() as client:
+            async with http_pool.target("cognito") as client:
                 response = await client.get(settings.COGNITO_JWKS_URL)
                 self.jwks = response.json()["keys"]
         return self.jwks
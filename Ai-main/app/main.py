@@ -5,6 +5,9 @@ from app.core.exceptions import BusinessException
 from prometheus_fastapi_instrumentator import Instrumentator
 from app.core.middleware import LoggingMiddleware
 from app.controllers import all_routers
+from app.utils.http_pool import http_pool
+from app.core.database import aws_manager
+from app.utils.rate_limit import RateLimitMiddleware, rate_limiter
 
 # MSA API 라우터 추가
 from app.api.ai_data import router as ai_data_router
@@ -15,6 +18,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 0. 쓰기 요청 공통 제한 (가장 안쪽에 두어 429 응답에도 로그/CORS 헤더가 적용되도록 먼저 등록)
+app.add_middleware(RateLimitMiddleware, policy="write")
+
 # 1. CORS 미들웨어 등록 (프론트엔드 연동)
 app.add_middleware(
     CORSMiddleware,
@@ -51,6 +57,25 @@ async def startup_event():
         print(f"CRITICAL DATABASE ERROR: {e}")
         # 여기서 에러가 나면 DB 연결 정보(.env)가 틀렸거나 DB 서버가 죽은 것입니다.
 
+# 서비스 간 통신용 HTTP 커넥션 풀 (프로세스당 1개, keep-alive 재사용)
+@app.on_event("startup")
+async def start_http_pool():
+    await http_pool.start()
+
+@app.on_event("shutdown")
+async def close_http_pool():
+    await http_pool.close()
+
+# 요청 제한 Redis 연결 종료
+@app.on_event("shutdown")
+async def close_rate_limiter():
+    await rate_limiter.close()
+
+# 공유 AWS 클라이언트 (DynamoDB/S3 등) 종료
+@app.on_event("shutdown")
+async def close_aws_clients():
+    await aws_manager.close()
+
 # 전역 예외 핸들러: 한 번 등록하면 팀원들은 신경 안 써도 됨
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
@@ -61,7 +86,8 @@ async def business_exception_handler(request: Request, exc: BusinessException):
             "code": exc.error_code.biz_code,
             "message": exc.message,
             "data": None
-        }
+        },
+        headers=getattr(exc, "headers", None)
     )
 
 @app.exception_handler(Exception)
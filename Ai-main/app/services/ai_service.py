@@ -2,10 +2,10 @@ from datetime import datetime, timedelta
 import json
 import random
 import logging
-import aioboto3
 from typing import Optional
 from botocore.exceptions import ClientError
 from app.core.config import settings
+from app.core.database import aws_manager
 from app.core.exceptions import BusinessException, ErrorCode
 from app.schemas.ai_schema import (
     QuestionRequest, QuestionResponse, AnalysisRequest, AnalysisResponse, 
@@ -18,7 +18,6 @@ logger = logging.getLogger(__name__)
 
 class AiService:
     def __init__(self):
-        self.session = aioboto3.Session()
         self.model_id = settings.BEDROCK_MODEL_ID
         self.region = settings.BEDROCK_REGION
         
@@ -29,7 +28,8 @@ class AiService:
         """
         Common method to invoke AWS Bedrock
         """
-        async with self.session.client("bedrock-runtime", region_name=self.region) as client:
+        # 공유 클라이언트 (프로세스당 1개, 종료 시 닫지 않음)
+        async with aws_manager.clients.client("bedrock-runtime", "bedrock-runtime", region_name=self.region) as client:
             try:
                 body = {
                     "anthropic_version": "bedrock-2023-05-31",
@@ -9,7 +9,7 @@ from app.adapters.internal_adapters import project_adapter
 from app.services.ai_service import ai_service
 from app.core.config import settings
 import logging
-import httpx
+from app.utils.http_pool import http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ class PortfolioService:
         # 실제 사용자 이름 가져오기
         user_name = "사용자"  # 기본값
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_pool.target("auth") as client:
                 auth_url = settings.AUTH_SERVICE_URL
                 # /users/batch API 사용 (단일 사용자도 배열로 요청)
                 response = await client.post(
@@ -70,7 +70,7 @@ class PortfolioService:
             # 프로젝트의 팀 ID 조회 - project_info에서 가져오거나 별도 조회
             team_id = project_info.get('team_id') or project_id  # team_id가 없으면 project_id 사용
             
-            async with httpx.AsyncClient() as client:
+            async with http_pool.target("team") as client:
                 # Team-BE API 경로: /api/v1/teams/{project_id}/reports
                 response = await client.get(f"{self.team_be_url}/api/v1/teams/{team_id}/reports?report_type=MEETING_MINUTES")
                 logger.info(f"Team reports API response: {response.status_code}")
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 import logging
 
 from app.core.config import settings
+from app.utils.http_pool import http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ class MSAClient:
             "ai": settings.AI_SERVICE_URL,
             "support": settings.SUPPORT_SERVICE_URL
         }
-        self.timeout = 30.0
+        self.timeout = settings.MSA_HTTP_TIMEOUT
     
     async def _make_request(
         self, 
@@ -42,7 +43,7 @@ class MSAClient:
         url = f"{self.service_urls[service]}{endpoint}"
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_pool.target(service, timeout=self.timeout) as client:
                 if method == "GET":
                     response = await client.get(url, params=params)
                 elif method == "POST":
@@ -0,0 +1,34 @@
+"""
+채팅 일별 compaction 실행 스크립트 (DynamoDB → S3 gzip JSONL)
+CHAT_ARCHIVE_ENABLED를 켰다면 하루 한 번 실행합니다.
+실패한 프로젝트/날짜가 있으면 종료 코드 1로 끝납니다 (다음 실행에서 다시 시도).
+
+사용법:
+    python compact_chats.py                                   # 아카이브 경계 전날까지 아직 아카이브되지 않은 날짜
+    python compact_chats.py --from 2026-01-01 --to 2026-01-31  # 기존 데이터 일괄 이전
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from app.adapters.dynamodb_adapter import dynamodb_adapter
+from app.core.database import aws_manager
+
+
+async def run(args: argparse.Namespace) -> bool:
+    try:
+        result = await dynamodb_adapter.compact_archives(args.start_day, args.end_day)
+        print(result)
+        return not result['failed']
+    finally:
+        await aws_manager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="채팅 일별 compaction (DynamoDB → S3)")
+    parser.add_argument("--from", dest="start_day", default=None, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end_day", default=None, help="종료 날짜 (YYYY-MM-DD, 경계 전날까지만)")
+    if not asyncio.run(run(parser.parse_args())):
+        sys.exit(1)
@@ -0,0 +1,24 @@
+"""
+meeting-index(회의 메시지 sparse GSI) 마이그레이션 스크립트
+기존 테이블에 GSI를 추가하고, 이미 저장된 회의 메시지에 meeting_pk/meeting_sk를 채웁니다.
+
+사용법:
+    python migrate_meeting_index.py
+"""
+import asyncio
+import logging
+
+from app.adapters.dynamodb_adapter import dynamodb_adapter
+from app.core.database import aws_manager
+
+
+async def run() -> None:
+    try:
+        print(await dynamodb_adapter.migrate_meeting_index())
+    finally:
+        await aws_manager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
@@ -1,15 +1,17 @@
 import os
 import uuid
-import aioboto3
 import httpx
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Header
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.api.deps import get_db, get_current_user # 의존성 임포트 확인
 from app.models.user import User, UserStack
 from app.models.enums import UserRole, StackCategory, TechStack
 from app.core.config import settings  # [추가] 중앙 설정 import
+from app.core.database import aws_manager
+from app.utils.http_pool import http_pool
+from app.utils.msa_client import msa_client
 from app.core.exceptions import BusinessException, ErrorCode  # [추가] 비즈니스 예외
 from app.schemas.user_update import UserUpdate # [추가] UserUpdate 스키마
 from app.schemas.user import (
@@ -45,8 +47,7 @@ async def signup(user_in: UserCreate, db: Session = Depends(get_db)):
     if db.scalar(select(User).where(User.nickname == user_in.nickname)):
         raise BusinessException(ErrorCode.AUTH_NICKNAME_DUPLICATE)
 
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         # B. AWS Cognito 회원가입
         try:
             response = await client.sign_up(
@@ -141,8 +142,7 @@ def check_nickname(nickname: str, db: Session = Depends(get_db)):
 # =================================================================
 @router.post("/login", response_model=LoginResponse)
 async def login(user_in: UserLogin, db: Session = Depends(get_db)):
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             response = await client.initiate_auth(
                 ClientId=settings.COGNITO_APP_CLIENT_ID,
@@ -229,9 +229,13 @@ def get_stack_category(stack_name: str) -> StackCategory:
 @router.put("/me")
 def update_user_me(
     user_data: UserUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    # get_current_user는 비동기 세션에서 조회한 객체이므로 현재 세션에 연결
+    current_user = db.merge(current_user)
+
     # 1. 닉네임 수정
     if user_data.name:
         current_user.nickname = user_data.name
@@ -267,6 +271,9 @@ def update_user_me(
     try:
         db.commit()
         db.refresh(current_user)
+        # 닉네임이 바뀌었으면 Support Service의 사용자 캐시 무효화 (응답 후 실행)
+        if user_data.name:
+            background_tasks.add_task(msa_client.invalidate_user_identity, current_user.email, current_user.user_id)
         return {"message": "프로필이 업데이트되었습니다."}
     except Exception as e:
         db.rollback()
@@ -283,6 +290,8 @@ def toggle_like_project(
     db: Session = Depends(get_db)
 ):
     """프로젝트 좋아요/취소 토글"""
+    # get_current_user는 비동기 세션에서 조회한 객체이므로 현재 세션에 연결
+    current_user = db.merge(current_user)
     liked_ids = current_user.liked_project_ids or []
     
     if project_id in liked_ids:
@@ -317,8 +326,7 @@ async def change_password(user_id: str, data: PasswordChange, authorization: str
         raise BusinessException(ErrorCode.UNAUTHORIZED, "로그인이 필요합니다.")
     token = authorization.replace("Bearer ", "")
     
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             await client.change_password(
                 PreviousPassword=data.old_password,
@@ -345,8 +353,7 @@ async def change_password(user_id: str, data: PasswordChange, authorization: str
 # 비밀번호 찾기 (요청)
 @router.post("/forgot-password")
 async def forgot_password_request(data: ForgotPasswordRequest):
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             await client.forgot_password(ClientId=settings.COGNITO_APP_CLIENT_ID, Username=data.email)
             return {"message": "인증 코드가 이메일로 발송되었습니다."}
@@ -359,8 +366,7 @@ async def forgot_password_request(data: ForgotPasswordRequest):
 # 비밀번호 찾기 (재설정)
 @router.post("/confirm-forgot-password")
 async def confirm_forgot_password(data: ConfirmForgotPassword):
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             await client.confirm_forgot_password(
                 ClientId=settings.COGNITO_APP_CLIENT_ID,
@@ -409,7 +415,7 @@ async def social_callback(data: dict, db: Session = Depends(get_db)):
     logger.info(f"토큰 교환 요청: URL={token_url}, client_id={client_id}, redirect_uri={redirect_uri}")
     
     # 비밀번호(Secret) 없이 요청 전송 (Public Client)
-    async with httpx.AsyncClient() as http_client:
+    async with http_pool.target("cognito") as http_client:
         try:
             resp = await http_client.post(token_url, data=payload, headers=headers)
             
@@ -613,7 +619,7 @@ async def social_login_callback(
     # Client Secret이 필요한 경우 추가해야 함 (현재 설정은 Secret 없는 Public Client 가정)
     # Confidential Client라면 Basic Auth 헤더 필요
     
-    async with httpx.AsyncClient() as client:
+    async with http_pool.target("cognito") as client:
         # 1. 토큰 교환 (Code -> Tokens)
         data = {
             "grant_type": "authorization_code",
@@ -723,6 +729,7 @@ def logout(
 async def delete_account(
     user_id: str,
     delete_data: DeleteAccountRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -739,8 +746,7 @@ async def delete_account(
         logger.warning(f"Unauthorized deletion attempt: {current_user.email} tried to delete {user_id}")
         raise HTTPException(status_code=403, detail="본인의 계정만 탈퇴할 수 있습니다.")
 
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             # 2. Verify password when provided
             if delete_data.password:
@@ -766,9 +772,10 @@ async def delete_account(
 
     # 4. Delete local user
     try:
-        db.delete(current_user)
+        db.delete(db.merge(current_user))
         db.commit()
         logger.info(f"User Fully Deleted: {current_user.email}")
+        background_tasks.add_task(msa_client.invalidate_user_identity, current_user.email, current_user.user_id)
     except Exception as e:
         db.rollback()
         logger.error(f"DB Deletion Error: {str(e)}")
@@ -789,8 +796,7 @@ async def verify_email(verify_in: EmailVerification):
     """
     회원가입 후 이메일로 받은 인증 코드를 확인합니다.
     """
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             await client.confirm_sign_up(
                 ClientId=settings.COGNITO_APP_CLIENT_ID,
@@ -815,8 +821,7 @@ async def resend_verification_code(email: str):
     """
     이메일 인증 코드를 다시 발송합니다.
     """
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             await client.resend_confirmation_code(
                 ClientId=settings.COGNITO_APP_CLIENT_ID,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import delete
@@ -17,6 +17,7 @@ from app.core.database import get_db, aws_manager # Async DB
 from app.api.deps import get_current_user # User 반환 (토큰 검증)
 from app.core.config import settings
 from app.core.exceptions import BusinessException, ErrorCode
+from app.utils.msa_client import msa_client
 import aioboto3
 
 router = APIRouter(tags=["users"])
@@ -33,7 +34,7 @@ async def get_user_me(
     db: AsyncSession = Depends(get_db)
 ):
     """현재 로그인한 사용자 상세 정보"""
-    # get_current_user는 Sync DB 조회 결과이므로, Async Session에 attach되지 않았을 수 있음.
+    # get_current_user는 별도 Async Session에서 조회한 결과이므로, 현재 세션에 attach되어 있지 않음.
     # 안전하게 ID로 다시 조회 (Eager Loading 필요 시)
     user_query = select(User).where(User.user_id == current_user.user_id)
     result = await db.execute(user_query)
@@ -88,6 +89,7 @@ def get_stack_category(stack_name: str) -> StackCategory:
 @router.put("/me")
 async def update_user_me(
     user_data: UserUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -120,6 +122,9 @@ async def update_user_me(
                 db.add(new_stack)
 
         await db.commit()
+        # 닉네임이 바뀌었으면 Support Service의 사용자 캐시 무효화 (응답 후 실행)
+        if user_data.name:
+            background_tasks.add_task(msa_client.invalidate_user_identity, user.email, user.user_id)
         return {"message": "프로필이 업데이트되었습니다."}
         
     except Exception as e:
@@ -143,8 +148,7 @@ async def change_password(
     token = authorization.replace("Bearer ", "")
     
     # Cognito 호출 (aioboto3)
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             await client.change_password(
                 PreviousPassword=data.old_password,
@@ -263,6 +267,7 @@ async def toggle_like_project(
 async def delete_account(
     user_id: str,
     delete_data: DeleteAccountRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -271,8 +276,7 @@ async def delete_account(
     if not is_owner:
         raise HTTPException(status_code=403, detail="본인의 계정만 탈퇴할 수 있습니다.")
 
-    session = aioboto3.Session()
-    async with session.client("cognito-idp", region_name=settings.AWS_REGION) as client:
+    async with aws_manager.get_cognito_client() as client:
         try:
             # Verify password
             if delete_data.password:
@@ -315,6 +319,7 @@ async def delete_account(
         if user:
             await db.delete(user)
             await db.commit()
+            background_tasks.add_task(msa_client.invalidate_user_identity, current_user.email, current_user.user_id)
     except Exception as e:
         await db.rollback()
         logger.error(f"DB Deletion Error: {e}")
@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 from app.schemas.base import ResponseEnvelope
+from app.utils.http_pool import http_pool
+from app.core.database import aws_manager
 router = APIRouter()
 
 @router.get("/liveness", response_model=ResponseEnvelope)
@@ -17,3 +19,23 @@ async def readiness_check():
         "redis": "connected"     # 나중에 실제 체크로 대체
     }
     return ResponseEnvelope(success=True, code="COMMON_000", message="Ready", data=checks)
+
+
+@router.get("/http-pool", response_model=ResponseEnvelope)
+async def http_pool_check():
+    """서비스 간 HTTP 커넥션 풀 현황 (대상별 요청/에러/지연시간, 커넥션 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="HTTP pool", data=http_pool.stats())
+
+
+@router.get("/token-cache", response_model=ResponseEnvelope)
+async def token_cache_check():
+    """JWKS/검증된 토큰 클레임 캐시 현황"""
+    from app.core.security import cognito_verifier
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Token cache", data=cognito_verifier.stats())
+
+
+@router.get("/aws", response_model=ResponseEnvelope)
+async def aws_clients_check():
+    """공유 AWS 클라이언트 현황 및 상태 확인 (열려 있는 클라이언트만 가벼운 호출로 확인)"""
+    data = {**aws_manager.clients.stats(), "probes": await aws_manager.health()}
+    return ResponseEnvelope(success=True, code="COMMON_000", message="AWS clients", data=data)
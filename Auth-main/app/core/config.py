@@ -36,6 +36,9 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "RS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWKS_TIMEOUT: int = 10
+    JWKS_CACHE_TTL: int = 3600            # JWKS 캐시 유지 시간(초)
+    JWKS_MIN_REFRESH_INTERVAL: int = 30   # 모르는 kid로 인한 재조회 최소 간격(초)
+    TOKEN_CLAIMS_CACHE_SIZE: int = 10000  # 검증된 토큰 클레임 LRU 크기
     
     # [MSA Service URLs]
     AUTH_SERVICE_URL: str = "http://auth-service"
@@ -44,6 +47,19 @@ class Settings(BaseSettings):
     AI_SERVICE_URL: str = "http://ai-service"
     SUPPORT_SERVICE_URL: str = "http://support-service"
     
+    # [MSA HTTP Connection Pool]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_HTTP_CONNECT_TIMEOUT: float = 5.0
+    MSA_HTTP_MAX_CONNECTIONS: int = 100
+    MSA_HTTP_MAX_KEEPALIVE: int = 20
+    MSA_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    MSA_HTTP_PER_TARGET_LIMIT: int = 50
+    MSA_HTTP2: bool = False
+    
+    # [AWS Client Registry - aioboto3 클라이언트 재사용]
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_HEALTH_TIMEOUT: float = 3.0
+    
     # [CORS]
     CORS_ORIGINS: str = "*"
 
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings # 설정 객체 로드
 import aioboto3
+from app.utils.aws_clients import AWSClientRegistry
 
 # 1. MySQL 설정 (환경 변수 적용)
 engine = create_async_engine(settings.DATABASE_URL, echo=True)
@@ -11,26 +12,48 @@ class Base(DeclarativeBase):
     pass
 
 # 2. AWS 서비스 매니저 (환경 변수 적용)
+# 클라이언트는 프로세스당 한 번만 열어 공유 (`async with aws_manager.get_ddb_client() as client:` 그대로 사용)
 class AWSManager:
     def __init__(self):
         self.session = aioboto3.Session()
+        self.clients = AWSClientRegistry(self.session)
 
     def get_ddb_client(self):
-        return self.session.client(
+        return self.clients.client(
+            'dynamodb',
             'dynamodb', 
-            endpoint_url=settings.DDB_ENDPOINT_URL, 
+            endpoint_url=settings.DDB_ENDPOINT_URL or None, 
             region_name=settings.AWS_REGION
         )
 
     def get_s3_client(self):
-        return self.session.client(
+        return self.clients.client(
+            's3',
             's3', 
-            endpoint_url=settings.S3_ENDPOINT_URL, 
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            endpoint_url=settings.S3_ENDPOINT_URL or None, 
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
             region_name="us-east-1"
         )
 
+    def get_cognito_client(self):
+        return self.clients.client(
+            'cognito-idp',
+            'cognito-idp',
+            region_name=settings.AWS_REGION
+        )
+
+    async def close(self):
+        """shutdown 이벤트에서 호출"""
+        await self.clients.close()
+
+    async def health(self):
+        """열려 있는 AWS 클라이언트 상태 확인"""
+        return await self.clients.health({
+            "dynamodb": lambda client: client.list_tables(Limit=1),
+            "s3": lambda client: client.list_buckets(),
+        })
+
 aws_manager = AWSManager()
 
 async def get_db():
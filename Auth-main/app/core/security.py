@@ -1,31 +1,121 @@
-import httpx
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
 from jose import jwt, jwk
 from jose.utils import base64url_decode
 from fastapi import HTTPException, status
 from app.core.config import settings
+from app.utils.http_pool import http_pool
+
+logger = logging.getLogger(__name__)
+
 
 class CognitoVerifier:
+    """
+    Cognito 토큰 검증기
+    - JWKS: TTL 동안 메모리 캐시, 모르는 kid가 오면 즉시 재조회 (키 회전 대응)
+    - 검증된 클레임: 토큰 해시 기준 LRU 캐시, 토큰의 exp까지만 유효
+    """
+
     def __init__(self):
-        self.jwks = None
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._jwks_fetched_at: float = 0.0
+        self._jwks_lock = asyncio.Lock()
+        self._claims: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.claims_hits = 0
+        self.claims_misses = 0
+
+    @property
+    def issuer(self) -> str:
+        return f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/{settings.EFFECTIVE_USER_POOL_ID}"
+
+    # -----------------------------------------------------------------
+    # JWKS 캐시
+    # -----------------------------------------------------------------
+    async def _fetch_jwks(self) -> None:
+        """AWS에서 공개키 목록을 비동기로 가져와 kid 기준으로 캐싱합니다."""
+        async with http_pool.target("cognito", timeout=settings.JWKS_TIMEOUT) as client:
+            response = await client.get(settings.COGNITO_JWKS_URL)
+            response.raise_for_status()
+            keys = response.json().get("keys", [])
+        self._keys = {k["kid"]: k for k in keys if k.get("kid")}
+        self._jwks_fetched_at = time.monotonic()
+        logger.info(f"JWKS 갱신 완료: kids={list(self._keys.keys())}")
+
+    async def _get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        """kid에 해당하는 공개키 반환 (TTL 만료 또는 kid 미스 시 재조회)"""
+        age = time.monotonic() - self._jwks_fetched_at
+        if age < settings.JWKS_CACHE_TTL and kid in self._keys:
+            return self._keys[kid]
+
+        async with self._jwks_lock:
+            # 대기 중 다른 요청이 이미 갱신했을 수 있으므로 재확인
+            age = time.monotonic() - self._jwks_fetched_at
+            fresh = age < settings.JWKS_CACHE_TTL
+            if fresh and kid in self._keys:
+                return self._keys[kid]
+            # 위조된 kid로 Cognito 호출이 폭주하지 않도록 kid 미스 재조회 간격 제한
+            if fresh and age < settings.JWKS_MIN_REFRESH_INTERVAL:
+                return None
 
-    async def _get_jwks(self):
-        """AWS에서 공개키 목록을 비동기로 가져와 캐싱합니다."""
-        if not self.jwks:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(settings.COGNITO_JWKS_URL)
-                self.jwks = response.json()["keys"]
-        return self.jwks
+            try:
+                await self._fetch_jwks()
+            except Exception as e:
+                if not self._keys:
+                    logger.error(f"JWKS 다운로드 실패: {e}")
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f"Cognito JWKS 다운로드 실패: {str(e)}"
+                    )
+                # 갱신 실패 시 기존 키로 계속 검증
+                logger.warning(f"JWKS 갱신 실패 - 캐시된 키 사용: {e}")
+            return self._keys.get(kid)
 
-    async def verify_token(self, token: str):
+    # -----------------------------------------------------------------
+    # 검증된 클레임 캐시
+    # -----------------------------------------------------------------
+    def _cached_claims(self, token_hash: str) -> Optional[Dict[str, Any]]:
+        entry = self._claims.get(token_hash)
+        if entry is None:
+            return None
+        exp, payload = entry
+        if exp <= time.time():
+            del self._claims[token_hash]
+            return None
+        self._claims.move_to_end(token_hash)
+        return payload
+
+    def _store_claims(self, token_hash: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        if not exp:
+            return
+        self._claims[token_hash] = (float(exp), payload)
+        self._claims.move_to_end(token_hash)
+        while len(self._claims) > settings.TOKEN_CLAIMS_CACHE_SIZE:
+            self._claims.popitem(last=False)
+
+    async def verify_token(self, token: str) -> Dict[str, Any]:
         """Cognito 토큰의 서명과 유효성을 검증합니다."""
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        cached = self._cached_claims(token_hash)
+        if cached is not None:
+            self.claims_hits += 1
+            return dict(cached)
+        self.claims_misses += 1
+
         try:
             # 1. 서명 키(kid) 확인
             headers = jwt.get_unverified_header(token)
             kid = headers.get("kid")
+            if not kid:
+                raise HTTPException(status_code=401, detail="Token header has no kid")
 
             # 2. 일치하는 공개키 찾기
-            keys = await self._get_jwks()
-            key_data = next((k for k in keys if k["kid"] == kid), None)
+            key_data = await self._get_key(kid)
             if not key_data:
                 raise HTTPException(status_code=401, detail="Public key not found")
 
@@ -36,14 +126,34 @@ class CognitoVerifier:
                 algorithms=["RS256"],
                 audience=settings.COGNITO_APP_CLIENT_ID,
                 # 발급자(iss) 확인 로직 포함
-                issuer=f"https://cognito-idp.{settings.AWS_REGION}.amazonaws.com/{settings.COGNITO_USERPOOL_ID}"
+                issuer=self.issuer,
+                options={"verify_at_hash": False}
             )
-            return payload
 
+        except HTTPException as e:
+            if e.status_code != status.HTTP_401_UNAUTHORIZED:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Invalid Cognito Token: {e.detail}"
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Invalid Cognito Token: {str(e)}"
             )
 
-cognito_verifier = CognitoVerifier()
\ No newline at end of file
+        self._store_claims(token_hash, payload)
+        return dict(payload)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 현황 (모니터링용)"""
+        return {
+            "jwks_kids": list(self._keys.keys()),
+            "jwks_age_seconds": round(time.monotonic() - self._jwks_fetched_at, 1) if self._jwks_fetched_at else None,
+            "claims_cached": len(self._claims),
+            "claims_hits": self.claims_hits,
+            "claims_misses": self.claims_misses,
+        }
+
+cognito_verifier = CognitoVerifier()
@@ -35,6 +35,8 @@ except ImportError:
 # Auth 라우터 임포트
 from app.api.auth import router as auth_router
 from app.api.users import router as users_router
+from app.utils.http_pool import http_pool
+from app.core.database import aws_manager
 
 app = FastAPI(title="Portforge-Auth-Service")
 
@@ -74,6 +76,20 @@ for router, prefix, tag in all_routers:
 app.include_router(auth_router, prefix="/auth")
 app.include_router(users_router, prefix="/users")
 
+# 서비스 간 통신용 HTTP 커넥션 풀 (프로세스당 1개, keep-alive 재사용)
+@app.on_event("startup")
+async def start_http_pool():
+    await http_pool.start()
+
+@app.on_event("shutdown")
+async def close_http_pool():
+    await http_pool.close()
+
+# 공유 AWS 클라이언트 (DynamoDB/S3 등) 종료
+@app.on_event("shutdown")
+async def close_aws_clients():
+    await aws_manager.close()
+
 # =================================================================
 # 4. 예외 핸들러
 # =================================================================
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 import logging
 
 from app.core.config import settings
+from app.utils.http_pool import http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ class MSAClient:
             "ai": settings.AI_SERVICE_URL,
             "support": settings.SUPPORT_SERVICE_URL
         }
-        self.timeout = 30.0
+        self.timeout = settings.MSA_HTTP_TIMEOUT
     
     async def _make_request(
         self, 
@@ -38,7 +39,7 @@ class MSAClient:
         url = f"{self.service_urls[service]}{endpoint}"
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_pool.target(service, timeout=self.timeout) as client:
                 if method == "GET":
                     response = await client.get(url, params=params)
                 elif method == "POST":
@@ -154,6 +155,11 @@ class MSAClient:
         params = {"start_time": start_time, "end_time": end_time}
         return await self._make_request("support", f"/chat/team/{team_id}/logs", params=params)
 
+    async def invalidate_user_identity(self, email: Optional[str] = None, user_id: Optional[str] = None) -> Optional[Dict]:
+        """Support Service의 email → 사용자 캐시 무효화 (닉네임 변경/회원 탈퇴 시, 받은 Pod가 브로커로 모든 Pod에 전달)"""
+        data = {"email": email, "user_id": str(user_id) if user_id else None}
+        return await self._make_request("support", "/internal/identity-cache/invalidate", "POST", data)
+
 # 싱글톤 인스턴스
 msa_client = MSAClient()
 
@@ -76,6 +76,10 @@ class S3PathManager:
             date = datetime.now().strftime('%Y-%m-%d')
         return f"{self.prefix}/teams/{team_id}/chats/{date}.json"
     
+    def team_chat_archive(self, team_id: int, date: str, name: str = "messages") -> str:
+        """채팅 일별 아카이브 경로 (DynamoDB에서 옮긴 gzip JSONL)"""
+        return f"{self.prefix}/teams/{team_id}/chats/{date}/{name}.jsonl.gz"
+    
     def team_shared_file(self, team_id: int, file_id: int, filename: str) -> str:
         """팀 공유 파일 경로"""
         return f"{self.prefix}/teams/{team_id}/files/{file_id}/{filename}"
@@ -172,6 +176,11 @@ def get_chat_backup_s3_key(team_id: int, date: str = None) -> str:
     return s3_path_manager.team_chat_backup(team_id, date)
 
 
+def get_chat_archive_s3_key(team_id: int, date: str, name: str = "messages") -> str:
+    """채팅 일별 아카이브 S3 키 생성"""
+    return s3_path_manager.team_chat_archive(team_id, date, name)
+
+
 def get_file_upload_s3_key(team_id: int, file_id: int, filename: str) -> str:
     """파일 업로드 S3 키 생성"""
     return s3_path_manager.team_shared_file(team_id, file_id, filename)
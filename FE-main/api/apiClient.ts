@@ -356,6 +356,9 @@ export const projectAPI = {
         const params = new URLSearchParams({ page: String(page), size: String(size) });
         if (filters?.type) params.append('type', filters.type);
         if (filters?.status) params.append('status', filters.status);
+        // 기술 스택 필터 (서버 인덱스 조회): stacks 배열, stackMode 'any'(OR) | 'all'(AND)
+        if (filters?.stacks?.length) params.append('stacks', filters.stacks.join(','));
+        if (filters?.stackMode) params.append('stack_mode', filters.stackMode);
 
         const response = await apiFetch(`/projects?${params.toString()}`, {
             headers: getAuthHeaders(),
@@ -371,10 +374,58 @@ export const projectAPI = {
         return response.json();
     },
 
+    // 프로젝트 목록 커서 조회 (다음 페이지 커서는 X-Next-Cursor 헤더, 마지막 페이지면 null)
+    getProjectsPage: async (size = 20, cursor?: string | null, filters?: any): Promise<{ projects: any[]; nextCursor: string | null }> => {
+        const params = new URLSearchParams({ size: String(size) });
+        if (cursor) params.append('cursor', cursor);
+        if (filters?.type) params.append('type', filters.type);
+        if (filters?.status) params.append('status', filters.status);
+        if (filters?.stacks?.length) params.append('stacks', filters.stacks.join(','));
+        if (filters?.stackMode) params.append('stack_mode', filters.stackMode);
+
+        const response = await apiFetch(`/projects?${params.toString()}`, {
+            headers: getAuthHeaders(),
+        });
+        if (!response.ok) {
+            if (response.status === 401 || response.status === 403) {
+                return { projects: [], nextCursor: null };
+            }
+            throw new Error('프로젝트 목록을 가져오는데 실패했습니다.');
+        }
+        const data = await response.json();
+        return {
+            projects: Array.isArray(data) ? data : data.projects || [],
+            nextCursor: response.headers.get('X-Next-Cursor'),
+        };
+    },
+
+
+    // 프로젝트 검색 (제목/설명, 관련도 순) - 다음 페이지 커서는 X-Next-Cursor 헤더
+    searchProjects: async (q: string, size = 20, cursor?: string | null, filters?: any): Promise<{ projects: any[]; nextCursor: string | null }> => {
+        const params = new URLSearchParams({ q, size: String(size) });
+        if (cursor) params.append('cursor', cursor);
+        if (filters?.type) params.append('type', filters.type);
+        if (filters?.status) params.append('status', filters.status);
+        if (filters?.stacks?.length) params.append('stacks', filters.stacks.join(','));
+        if (filters?.stackMode) params.append('stack_mode', filters.stackMode);
+
+        const response = await apiFetch(`/projects/search?${params.toString()}`, {
+            headers: getAuthHeaders(),
+        });
+        if (!response.ok) {
+            throw new Error('프로젝트 검색에 실패했습니다.');
+        }
+        return {
+            projects: await response.json(),
+            nextCursor: response.headers.get('X-Next-Cursor'),
+        };
+    },
+
 
     // 프로젝트 상세 조회
+    // 로그인 상태면 토큰을 함께 보내 조회수 중복 제외를 사용자 기준으로 (같은 사용자의 짧은 시간 내 재조회는 한 번만 집계)
     getProject: async (projectId: number): Promise<any> => {
-        const response = await apiFetch(`/projects/${projectId}`);
+        const response = await apiFetch(`/projects/${projectId}`, { headers: getAuthHeaders() });
         if (!response.ok) {
             throw new Error('프로젝트 정보를 가져오는데 실패했습니다.');
         }
@@ -837,14 +888,26 @@ export const supportAPI = {
         return extractData(json) || [];
     },
 
-    // 알림 목록 조회
-    getNotifications: async (userId: string): Promise<any[]> => {
-        const response = await apiFetch(`/notifications?user_id=${userId}`, {
+    // 알림 목록 조회 (최신순 페이지, cursor는 이전 응답의 next_cursor)
+    getNotifications: async (userId: string, cursor?: string): Promise<{ notifications: any[]; next_cursor: string | null; has_more: boolean }> => {
+        const params = new URLSearchParams({ user_id: userId });
+        if (cursor) params.set('cursor', cursor);
+        const response = await apiFetch(`/notifications?${params.toString()}`, {
             headers: getAuthHeaders(),
         });
-        if (!response.ok) return [];
+        if (!response.ok) return { notifications: [], next_cursor: null, has_more: false };
         const json = await response.json();
-        return extractData(json) || [];
+        return extractData(json) || { notifications: [], next_cursor: null, has_more: false };
+    },
+
+    // 안 읽은 알림 수 (헤더 배지 폴링용)
+    getUnreadNotificationCount: async (userId: string): Promise<number> => {
+        const response = await apiFetch(`/notifications/unread-count?user_id=${userId}`, {
+            headers: getAuthHeaders(),
+        });
+        if (!response.ok) return 0;
+        const json = await response.json();
+        return extractData(json)?.unread ?? 0;
     },
 
     // 알림 읽음 처리
@@ -22,13 +22,22 @@ export interface MinutesResponse {
     created_at: string;
 }
 
+// 재전송 중복 방지용 메시지 ID (crypto.randomUUID는 https/localhost에서만 사용 가능)
+export const newClientMsgId = (): string =>
+    typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function'
+        ? crypto.randomUUID()
+        : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+
 export const saveChatMessage = async (
     teamId: number,
     projectId: number,
     user: string,
     message: string,
     isInMeeting: boolean = false,
-    retryCount: number = 0
+    retryCount: number = 0,
+    // 재시도해도 같은 값을 보내 서버에서 중복 저장을 막음
+    clientMsgId: string = newClientMsgId(),
+    sentAt: string = new Date().toISOString()
 ): Promise<ChatMessage> => {
     try {
         const response = await fetch(`${API_BASE_URL}/chat/message`, {
@@ -39,7 +48,9 @@ export const saveChatMessage = async (
                 project_id: projectId,
                 user,
                 message,
-                is_in_meeting: isInMeeting
+                is_in_meeting: isInMeeting,
+                client_msg_id: clientMsgId,
+                timestamp: sentAt
             })
         });
 
@@ -47,7 +58,7 @@ export const saveChatMessage = async (
             const err = await response.json().catch(() => ({}));
             if (response.status === 500 && retryCount < 2) {
                 await new Promise(resolve => setTimeout(resolve, 1000));
-                return saveChatMessage(teamId, projectId, user, message, isInMeeting, retryCount + 1);
+                return saveChatMessage(teamId, projectId, user, message, isInMeeting, retryCount + 1, clientMsgId, sentAt);
             }
             throw new Error(err.detail || '메시지 저장 실패');
         }
@@ -56,7 +67,7 @@ export const saveChatMessage = async (
     } catch (error) {
         if (retryCount < 2 && error instanceof TypeError) {
             await new Promise(resolve => setTimeout(resolve, 1000));
-            return saveChatMessage(teamId, projectId, user, message, isInMeeting, retryCount + 1);
+            return saveChatMessage(teamId, projectId, user, message, isInMeeting, retryCount + 1, clientMsgId, sentAt);
         }
         throw error;
     }
@@ -80,6 +91,59 @@ export const getChatMessages = async (
     return response.json();
 };
 
+export interface MeetingFeedState {
+    active: boolean;
+    started_at: string | null;
+    meeting_id: number | string | null;
+    message_count: number;
+}
+
+// since(이전 응답의 cursor 또는 epoch ms) 이후 새 메시지 + 서버에서 집계한 회의 상태
+export const getChatMessagesSince = async (
+    teamId: number,
+    projectId: number,
+    since: string | number,
+    limit?: number
+): Promise<{ messages: ChatMessage[]; count: number; cursor: string; has_more: boolean; meeting: MeetingFeedState | null }> => {
+    const params = new URLSearchParams({ since: String(since) });
+    if (limit) params.append('limit', String(limit));
+
+    const response = await fetch(`${API_BASE_URL}/chat/messages/${teamId}/${projectId}?${params.toString()}`);
+
+    if (!response.ok) throw new Error('메시지 조회 실패');
+    return response.json();
+};
+
+export interface ChatUnreadRoom {
+    room_id: number;
+    unread: number;
+    seq: number;
+    updated_at: string | null;
+}
+
+export interface ChatUnreadCounts {
+    rooms: ChatUnreadRoom[];
+    total: number;
+}
+
+const authHeaders = (): Record<string, string> => {
+    const token = localStorage.getItem('id_token') || localStorage.getItem('access_token');
+    return token ? { 'Authorization': `Bearer ${token}` } : {};
+};
+
+// 내 모든 채팅방 안 읽은 수 (채팅 WebSocket에서는 { type: 'unread_subscribe' }로 push 구독, 사용자는 연결 토큰으로 확인)
+export const getChatUnreadCounts = async (): Promise<ChatUnreadCounts> => {
+    const response = await fetch(`${API_BASE_URL}/chat/unread`, { headers: authHeaders() });
+    if (!response.ok) throw new Error('안 읽은 수 조회 실패');
+    const body = await response.json();
+    return body.data;
+};
+
+// 채팅방을 현재 메시지까지 읽음 처리 (WebSocket 연결 중에는 { type: 'read' } 프레임 사용)
+export const markChatRead = async (projectId: number): Promise<void> => {
+    await fetch(`${API_BASE_URL}/chat/${projectId}/read`, { method: 'POST', headers: authHeaders() });
+};
+
 export const generateDailyMinutes = async (
     teamId: number,
     projectId: number,
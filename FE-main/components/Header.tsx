@@ -4,7 +4,7 @@ import { Link, NavLink, useNavigate } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
 
 const Header: React.FC = () => {
-  const { user, logout, resetAllFilters, notifications, markNotificationsRead, refreshNotifications } = useAuth();
+  const { user, logout, resetAllFilters, notifications, markNotificationsRead, refreshNotifications, unreadNotificationCount, hasMoreNotifications, loadMoreNotifications } = useAuth();
   const navigate = useNavigate();
   const [showNoti, setShowNoti] = useState(false);
   const [showTeamDropdown, setShowTeamDropdown] = useState(false);
@@ -33,7 +33,8 @@ const Header: React.FC = () => {
   const myNotis = notifications.filter(n => 
     String(n.userId) === String(user?.id) || (user?.role === 'ADMIN' && n.role === 'ADMIN')
   );
-  const unreadCount = myNotis.filter(n => !n.read).length;
+  // 목록은 최근 페이지만 들고 있으므로 안 읽은 수는 서버 집계 값 사용
+  const unreadCount = unreadNotificationCount;
 
   const navLinkClass = ({ isActive }: { isActive: boolean }) =>
     `px-4 py-2 rounded-xl text-sm font-bold transition-all ${isActive ? 'text-primary bg-primary/5' : 'text-text-sub hover:text-text-main hover:bg-gray-50'
@@ -168,6 +169,11 @@ const Header: React.FC = () => {
                             <p className="text-xs text-gray-400 font-bold">알림이 없습니다.</p>
                           </div>
                         )}
+                        {hasMoreNotifications && (
+                          <button onClick={loadMoreNotifications} className="w-full p-3 text-[10px] font-black text-gray-400 hover:text-primary hover:bg-gray-50 transition-colors">
+                            이전 알림 더 보기
+                          </button>
+                        )}
                       </div>
                     </div>
                   )}
@@ -1,5 +1,5 @@
 
-import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
+import React, { createContext, useContext, useState, useEffect, useRef, ReactNode } from 'react';
 import { authAPI, projectAPI, teamAPI } from '../api/apiClient';
 
 export interface TestResult {
@@ -105,6 +105,37 @@ export interface Notification {
   date: string;
 }
 
+// 알림 API 응답 → 화면용 Notification
+const toNotification = (n: any): Notification => ({
+  id: n.notification_id || n.id,
+  userId: n.user_id,
+  role: 'USER' as const,
+  message: n.message,
+  link: n.link || '/',
+  read: n.is_read || false,
+  date: n.created_at ? new Date(n.created_at).toLocaleDateString() : new Date().toLocaleDateString(),
+});
+
+// 알림 한 페이지 (최신순, cursor가 있으면 그 이후의 더 오래된 알림)
+const fetchNotificationPage = async (userId: string, cursor?: string | null) => {
+  const params = new URLSearchParams({ user_id: userId });
+  if (cursor) params.set('cursor', cursor);
+  const response = await fetch(`/notifications?${params.toString()}`);
+  if (!response.ok) return null;
+  const data = await response.json();
+  return {
+    items: ((data?.data?.notifications || []) as any[]).map(toNotification),
+    nextCursor: (data?.data?.next_cursor || null) as string | null,
+  };
+};
+
+const fetchUnreadNotificationCount = async (userId: string): Promise<number | null> => {
+  const response = await fetch(`/notifications/unread-count?user_id=${encodeURIComponent(userId)}`);
+  if (!response.ok) return null;
+  const data = await response.json();
+  return typeof data?.data?.unread === 'number' ? data.data.unread : null;
+};
+
 export interface Report {
   id: number;
   title: string;
@@ -173,8 +204,11 @@ interface AuthContextType {
   addReport: (report: Omit<Report, 'id' | 'date' | 'status'>) => Promise<void>;
   resolveReport: (id: number, resolutionType: string) => Promise<void>;
   addEvent: (event: Omit<EventItem, 'id'>) => void;
+  unreadNotificationCount: number;
+  hasMoreNotifications: boolean;
   markNotificationsRead: () => void;
   refreshNotifications: () => Promise<void>;
+  loadMoreNotifications: () => Promise<void>;
   changePassword: (oldPw: string, newPw: string) => Promise<void>;
   addTestResult: (result: TestResult) => void;
   addTeamTask: (task: Omit<TeamTask, 'id'>) => void;
@@ -228,6 +262,10 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
   const [reports, setReports] = useState<Report[]>([]);
   const [events, setEvents] = useState<EventItem[]>([]);
   const [notifications, setNotifications] = useState<Notification[]>([]);
+  const [unreadNotificationCount, setUnreadNotificationCount] = useState(0);
+  const [notificationCursor, setNotificationCursor] = useState<string | null>(null);
+  const lastUnreadCountRef = useRef<number | null>(null);
+  const notificationStreamRef = useRef<EventSource | null>(null);
   const [loading, setLoading] = useState(true);
   const [filterResetKey, setFilterResetKey] = useState(0);
 
@@ -475,36 +513,69 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     restoreUserSession();
   }, []);
 
-  // 알림 실시간 폴링 (30초마다)
+  // 알림 실시간 push (SSE) - 새 알림이 생기면 바로 받음, 끊기면 브라우저가 Last-Event-ID로 이어받아 재연결
+  useEffect(() => {
+    if (!user?.id || typeof EventSource === 'undefined') return;
+
+    const stream = new EventSource(`/notifications/stream?user_id=${encodeURIComponent(user.id)}`);
+    notificationStreamRef.current = stream;
+
+    const applyUnread = (e: MessageEvent) => {
+      try {
+        const count = JSON.parse(e.data)?.unread;
+        if (typeof count === 'number') {
+          lastUnreadCountRef.current = count;
+          setUnreadNotificationCount(count);
+        }
+      } catch {
+        // 형식이 다르면 무시 (폴링으로 보정)
+      }
+    };
+    stream.addEventListener('ready', applyUnread as EventListener);
+    stream.addEventListener('unread', applyUnread as EventListener);
+    stream.addEventListener('notification', ((e: MessageEvent) => {
+      try {
+        const item = toNotification(JSON.parse(e.data));
+        setNotifications(prev => (prev.some(n => n.id === item.id) ? prev : [item, ...prev]));
+      } catch (err) {
+        console.warn('알림 push 처리 실패:', err);
+      }
+    }) as EventListener);
+
+    return () => {
+      stream.close();
+      notificationStreamRef.current = null;
+    };
+  }, [user?.id]);
+
+  // 알림 폴링 (30초마다, push 연결이 없을 때만) - 안 읽은 수만 조회하고, 값이 바뀌었을 때만 첫 페이지를 다시 불러옴
   useEffect(() => {
     if (!user?.id) return;
+    lastUnreadCountRef.current = null;
 
-    const fetchNotifications = async () => {
+    const pollNotifications = async () => {
+      // SSE가 연결되어 있으면 push로 받으므로 건너뜀
+      if (notificationStreamRef.current && notificationStreamRef.current.readyState === EventSource.OPEN) return;
       try {
-        const response = await fetch(`/notifications?user_id=${user.id}`);
-        if (response.ok) {
-          const data = await response.json();
-          const notificationsList = (data?.data || []).map((n: any) => ({
-            id: n.notification_id || n.id,
-            userId: n.user_id,
-            role: 'USER' as const,
-            message: n.message,
-            link: n.link || '/',
-            read: n.is_read || false,
-            date: n.created_at ? new Date(n.created_at).toLocaleDateString() : new Date().toLocaleDateString(),
-          }));
-          setNotifications(notificationsList);
+        const count = await fetchUnreadNotificationCount(user.id);
+        if (count === null || count === lastUnreadCountRef.current) return;
+        lastUnreadCountRef.current = count;
+        setUnreadNotificationCount(count);
+        const page = await fetchNotificationPage(user.id);
+        if (page) {
+          setNotifications(page.items);
+          setNotificationCursor(page.nextCursor);
         }
       } catch (e) {
         console.warn('알림 폴링 실패:', e);
       }
     };
 
-    // 즉시 한 번 실행
-    fetchNotifications();
+    // 즉시 한 번 실행 (첫 페이지 로드 - push 연결 전)
+    pollNotifications();
 
-    // 30초마다 폴링
-    const interval = setInterval(fetchNotifications, 30000);
+    // 30초마다 폴링 (push 실패 시 대체)
+    const interval = setInterval(pollNotifications, 30000);
 
     return () => clearInterval(interval);
   }, [user?.id]);
@@ -682,21 +753,11 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
 
       // 알림 조회
       try {
-        const notiResponse = await fetch(`/notifications?user_id=${userId}`);
-        if (notiResponse.ok) {
-          const notiData = await notiResponse.json();
-          const notificationsList = notiData?.data || [];
-          const mappedNotifications: Notification[] = notificationsList.map((n: any) => ({
-            id: n.notification_id,
-            userId: n.user_id,
-            role: 'USER' as const,
-            message: n.message,
-            link: n.link || '/',
-            read: n.is_read || false,
-            date: n.created_at ? new Date(n.created_at).toLocaleDateString() : new Date().toLocaleDateString(),
-          }));
-          setNotifications(mappedNotifications);
-          console.log('🔔 알림 로드 완료:', mappedNotifications);
+        const page = await fetchNotificationPage(userId);
+        if (page) {
+          setNotifications(page.items);
+          setNotificationCursor(page.nextCursor);
+          console.log('🔔 알림 로드 완료:', page.items);
         }
       } catch (e) {
         console.warn('알림 조회 실패:', e);
@@ -1145,6 +1206,8 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     if (!user) return;
     // UI 즉시 반영
     setNotifications(prev => prev.map(n => ({ ...n, read: true })));
+    setUnreadNotificationCount(0);
+    lastUnreadCountRef.current = 0;
 
     // 백엔드 반영
     try {
@@ -1158,27 +1221,38 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
   const refreshNotifications = async () => {
     if (!user) return;
     try {
-      const response = await fetch(`/notifications?user_id=${user.id}`);
-      if (response.ok) {
-        const data = await response.json();
-        const notificationsList = data?.data || [];
-        const mappedNotifications: Notification[] = notificationsList.map((n: any) => ({
-          id: n.notification_id,
-          userId: n.user_id,
-          role: 'USER' as const,
-          message: n.message,
-          link: n.link || '/',
-          read: n.is_read || false,
-          date: n.created_at ? new Date(n.created_at).toLocaleDateString() : new Date().toLocaleDateString(),
-        }));
-        setNotifications(mappedNotifications);
-        console.log('🔔 알림 새로고침 완료:', mappedNotifications);
+      const [page, count] = await Promise.all([
+        fetchNotificationPage(user.id),
+        fetchUnreadNotificationCount(user.id),
+      ]);
+      if (page) {
+        setNotifications(page.items);
+        setNotificationCursor(page.nextCursor);
+        console.log('🔔 알림 새로고침 완료:', page.items);
+      }
+      if (count !== null) {
+        setUnreadNotificationCount(count);
+        lastUnreadCountRef.current = count;
       }
     } catch (e) {
       console.warn('알림 조회 실패:', e);
     }
   };
 
+  // 알림 다음 페이지 (더 오래된 알림) 이어 붙이기
+  const loadMoreNotifications = async () => {
+    if (!user || !notificationCursor) return;
+    try {
+      const page = await fetchNotificationPage(user.id, notificationCursor);
+      if (page) {
+        setNotifications(prev => [...prev, ...page.items.filter(n => !prev.some(p => p.id === n.id))]);
+        setNotificationCursor(page.nextCursor);
+      }
+    } catch (e) {
+      console.warn('알림 추가 조회 실패:', e);
+    }
+  };
+
   const changePassword = async (old: string, newP: string) => {
     if (!newP) throw new Error('새 비밀번호를 입력해주세요.');
     if (!user) throw new Error('로그인이 필요합니다.');
@@ -1249,6 +1323,7 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
       }, addProject, updateProjectStatus, deleteProject: (id) => setProjects(p => p.filter(x => x.id !== id)),
       addNotice, updateNotice, deleteNotice, addBanner, updateBanner, deleteBanner,
       addReport, resolveReport, addEvent, markNotificationsRead, refreshNotifications, changePassword,
+      unreadNotificationCount, hasMoreNotifications: notificationCursor !== null, loadMoreNotifications,
       loginWithSocial, checkNickname, addTestResult,
       addTeamTask, updateTeamTask, addTeamMeeting, updateTeamMeeting, addTeamFile
     }}>
@@ -19,17 +19,21 @@ interface Project {
   recruitment_positions?: any[];
 }
 
+const PAGE_SIZE = 20;
+
 const ProjectsPage: React.FC = () => {
   const [projects, setProjects] = useState<Project[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchProjects = async () => {
       try {
-        const data = await projectAPI.getProjects(1, 20);
-        // API 응답 구조에 따라 조정 (data.projects 또는 data 자체일 수 있음)
-        setProjects(Array.isArray(data) ? data : data.projects || []);
+        const page = await projectAPI.getProjectsPage(PAGE_SIZE);
+        setProjects(page.projects);
+        setNextCursor(page.nextCursor);
       } catch (err: any) {
         console.error('Failed to fetch projects:', err);
         setError('프로젝트 목록을 불러오는데 실패했습니다.');
@@ -40,6 +44,21 @@ const ProjectsPage: React.FC = () => {
     fetchProjects();
   }, []);
 
+  // 다음 페이지 (커서 기반이라 뒤 페이지도 첫 페이지와 같은 속도)
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await projectAPI.getProjectsPage(PAGE_SIZE, nextCursor);
+      setProjects(prev => [...prev, ...page.projects]);
+      setNextCursor(page.nextCursor);
+    } catch (err: any) {
+      console.error('Failed to fetch more projects:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // 마감일 표시 (백엔드에서 계산된 deadline 우선 사용)
   const getDeadlineDisplay = (project: Project) => {
     // 백엔드에서 이미 계산해서 보내준 deadline 필드 우선 사용
@@ -190,6 +209,18 @@ const ProjectsPage: React.FC = () => {
           </Link>
         ))}
       </div>
+
+      {nextCursor && (
+        <div className="text-center">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="px-6 py-3 border border-gray-200 rounded-xl font-bold text-text-secondary hover:bg-gray-50 transition-colors disabled:opacity-50"
+          >
+            {loadingMore ? '불러오는 중...' : '더 보기'}
+          </button>
+        </div>
+      )}
     </div>
   );
 };
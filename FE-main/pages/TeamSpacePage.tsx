@@ -16,7 +16,7 @@ import { useParams, useLocation, useNavigate } from 'react-router-dom';
 import Card from '../components/Card';
 import { useAuth } from '../contexts/AuthContext';
 import { generatePortfolio, getPortfolios, deletePortfolio, PortfolioResult } from '../api/aiClient';
-import { MinutesResponse, saveChatMessage, getChatMessages } from '../api/chatClient';
+import { MinutesResponse, saveChatMessage, getChatMessages, getChatMessagesSince, newClientMsgId } from '../api/chatClient';
 import { teamAPI } from '../api/apiClient';
 
 // 시간 포맷 유틸 함수
@@ -592,6 +592,8 @@ const TeamChat = ({
 
   // WebSocket 연결 상태
   const wsRef = useRef<WebSocket | null>(null);
+  // 읽음 처리 묶음 타이머 (메시지마다 보내지 않음)
+  const readTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const [isConnected, setIsConnected] = useState(false);
 
   // 초기 메시지 로드
@@ -715,20 +717,39 @@ const TeamChat = ({
     // 프로덕션에서는 API 도메인 사용, 로컬에서는 Support Service 직접 연결
     const wsHost = isLocal ? 'localhost:8004' : 'api.portforge.org';
     const wsUrl = `${protocol}://${wsHost}/ws/chat/${projectId}`;
+    // 브라우저 WebSocket은 헤더를 넣을 수 없으므로 토큰을 쿼리로 전달 (읽음 처리 사용자 확인용)
+    const wsToken = localStorage.getItem('id_token') || localStorage.getItem('access_token');
 
     console.log('🔌 WebSocket 연결 시도:', wsUrl);
 
-    const ws = new WebSocket(wsUrl);
+    const ws = new WebSocket(wsToken ? `${wsUrl}?token=${encodeURIComponent(wsToken)}` : wsUrl);
     wsRef.current = ws;
 
+    // 채팅방을 보고 있는 동안 읽음 위치 갱신 (안 읽은 수 배지용, 2초 단위로 묶어서 전송)
+    const scheduleRead = () => {
+      if (!user?.id || readTimerRef.current) return;
+      readTimerRef.current = setTimeout(() => {
+        readTimerRef.current = null;
+        if (ws.readyState === WebSocket.OPEN && document.visibilityState === 'visible') {
+          ws.send(JSON.stringify({ type: 'read' }));
+        }
+      }, 2000);
+    };
+
     ws.onopen = () => {
       console.log('✅ WebSocket 연결됨');
       setIsConnected(true);
+      if (user?.id) ws.send(JSON.stringify({ type: 'read' }));
     };
 
     ws.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
+        // 서버가 집계한 회의 메시지 수 (회의 중에만 반영)
+        if (data.type === 'meeting_counter') {
+          if (data.active) setMeetingServerCount(data.message_count ?? 0);
+          return;
+        }
         if (typeof data.message === 'string' && data.message.startsWith(MEETING_EVENT_PREFIX)) {
           try {
             const payload = JSON.parse(data.message.slice(MEETING_EVENT_PREFIX.length));
@@ -780,6 +801,7 @@ const TeamChat = ({
         });
 
         if (!isMyMessage) {
+          scheduleRead();
           const newMessage: ChatMessage = {
             user: senderName,
             msg: data.message,
@@ -820,6 +842,10 @@ const TeamChat = ({
 
     // 컴포넌트 언마운트 시 연결 종료
     return () => {
+      if (readTimerRef.current) {
+        clearTimeout(readTimerRef.current);
+        readTimerRef.current = null;
+      }
       if (ws.readyState === WebSocket.OPEN) {
         ws.close();
       }
@@ -855,37 +881,19 @@ const TeamChat = ({
       return;
     }
 
+    // WebSocket이 연결되어 있으면 서버가 meeting_counter로 push하므로 폴링하지 않음
+    if (isConnected) return;
+
+    // 연결이 끊긴 동안에만 새 메시지만 증분 조회 (전체 목록 재조회 X)
     let cancelled = false;
+    let cursor: string | number = meetingStartTime.getTime();
     const fetchCount = async () => {
       try {
-        const { messages } = await getChatMessages(teamId, projectId, { limit: 1000 });
-
-        const eventMessages = messages.filter((m: any) => {
-          const msg = typeof m.msg === 'string' ? m.msg : (typeof m.message === 'string' ? m.message : '');
-          return msg.startsWith(MEETING_EVENT_PREFIX);
-        });
-
-        const lastStart = eventMessages.slice().reverse().find((m: any) => {
-          const msg = typeof m.msg === 'string' ? m.msg : (typeof m.message === 'string' ? m.message : '');
-          try {
-            return JSON.parse(msg.slice(MEETING_EVENT_PREFIX.length)).action === 'start';
-          } catch (e) {
-            return false;
-          }
-        });
-
-        const startMs = typeof lastStart?.timestamp === 'number' ? lastStart.timestamp : meetingStartTime.getTime();
-        const endMs = Date.now();
-
-        const filtered = messages.filter((m: any) => {
-          const msg = typeof m.msg === 'string' ? m.msg : (typeof m.message === 'string' ? m.message : '');
-          if (msg.startsWith(MEETING_EVENT_PREFIX)) return false;
-          const ts = typeof m.timestamp === 'number' ? m.timestamp : 0;
-          return ts >= startMs && ts <= endMs;
-        });
-
-        if (!cancelled) {
-          setMeetingServerCount(filtered.length);
+        const res = await getChatMessagesSince(teamId, projectId, cursor);
+        if (cancelled) return;
+        cursor = res.cursor || cursor;
+        if (res.meeting?.active) {
+          setMeetingServerCount(res.meeting.message_count);
         }
       } catch (e) {
         console.warn('Meeting message count failed:', e);
@@ -899,7 +907,7 @@ const TeamChat = ({
       cancelled = true;
       clearInterval(interval);
     };
-  }, [isMeetingActive, meetingStartTime, teamId, projectId]);
+  }, [isMeetingActive, meetingStartTime, isConnected, teamId, projectId]);
 
   // ?? ?? ???
   useEffect(() => {
@@ -940,7 +948,8 @@ const TeamChat = ({
           user_id: currentUser,
           senderName: currentUser,
           message: messageText,
-          timestamp: now.toISOString()
+          timestamp: now.toISOString(),
+          client_msg_id: newClientMsgId()
         }));
       } else {
         await saveChatMessage(teamId, projectId, currentUser, messageText, isMeetingActive);
@@ -994,7 +1003,8 @@ const TeamChat = ({
         user_id: user?.id || currentUser,
         senderName: currentUser,
         message: MEETING_EVENT_PREFIX + JSON.stringify({ action: 'start', startedAt: startedAt.toISOString(), meetingId: createdMeetingId }),
-        timestamp: startedAt.toISOString()
+        timestamp: startedAt.toISOString(),
+        client_msg_id: newClientMsgId()
       }));
     }
   };
@@ -1053,7 +1063,8 @@ const TeamChat = ({
         user_id: user?.id || currentUser,
         senderName: currentUser,
         message: MEETING_EVENT_PREFIX + JSON.stringify({ action: 'end', endedAt: endedAt.toISOString(), meetingId: localMeetingId }),
-        timestamp: endedAt.toISOString()
+        timestamp: endedAt.toISOString(),
+        client_msg_id: newClientMsgId()
       }));
     }
 
@@ -6,7 +6,7 @@ ERD 기반 MSA 분리: 지원서 CRUD 및 승인/거절 처리
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import logging
 import httpx
@@ -18,6 +18,8 @@ from app.models.project_recruitment import (
     Project, ProjectRecruitmentPosition, Application,
     ApplicationStatus, PositionType as StackCategory  # Alias for compatibility
 )
+from app.services.project_cards import refresh_project_cards
+from app.utils.http_pool import http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +80,7 @@ async def call_team_service(method: str, endpoint: str, data: dict = None) -> di
         logger.warning("Team Service 호출 차단됨 (Circuit Open)")
         return None
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_pool.target("team", timeout=10.0) as client:
         url = f"{TEAM_SERVICE_URL}{endpoint}"
         try:
             if method == "POST":
@@ -107,16 +109,24 @@ async def call_team_service(method: str, endpoint: str, data: dict = None) -> di
 
 async def send_notification(user_id: str, message: str, link: str = "/"):
     """Support Service에 알림 전송 (실패해도 계속 진행 - Fire and Forget)"""
+    await send_notifications([{"user_id": user_id, "message": message, "link": link}])
+
+
+async def send_notifications(notifications: List[Dict[str, Any]]):
+    """
+    Support Service에 알림 여러 건을 한 번에 전송 (POST /notifications/batch, 한 번의 INSERT)
+    notifications: [{"user_id", "message", "link"}, ...] - 팬아웃은 이 목록으로 한 번만 호출
+    """
+    if not notifications:
+        return
     if not support_service_breaker.can_execute():
         logger.debug("알림 전송 스킵 (Support Service Circuit Open)")
         return
     
-    async with httpx.AsyncClient(timeout=5.0) as client:
+    async with http_pool.target("support", timeout=5.0) as client:
         try:
-            await client.post(f"{SUPPORT_SERVICE_URL}/notifications", json={
-                "user_id": user_id,
-                "message": message,
-                "link": link,
+            await client.post(f"{SUPPORT_SERVICE_URL}/notifications/batch", json={
+                "notifications": notifications,
             })
             support_service_breaker.record_success()
         except Exception as e:
@@ -350,7 +360,9 @@ async def handle_application(
                     detail="팀 서비스 연결 실패로 승인이 취소되었습니다. 잠시 후 다시 시도해주세요."
                 )
             
-            # ✅ 모든 단계 성공 - 커밋
+            # ✅ 모든 단계 성공 - 커밋 (목록 카드의 모집 인원도 함께 갱신)
+            if position:
+                await refresh_project_cards(db, [project_id])
             await db.commit()
             logger.info(f"✅ 지원자 승인 완료: {application.user_id} -> 프로젝트 {project_id}")
             
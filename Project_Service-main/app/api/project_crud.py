@@ -3,11 +3,11 @@ Project Service - 프로젝트 CRUD API (보상 트랜잭션 + Circuit Breaker 
 ERD 기반 MSA 분리: 프로젝트/모집포지션/지원서 관리
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import json
 import logging
@@ -19,9 +19,21 @@ import os
 # shared 모듈 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.deps import get_optional_user
+from app.utils.http_pool import http_pool
+from app.utils.keyset import (
+    after_cursor, after_score_cursor, decode_cursor, decode_score_cursor, encode_score_cursor, next_cursor
+)
+from app.services.project_facets import project_facets
+from app.services.project_cards import card_fields, refresh_project_cards
+from app.services.project_stacks import STACK_MODES, parse_stack_query, stack_filter
+from app.services.project_search import search_score, search_terms
+from app.services.view_counter import view_counter
+from app.utils.client_ip import client_ip
 from app.models.project_recruitment import (
-    Project, ProjectRecruitmentPosition, Application,
+    Project, ProjectCard, ProjectRecruitmentPosition, Application,
     ProjectType, ProjectMethod, ProjectStatus, ApplicationStatus, 
     PositionType as StackCategory  # Alias for compatibility
 )
@@ -87,7 +99,7 @@ async def get_user_nickname(user_id: str) -> str:
         return "익명"
     
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with http_pool.target("auth", timeout=5.0) as client:
             response = await client.get(f"{AUTH_SERVICE_URL}/users/{user_id}/basic")
             if response.status_code == 200:
                 auth_service_breaker.record_success()
@@ -107,7 +119,7 @@ async def get_users_nicknames(user_ids: list) -> dict:
         return {}
     
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with http_pool.target("auth", timeout=5.0) as client:
             response = await client.post(
                 f"{AUTH_SERVICE_URL}/users/batch",
                 json={"user_ids": list(set(user_ids))}  # 중복 제거
@@ -124,43 +136,36 @@ async def get_users_nicknames(user_ids: list) -> dict:
         auth_service_breaker.record_failure()
         return {}
 
-async def get_team_leader_nickname(project_id: int) -> str:
-    """Team Service에서 프로젝트의 팀장 닉네임 조회"""
-    if not team_service_breaker.can_execute():
-        return "익명"
+async def get_team_leaders_nicknames(project_ids: list) -> dict:
+    """Team Service에서 여러 프로젝트의 팀장 닉네임 일괄 조회 (Team 1회 + Auth 1회)"""
+    if not project_ids or not team_service_breaker.can_execute():
+        return {}
     
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # 팀 stats API 호출 (멤버 정보 포함)
-            response = await client.get(f"{TEAM_SERVICE_URL}/api/v1/teams/{project_id}/stats")
+        async with http_pool.target("team", timeout=5.0) as client:
+            response = await client.post(
+                f"{TEAM_SERVICE_URL}/api/v1/teams/leaders/batch",
+                json={"project_ids": list(set(project_ids))}
+            )
             if response.status_code == 200:
                 team_service_breaker.record_success()
-                data = response.json()
-                members = data.get("members", [])
-                # LEADER 역할인 멤버 찾기
-                for member in members:
-                    if member.get("role") == "LEADER":
-                        return member.get("nickname", "익명")
-                return "익명"
+                leaders = response.json().get("data", [])
+                return {
+                    leader.get("project_id"): leader.get("nickname") or "익명"
+                    for leader in leaders
+                }
             else:
                 team_service_breaker.record_failure()
-                return "익명"
+                return {}
     except Exception as e:
-        logger.warning(f"Team Service 호출 실패: {str(e)}")
+        logger.warning(f"Team Service 팀장 일괄 조회 실패: {str(e)}")
         team_service_breaker.record_failure()
-        return "익명"
-
-async def get_team_leaders_nicknames(project_ids: list) -> dict:
-    """Team Service에서 여러 프로젝트의 팀장 닉네임 일괄 조회 (병렬)"""
-    import asyncio
-    
-    if not project_ids:
         return {}
-    
-    # 병렬로 모든 프로젝트의 팀장 닉네임 조회
-    results = await asyncio.gather(*[get_team_leader_nickname(pid) for pid in project_ids])
-    
-    return dict(zip(project_ids, results))
+
+async def get_team_leader_nickname(project_id: int) -> str:
+    """Team Service에서 프로젝트의 팀장 닉네임 조회"""
+    leader_nicknames = await get_team_leaders_nicknames([project_id])
+    return leader_nicknames.get(project_id, "익명")
 
 async def call_team_service(method: str, endpoint: str, data: dict = None) -> dict:
     """Team Service API 호출 (Circuit Breaker 적용)"""
@@ -171,7 +176,7 @@ async def call_team_service(method: str, endpoint: str, data: dict = None) -> di
         return None
     
     # 2. 실제 호출
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_pool.target("team", timeout=10.0) as client:
         url = f"{TEAM_SERVICE_URL}{endpoint}"
         try:
             if method == "POST":
@@ -203,15 +208,23 @@ async def call_team_service(method: str, endpoint: str, data: dict = None) -> di
 
 async def send_notification(user_id: str, message: str, link: str = "/"):
     """Support Service에 알림 전송 (실패해도 계속 진행)"""
+    await send_notifications([{"user_id": user_id, "message": message, "link": link}])
+
+
+async def send_notifications(notifications: List[Dict[str, Any]]):
+    """
+    Support Service에 알림 여러 건을 한 번에 전송 (POST /notifications/batch, 한 번의 INSERT)
+    notifications: [{"user_id", "message", "link"}, ...] - 팬아웃은 이 목록으로 한 번만 호출
+    """
+    if not notifications:
+        return
     if not support_service_breaker.can_execute():
         return
     
-    async with httpx.AsyncClient(timeout=5.0) as client:
+    async with http_pool.target("support", timeout=5.0) as client:
         try:
-            await client.post(f"{SUPPORT_SERVICE_URL}/notifications", json={
-                "user_id": user_id,
-                "message": message,
-                "link": link,
+            await client.post(f"{SUPPORT_SERVICE_URL}/notifications/batch", json={
+                "notifications": notifications,
             })
             support_service_breaker.record_success()
         except Exception as e:
@@ -248,139 +261,211 @@ def convert_position_type(position_str: str) -> StackCategory:
 # =====================================================
 # 1. 프로젝트 목록 조회 (공개 API)
 # =====================================================
+# 목록 필터 값 (한글 라벨) → Enum
+PROJECT_TYPE_FILTERS = {"프로젝트": ProjectType.PROJECT, "스터디": ProjectType.STUDY}
+PROJECT_STATUS_FILTERS = {"모집중": ProjectStatus.RECRUITING, "진행중": ProjectStatus.PROCEEDING}
+
+
+def apply_list_filters(query, type: Optional[str], project_status: Optional[str], stacks: Optional[str], stack_mode: str):
+    """목록/검색 공통 필터 (타입, 상태, 기술 스택)"""
+    if stack_mode not in STACK_MODES:
+        raise HTTPException(status_code=400, detail="stack_mode는 any 또는 all이어야 합니다.")
+    
+    if type in PROJECT_TYPE_FILTERS:
+        query = query.where(Project.type == PROJECT_TYPE_FILTERS[type])
+    
+    if project_status in PROJECT_STATUS_FILTERS:
+        query = query.where(Project.status == PROJECT_STATUS_FILTERS[project_status])
+    
+    stack_list = parse_stack_query(stacks)
+    if stack_list:
+        query = query.where(stack_filter(stack_list, stack_mode))
+    return query
+
+
+async def build_project_list(db: AsyncSession, rows: List[Any]) -> List[Dict[str, Any]]:
+    """(Project, ProjectCard) 행 → 목록 카드 응답 (팀장 닉네임 일괄 조회 포함)"""
+    projects = [row[0] for row in rows]
+    cards = {row[0].project_id: row[1] for row in rows if row[1] is not None}
+    
+    # 카드가 아직 없는 프로젝트(읽기 모델 도입 전 데이터)는 지금 만들어 저장
+    missing = [p.project_id for p in projects if p.project_id not in cards]
+    if missing:
+        cards.update(await refresh_project_cards(db, missing))
+        await db.commit()
+        logger.info(f"📇 프로젝트 카드 생성: {missing}")
+    
+    # 팀장 닉네임 일괄 조회
+    project_ids = [p.project_id for p in projects]
+    leader_nicknames = await get_team_leaders_nicknames(project_ids)
+    
+    project_list = []
+    for p in projects:
+        card = card_fields(cards[p.project_id])
+        project_list.append({
+            "id": p.project_id,
+            "project_id": p.project_id,  # 호환성을 위해 둘 다 제공
+            "type": "프로젝트" if p.type == ProjectType.PROJECT else "스터디",
+            "title": p.title,
+            "description": p.description,
+            "deadline": card["deadline"],
+            "views": p.views or 0,
+            "members": card["members"],
+            "tags": card["tags"],
+            "position": card["position"],
+            "method": get_method_display_name(p.method),
+            "status": "모집중" if p.status == ProjectStatus.RECRUITING else "진행중",
+            "authorId": p.user_id,
+            "user_id": p.user_id,  # 호환성을 위해 둘 다 제공
+            "leaderName": leader_nicknames.get(p.project_id, "익명"),
+            "startDate": p.start_date.isoformat() if p.start_date else None,
+            "start_date": p.start_date.isoformat() if p.start_date else None,
+            "endDate": p.end_date.isoformat() if p.end_date else None,
+            "end_date": p.end_date.isoformat() if p.end_date else None,
+            "testRequired": p.test_required or False,
+            "test_required": p.test_required or False,
+            "recruitment_positions": card["recruitment_positions"],
+        })
+    return project_list
+
+
 @router.get("")
 async def get_projects(
+    response: Response,
     page: int = 1,
     size: int = 20,
     type: Optional[str] = None,
-    status: Optional[str] = None,
+    project_status: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = None,
+    stacks: Optional[str] = None,
+    stack_mode: str = "any",
     db: AsyncSession = Depends(get_db)
 ):
-    """프로젝트 목록 조회 (메인 페이지용)"""
+    """
+    프로젝트 목록 조회 (메인 페이지용)
+    - cursor: 이전 응답의 X-Next-Cursor 헤더 값 (키셋 페이지네이션, 깊은 페이지도 비용 동일)
+    - cursor 없이 page>1이면 기존 OFFSET 방식으로 동작 (하위 호환)
+    - stacks: 기술 스택 필터 (콤마 구분, 예: React,TypeScript)
+    - stack_mode: any = 하나라도 포함 (OR), all = 모두 포함 (AND)
+    """
+    size = max(1, min(size, settings.PROJECT_PAGE_MAX))
     try:
-        query = select(Project).options(selectinload(Project.recruitment_positions))
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    # 카드 읽기 모델(project_cards)을 PK로 붙여 한 번에 조회 (포지션 로딩/계산 없음)
+    query = select(Project, ProjectCard).outerjoin(ProjectCard, ProjectCard.project_id == Project.project_id)
+    query = apply_list_filters(query, type, project_status, stacks, stack_mode)
+
+    try:
+        # 정렬 및 페이지네이션 (created_at 동률은 project_id로 순서 고정)
+        query = query.order_by(Project.created_at.desc(), Project.project_id.desc())
+        if position is not None:
+            query = query.where(after_cursor(Project.created_at, Project.project_id, position))
+        elif page > 1:
+            query = query.offset((page - 1) * size)
+        query = query.limit(size)
         
-        # 필터 적용
-        if type:
-            if type == "프로젝트":
-                query = query.where(Project.type == ProjectType.PROJECT)
-            elif type == "스터디":
-                query = query.where(Project.type == ProjectType.STUDY)
+        result = await db.execute(query)
+        rows = result.all()
+
+        following = next_cursor([p for p, _ in rows], size)
+        if following:
+            response.headers["X-Next-Cursor"] = following
         
-        if status:
-            if status == "모집중":
-                query = query.where(Project.status == ProjectStatus.RECRUITING)
-            elif status == "진행중":
-                query = query.where(Project.status == ProjectStatus.PROCEEDING)
+        return await build_project_list(db, rows)
         
-        # 정렬 및 페이지네이션
-        query = query.order_by(Project.created_at.desc())
-        query = query.offset((page - 1) * size).limit(size)
+    except Exception as e:
+        logger.error(f"프로젝트 목록 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 목록 조회 실패: {str(e)}")
+
+
+@router.get("/facets")
+async def get_project_facets(db: AsyncSession = Depends(get_db)):
+    """타입/상태별 프로젝트 수 (GROUP BY 1번, PROJECT_FACET_CACHE_TTL초 캐시)"""
+    try:
+        return await project_facets.facets(db)
+    except Exception as e:
+        logger.error(f"프로젝트 개수 집계 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 개수 집계 실패: {str(e)}")
+
+
+@router.get("/search")
+async def search_projects(
+    response: Response,
+    q: str,
+    size: int = 20,
+    type: Optional[str] = None,
+    project_status: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = None,
+    stacks: Optional[str] = None,
+    stack_mode: str = "any",
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    프로젝트 검색 (제목/설명, FULLTEXT ngram 인덱스)
+    - 관련도(score) 높은 순, 다음 페이지는 X-Next-Cursor 헤더 값을 cursor로 전달
+    - type/status/stacks/stack_mode 필터는 목록 조회와 동일
+    """
+    terms = search_terms(q)
+    if not terms:
+        raise HTTPException(
+            status_code=400,
+            detail=f"검색어는 {settings.PROJECT_SEARCH_MIN_LENGTH}자 이상 입력해주세요.",
+        )
+    size = max(1, min(size, settings.PROJECT_PAGE_MAX))
+    try:
+        position = decode_score_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    
+    score = search_score(terms)
+    query = (
+        select(Project, ProjectCard, score.label("score"))
+        .outerjoin(ProjectCard, ProjectCard.project_id == Project.project_id)
+        .where(score > 0)
+    )
+    query = apply_list_filters(query, type, project_status, stacks, stack_mode)
+
+    try:
+        query = query.order_by(score.desc(), Project.project_id.desc())
+        if position is not None:
+            query = query.where(after_score_cursor(score, Project.project_id, position))
+        query = query.limit(size)
         
         result = await db.execute(query)
-        projects = result.scalars().all()
-        
-        # 팀장 닉네임 일괄 조회
-        project_ids = [p.project_id for p in projects]
-        leader_nicknames = await get_team_leaders_nicknames(project_ids)
-        
-        project_list = []
-        for p in projects:
-            logger.info(f"📋 프로젝트 {p.project_id}: {p.title}, 포지션 수: {len(p.recruitment_positions) if p.recruitment_positions else 0}")
-            
-            # 마감일 계산
-            deadline = "D-?"
-            if p.recruitment_positions:
-                deadlines = [pos.recruitment_deadline for pos in p.recruitment_positions if pos.recruitment_deadline]
-                if deadlines:
-                    recruit_deadline = min(deadlines)
-                    diff_days = (recruit_deadline - datetime.now().date()).days
-                    if diff_days > 0:
-                        deadline = f"D-{diff_days}"
-                    elif diff_days == 0:
-                        deadline = "D-Day"
-                    else:
-                        deadline = "모집마감"
-            
-            # 인원 수 계산 - 포지션별로 표시
-            members_parts = []
-            for pos in p.recruitment_positions:
-                pos_name = pos.position_type.value if pos.position_type else "미정"
-                # 한글 포지션명으로 변환
-                pos_name_kr = {
-                    "FRONTEND": "프론트엔드",
-                    "BACKEND": "백엔드",
-                    "DESIGN": "디자인",
-                    "DB": "DB",
-                    "INFRA": "인프라",
-                    "ETC": "기타",
-                    "STUDY_MEMBER": "스터디원"
-                }.get(pos_name, pos_name)
-                current = pos.current_count or 0
-                target = pos.target_count or 0
-                members_parts.append(f"{pos_name_kr} {current}/{target}")
-            
-            members_str = ", ".join(members_parts) if members_parts else "0/0명"
-            
-            # 기술 스택 추출
-            all_stacks = set()
-            for pos in p.recruitment_positions:
-                logger.info(f"  📦 포지션 {pos.position_type}: required_stacks = {repr(pos.required_stacks)}")
-                if pos.required_stacks:
-                    try:
-                        stacks = json.loads(pos.required_stacks) if isinstance(pos.required_stacks, str) else []
-                        logger.info(f"    → 파싱된 스택: {stacks}")
-                        all_stacks.update(stacks)
-                    except Exception as e:
-                        logger.error(f"    → 파싱 실패: {e}")
-            
-            logger.info(f"  📋 최종 tags: {list(all_stacks)}")
-            
-            project_list.append({
-                "id": p.project_id,
-                "project_id": p.project_id,  # 호환성을 위해 둘 다 제공
-                "type": "프로젝트" if p.type == ProjectType.PROJECT else "스터디",
-                "title": p.title,
-                "description": p.description,
-                "deadline": deadline,
-                "views": p.views or 0,
-                "members": members_str,
-                "tags": list(all_stacks) if all_stacks else [],
-                "position": p.recruitment_positions[0].position_type.value if p.recruitment_positions else "미정",
-                "method": get_method_display_name(p.method),
-                "status": "모집중" if p.status == ProjectStatus.RECRUITING else "진행중",
-                "authorId": p.user_id,
-                "user_id": p.user_id,  # 호환성을 위해 둘 다 제공
-                "leaderName": leader_nicknames.get(p.project_id, "익명"),
-                "startDate": p.start_date.isoformat() if p.start_date else None,
-                "start_date": p.start_date.isoformat() if p.start_date else None,
-                "endDate": p.end_date.isoformat() if p.end_date else None,
-                "end_date": p.end_date.isoformat() if p.end_date else None,
-                "testRequired": p.test_required or False,
-                "test_required": p.test_required or False,
-                "recruitment_positions": [
-                    {
-                        "position_type": pos.position_type.value if pos.position_type else "UNKNOWN",
-                        "required_stacks": json.loads(pos.required_stacks) if isinstance(pos.required_stacks, str) and pos.required_stacks else [],
-                        "target_count": pos.target_count or 0,
-                        "current_count": pos.current_count or 0,
-                        "recruitment_deadline": pos.recruitment_deadline.isoformat() if pos.recruitment_deadline else None,
-                    } for pos in p.recruitment_positions
-                ],
-            })
+        rows = result.all()
+
+        if len(rows) == size:
+            last = rows[-1]
+            response.headers["X-Next-Cursor"] = encode_score_cursor(last.score, last[0].project_id)
         
+        project_list = await build_project_list(db, rows)
+        for item, row in zip(project_list, rows):
+            item["score"] = round(float(row.score), 4)
         return project_list
         
     except Exception as e:
-        logger.error(f"프로젝트 목록 조회 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"프로젝트 목록 조회 실패: {str(e)}")
+        logger.error(f"프로젝트 검색 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 검색 실패: {str(e)}")
 
 # =====================================================
 # 2. 프로젝트 상세 조회
 # =====================================================
 @router.get("/{project_id}")
-async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)):
-    """프로젝트 상세 정보 조회"""
+async def get_project_detail(
+    project_id: int,
+    request: Request,
+    current_user: Optional[dict] = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    프로젝트 상세 정보 조회
+    - 조회수는 view_counter에 모았다가 주기적으로 일괄 반영 (조회 요청은 DB에 쓰지 않음)
+    - VIEW_DEDUP_WINDOW 안의 재조회 제외 기준: 검증된 토큰의 sub, 비로그인이면 프록시가 붙인 클라이언트 IP
+      (쿼리 파라미터나 X-Forwarded-For 앞부분처럼 클라이언트가 바꿀 수 있는 값은 쓰지 않음)
+    """
     try:
         query = select(Project).options(
             selectinload(Project.recruitment_positions)
@@ -392,9 +477,9 @@ async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)
         if not project:
             raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
         
-        # 조회수 증가
-        project.views = (project.views or 0) + 1
-        await db.commit()
+        # 조회수 증가 (write-behind)
+        viewer = (current_user or {}).get("sub") or client_ip(request.headers, request.client.host if request.client else None)
+        view_counter.record(project_id, viewer)
         
         # 모집 포지션 정보
         positions = []
@@ -428,7 +513,7 @@ async def get_project_detail(project_id: int, db: AsyncSession = Depends(get_db)
             "start_date": project.start_date.isoformat() if project.start_date else None,
             "end_date": project.end_date.isoformat() if project.end_date else None,
             "test_required": project.test_required or False,
-            "views": project.views or 0,
+            "views": (project.views or 0) + view_counter.pending(project_id),
             "created_at": project.created_at.isoformat() if project.created_at else None,
             "recruitment_positions": positions,
         }
@@ -541,6 +626,7 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
             logger.info(f"  ✅ 포지션 추가됨: {position_type.value}, 인원: {target_count}")
         
         await db.flush()
+        await refresh_project_cards(db, [project_id])
         logger.info(f"✅ Step 2: 모집 포지션 생성됨 ({len(positions_data)}개)")
         
         # ✅ Step 3: Team Service에 팀 생성 요청
@@ -569,6 +655,7 @@ async def create_project(project_data: dict, db: AsyncSession = Depends(get_db))
         
         # ✅ 모든 단계 성공 - 커밋
         await db.commit()
+        project_facets.invalidate()
         logger.info(f"✅ 프로젝트+팀 생성 완료 (Project ID: {project_id})")
         
         return {
@@ -621,6 +708,7 @@ async def update_project(project_id: int, project_data: dict, db: AsyncSession =
         
         project.updated_at = datetime.now()
         await db.commit()
+        project_facets.invalidate()
         
         return {"status": "success", "message": "프로젝트가 수정되었습니다."}
         
@@ -663,6 +751,7 @@ async def delete_project(project_id: int, user_id: str = None, db: AsyncSession
         # ✅ Step 2: 프로젝트 삭제 (cascade로 관련 데이터 삭제)
         await db.delete(project)
         await db.commit()
+        project_facets.invalidate()
         
         logger.info(f"✅ 프로젝트 삭제 완료 (ID: {project_id})")
         
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 from app.schemas.base import ResponseEnvelope
+from app.utils.http_pool import http_pool
+from app.core.database import aws_manager
+from app.services.project_facets import project_facets
+from app.services.view_counter import view_counter
 router = APIRouter()
 
 @router.get("/liveness", response_model=ResponseEnvelope)
@@ -17,3 +21,28 @@ async def readiness_check():
         "redis": "connected"     # 나중에 실제 체크로 대체
     }
     return ResponseEnvelope(success=True, code="COMMON_000", message="Ready", data=checks)
+
+
+@router.get("/http-pool", response_model=ResponseEnvelope)
+async def http_pool_check():
+    """서비스 간 HTTP 커넥션 풀 현황 (대상별 요청/에러/지연시간, 커넥션 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="HTTP pool", data=http_pool.stats())
+
+
+@router.get("/aws", response_model=ResponseEnvelope)
+async def aws_clients_check():
+    """공유 AWS 클라이언트 현황 및 상태 확인 (열려 있는 클라이언트만 가벼운 호출로 확인)"""
+    data = {**aws_manager.clients.stats(), "probes": await aws_manager.health()}
+    return ResponseEnvelope(success=True, code="COMMON_000", message="AWS clients", data=data)
+
+
+@router.get("/project-facets", response_model=ResponseEnvelope)
+async def project_facets_check():
+    """프로젝트 목록 필터별 개수 캐시 현황 (TTL, 적중률)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Project facets", data=project_facets.stats())
+
+
+@router.get("/views", response_model=ResponseEnvelope)
+async def view_counter_check():
+    """조회수 write-behind 현황 (미반영 조회수, 반영 횟수, 중복 제외 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="View counter", data=view_counter.stats())
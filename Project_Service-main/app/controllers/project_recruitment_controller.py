@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.deps import get_db
 from app.repositories.project_recruitment_repository import ProjectRecruitmentRepository
@@ -8,6 +8,7 @@ from app.schemas.project_recruitment import (
     ProjectDetail, ProjectListResponse, ProjectSummary
 )
 from app.models.project_recruitment import ProjectStatus
+from app.utils.keyset import decode_cursor, next_cursor
 from datetime import datetime
 import json
 
@@ -176,9 +177,11 @@ async def create_project(project_data: ProjectCreate, db: AsyncSession = Depends
 async def get_project_list(
     type: Optional[str] = Query(None, description="프로젝트 타입 필터 (PROJECT/STUDY)"),
     status: Optional[str] = Query(None, description="프로젝트 상태 필터 (RECRUITING/PROCEEDING/COMPLETED/CLOSED)"),
-    tech_stack: Optional[str] = Query(None, description="기술 스택 필터"),
+    tech_stack: Optional[str] = Query(None, description="기술 스택 필터 (콤마 구분, 예: React,TypeScript)"),
+    stack_mode: Literal["any", "all"] = Query("any", description="여러 스택: any = 하나라도 포함 (OR), all = 모두 포함 (AND)"),
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기 (1-100)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -189,14 +192,21 @@ async def get_project_list(
     ### 쿼리 파라미터:
     - **type**: 프로젝트 타입으로 필터링
     - **status**: 프로젝트 상태로 필터링  
-    - **tech_stack**: 기술 스택으로 필터링
+    - **tech_stack**: 기술 스택으로 필터링 (콤마로 여러 개)
+    - **stack_mode**: 여러 스택일 때 any(OR) / all(AND)
     - **page**: 페이지 번호
     - **size**: 페이지당 항목 수
+    - **cursor**: 다음 페이지 커서 (있으면 page 대신 사용, 깊은 페이지도 1페이지와 같은 비용)
     
     ### 반환값:
     - 프로젝트 목록과 페이지네이션 정보
     """
     print(f"🔍 API 호출됨: GET /recruitment-projects (page={page}, size={size})")
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
     try:
         # DB 연결 확인
         if await is_db_available():
@@ -205,8 +215,10 @@ async def get_project_list(
                 type=type,
                 status=status,
                 tech_stack=tech_stack,
+                stack_mode=stack_mode,
                 page=page,
-                size=size
+                size=size,
+                cursor=cursor
             )
             
             projects, total = await repo.get_projects_with_filters(filters)
@@ -261,7 +273,8 @@ async def get_project_list(
                 total=total,
                 page=page,
                 size=size,
-                total_pages=(total + size - 1) // size
+                total_pages=(total + size - 1) // size,
+                next_cursor=next_cursor(projects, size)
             )
         else:
             # Fallback to sample data + memory projects if DB is not available
@@ -28,6 +28,38 @@ class Settings(BaseSettings):
     AI_SERVICE_URL: str = "http://ai-service"
     SUPPORT_SERVICE_URL: str = "http://support-service"
     
+    # [MSA HTTP Connection Pool]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_HTTP_CONNECT_TIMEOUT: float = 5.0
+    MSA_HTTP_MAX_CONNECTIONS: int = 100
+    MSA_HTTP_MAX_KEEPALIVE: int = 20
+    MSA_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    MSA_HTTP_PER_TARGET_LIMIT: int = 50
+    MSA_HTTP2: bool = False
+    
+    # [AWS Client Registry - aioboto3 클라이언트 재사용]
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_HEALTH_TIMEOUT: float = 3.0
+    
+    # [Project List - 키셋 페이지네이션 / 필터별 개수 캐시]
+    PROJECT_PAGE_MAX: int = 100
+    PROJECT_FACET_CACHE_TTL: float = 30.0
+
+    # [Project Search - FULLTEXT ngram]
+    # MySQL ngram_token_size(기본 2)보다 짧은 단어는 색인되지 않으므로 같은 값으로 맞춤
+    PROJECT_SEARCH_MIN_LENGTH: int = 2
+    PROJECT_SEARCH_MAX_TERMS: int = 8
+
+    # [Project Views - 조회수 write-behind]
+    # 0이면 주기 반영 없이 조회마다 바로 반영
+    VIEW_FLUSH_INTERVAL: float = 5.0
+    VIEW_FLUSH_BATCH: int = 500
+    # 같은 사용자(또는 IP)의 재조회를 세지 않는 시간(초), 0이면 끔
+    VIEW_DEDUP_WINDOW: float = 0.0
+    VIEW_DEDUP_MAX_KEYS: int = 100000
+    # X-Forwarded-For에 IP를 붙이는 프록시(ALB) 수 - 오른쪽에서 이 번째 값을 클라이언트 IP로 사용, 0이면 접속 IP
+    TRUSTED_PROXIES: int = 1
+
     # [Security - JWT Settings]
     # Cognito는 RS256을 사용하므로 알고리즘을 고정합니다.
     JWT_ALGORITHM: str = "RS256"
@@ -1,4 +1,6 @@
 # app/core/deps.py
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,6 +9,8 @@ from app.core.database import AsyncSessionLocal
 
 # Swagger UI에서 'Authorize' 버튼을 통해 토큰을 입력받을 수 있게 해줍니다.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+# 비로그인도 허용하는 API용 (토큰이 없어도 401을 내지 않음)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
 async def get_db() -> AsyncSession:
     """
@@ -36,4 +40,17 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         )
     
     # 3. 인증된 유저의 정보를 반환 (나중에 클래스 객체로 변환 가능)
-    return payload
\ No newline at end of file
+    return payload
+
+
+async def get_optional_user(token: Optional[str] = Depends(optional_oauth2_scheme)) -> Optional[dict]:
+    """
+    토큰이 있고 검증에 성공하면 Cognito 페이로드, 없거나 유효하지 않으면 None
+    (비로그인도 볼 수 있는 API에서 로그인 사용자만 구분할 때 사용)
+    """
+    if not token:
+        return None
+    try:
+        return await cognito_verifier.verify_token(token)
+    except HTTPException:
+        return None
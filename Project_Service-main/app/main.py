@@ -14,6 +14,9 @@ from app.api.projects import router as projects_router
 from app.api.enriched_projects import router as enriched_router
 from app.api.project_crud import router as project_crud_router
 from app.api.applications import router as applications_router
+from app.utils.http_pool import http_pool
+from app.core.database import aws_manager
+from app.services.view_counter import view_counter
 
 app = FastAPI(
     title="Portforge Project Collaboration Platform API",
@@ -77,6 +80,29 @@ app.include_router(applications_router)  # /projects/{id}/applications 경로
 # 6. Explicitly include project router to ensure it's always available (temporarily disabled)
 # app.include_router(project_router, tags=["Projects"])
 
+# 서비스 간 통신용 HTTP 커넥션 풀 (프로세스당 1개, keep-alive 재사용)
+@app.on_event("startup")
+async def start_http_pool():
+    await http_pool.start()
+
+@app.on_event("shutdown")
+async def close_http_pool():
+    await http_pool.close()
+
+# 프로젝트 조회수 write-behind (종료 시 남은 조회수 반영)
+@app.on_event("startup")
+async def start_view_counter():
+    await view_counter.start()
+
+@app.on_event("shutdown")
+async def close_view_counter():
+    await view_counter.close()
+
+# 공유 AWS 클라이언트 (DynamoDB/S3 등) 종료
+@app.on_event("shutdown")
+async def close_aws_clients():
+    await aws_manager.close()
+
 # 전역 예외 핸들러: 한 번 등록하면 팀원들은 신경 안 써도 됨
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
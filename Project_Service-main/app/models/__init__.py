@@ -1,7 +1,9 @@
 # Project Service 모델 정의
 from .project_recruitment import (
     Project, 
+    ProjectCard,
     ProjectRecruitmentPosition, 
+    ProjectStack,
     ProjectType, 
     ProjectMethod, 
     ProjectStatus,
@@ -21,7 +23,9 @@ except ImportError:
 
 __all__ = [
     "Project",
+    "ProjectCard",
     "ProjectRecruitmentPosition",
+    "ProjectStack",
     "ProjectType",
     "ProjectMethod",
     "ProjectStatus",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, Enum, ForeignKey, Date
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, Enum, ForeignKey, Date, Index
 from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -67,6 +67,13 @@ class TechStack(enum.Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (created_at DESC, project_id DESC)
+        Index("ix_projects_created", "created_at", "project_id"),
+        Index("ix_projects_type_status_created", "type", "status", "created_at", "project_id"),
+        # 제목/설명 전문 검색 (한국어는 공백 없이 붙여 쓰므로 ngram 파서)
+        Index("ft_projects_title_description", "title", "description", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
 
     project_id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(CHAR(36), nullable=False, comment="팀장 ID")
@@ -87,6 +94,22 @@ class Project(Base):
     applications = relationship("Application", back_populates="project", cascade="all, delete-orphan")
 
 
+class ProjectCard(Base):
+    """
+    프로젝트 목록 카드 읽기 모델 (포지션에서 계산되는 값을 미리 저장)
+    포지션/지원 승인으로 모집 현황이 바뀔 때 app.services.project_cards가 갱신
+    """
+    __tablename__ = "project_cards"
+
+    project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    members = Column(String(255), nullable=False, default="0/0명", comment="예: 프론트엔드 1/3, 백엔드 0/2")
+    position = Column(String(20), nullable=False, default="미정", comment="대표 포지션")
+    tags = Column(Text, nullable=False, comment="JSON 배열: 전체 포지션 기술 스택")
+    positions = Column(Text, nullable=False, comment="JSON 배열: 목록 응답용 모집 포지션")
+    min_deadline = Column(Date, nullable=True, comment="가장 빠른 모집 마감일 (D-day는 조회 시 계산)")
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+
 class ProjectRecruitmentPosition(Base):
     __tablename__ = "project_recruitment_positions"
 
@@ -103,6 +126,21 @@ class ProjectRecruitmentPosition(Base):
     project = relationship("Project", back_populates="recruitment_positions")
 
 
+class ProjectStack(Base):
+    """
+    포지션별 기술 스택 (required_stacks JSON을 행으로 정규화, 스택 필터용)
+    포지션이 바뀔 때 app.services.project_stacks가 교체
+    """
+    __tablename__ = "project_stacks"
+    __table_args__ = (
+        Index("ix_project_stacks_stack_project", "stack", "project_id"),
+    )
+
+    project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+    position_type = Column(Enum(PositionType), primary_key=True)
+    stack = Column(String(50), primary_key=True)
+
+
 class Application(Base):
     __tablename__ = "applications"
 
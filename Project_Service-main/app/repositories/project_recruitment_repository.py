@@ -4,6 +4,11 @@ from sqlalchemy import select, and_, or_, func, update, delete
 from sqlalchemy.orm import selectinload
 from app.models.project_recruitment import Project as RecruitmentProject, ProjectRecruitmentPosition, ProjectStatus
 from app.schemas.project_recruitment import ProjectFilters
+from app.services.project_cards import refresh_project_cards
+from app.services.project_facets import project_facets
+from app.services.project_stacks import parse_stack_query, stack_filter
+from app.services.view_counter import view_counter
+from app.utils.keyset import after_cursor, decode_cursor
 from math import ceil
 
 
@@ -38,7 +43,9 @@ class ProjectRecruitmentRepository:
             )
             self.db.add(position)
         
+        await refresh_project_cards(self.db, [project.project_id])
         await self.db.commit()
+        project_facets.invalidate()
         await self.db.refresh(project)
         return project
 
@@ -64,27 +71,32 @@ class ProjectRecruitmentRepository:
         if filters.status:
             conditions.append(RecruitmentProject.status == filters.status)
         
-        if filters.tech_stack:
-            # Filter projects that have positions with specific tech stack
-            subquery = select(ProjectRecruitmentPosition.project_id).where(
-                ProjectRecruitmentPosition.tech_stack.ilike(f"%{filters.tech_stack}%")
-            )
-            conditions.append(RecruitmentProject.project_id.in_(subquery))  # Updated field name
+        stacks = parse_stack_query(filters.tech_stack)
+        if stacks:
+            # project_stacks (stack, project_id) 인덱스로 조회 (콤마 구분 여러 개면 stack_mode로 AND/OR)
+            conditions.append(stack_filter(stacks, filters.stack_mode))
         
         if conditions:
             query = query.where(and_(*conditions))
         
         # Get total count
-        count_query = select(func.count(RecruitmentProject.project_id))  # Updated field name
-        if conditions:
-            count_query = count_query.where(and_(*conditions))
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
+        # type/status 필터만 있으면 캐시된 GROUP BY 집계에서 계산 (요청마다 COUNT(*) 하지 않음)
+        if stacks:
+            count_query = select(func.count(RecruitmentProject.project_id)).where(and_(*conditions))
+            total_result = await self.db.execute(count_query)
+            total = total_result.scalar()
+        else:
+            total = await project_facets.total(self.db, filters.type, filters.status)
         
         # Apply pagination and ordering
-        query = query.order_by(RecruitmentProject.created_at.desc())
-        query = query.offset((filters.page - 1) * filters.size).limit(filters.size)
+        # cursor가 있으면 키셋 (created_at, project_id)으로 이어서 조회, 없으면 page 기준 OFFSET
+        query = query.order_by(RecruitmentProject.created_at.desc(), RecruitmentProject.project_id.desc())
+        if filters.cursor:
+            position = decode_cursor(filters.cursor)
+            query = query.where(after_cursor(RecruitmentProject.created_at, RecruitmentProject.project_id, position))
+        elif filters.page > 1:
+            query = query.offset((filters.page - 1) * filters.size)
+        query = query.limit(filters.size)
         
         result = await self.db.execute(query)
         projects = result.scalars().all()
@@ -121,20 +133,16 @@ class ProjectRecruitmentRepository:
                     required_count=position_data["required_count"]
                 )
                 self.db.add(position)
+            await refresh_project_cards(self.db, [project_id])
         
         await self.db.commit()
+        project_facets.invalidate()
         await self.db.refresh(project)
         return project
 
-    async def increment_views(self, project_id: int) -> bool:
-        """Increment project views count"""
-        result = await self.db.execute(
-            update(RecruitmentProject)
-            .where(RecruitmentProject.project_id == project_id)  # Updated field name
-            .values(views=RecruitmentProject.views + 1)
-        )
-        await self.db.commit()
-        return result.rowcount > 0
+    async def increment_views(self, project_id: int, viewer: Optional[str] = None) -> bool:
+        """Increment project views count (write-behind: view_counter가 주기적으로 일괄 반영)"""
+        return view_counter.record(project_id, viewer)
 
     async def update_project_status(self, project_id: int, status: ProjectStatus) -> bool:
         """Update project status"""
@@ -144,6 +152,7 @@ class ProjectRecruitmentRepository:
             .values(status=status)
         )
         await self.db.commit()
+        project_facets.invalidate()
         return result.rowcount > 0
 
     async def is_project_owner(self, project_id: int, user_id: int) -> bool:
@@ -167,4 +176,5 @@ class ProjectRecruitmentRepository:
             delete(RecruitmentProject).where(RecruitmentProject.project_id == project_id)  # Updated field name
         )
         await self.db.commit()
+        project_facets.invalidate()
         return result.rowcount > 0
\ No newline at end of file
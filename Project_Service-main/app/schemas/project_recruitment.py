@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime, date
 from enum import Enum
 
@@ -191,6 +191,7 @@ class ProjectListResponse(BaseModel):
     page: int = Field(..., description="현재 페이지")
     size: int = Field(..., description="페이지 크기")
     total_pages: int = Field(..., description="전체 페이지 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
 
 
 class ApplicationListResponse(BaseModel):
@@ -205,9 +206,11 @@ class ApplicationListResponse(BaseModel):
 class ProjectFilters(BaseModel):
     type: Optional[ProjectType] = Field(None, description="프로젝트 타입 필터")
     status: Optional[ProjectStatus] = Field(None, description="프로젝트 상태 필터")
-    tech_stack: Optional[str] = Field(None, description="기술 스택 필터")
+    tech_stack: Optional[str] = Field(None, description="기술 스택 필터 (콤마 구분)")
+    stack_mode: Literal["any", "all"] = Field("any", description="여러 스택: any = 하나라도 포함, all = 모두 포함")
     page: int = Field(1, ge=1, description="페이지 번호")
     size: int = Field(10, ge=1, le=100, description="페이지 크기")
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (있으면 page 대신 사용)")
 
 
 class ApplicationFilters(BaseModel):
@@ -0,0 +1,126 @@
+"""
+프로젝트 목록 카드 읽기 모델 (project_cards)
+
+목록 요청마다 프로젝트별로 포지션을 모두 읽어 인원 문자열("프론트엔드 1/3"),
+기술 스택 태그(required_stacks JSON 파싱), 마감 D-day를 다시 계산하던 것을
+포지션이 바뀌는 쓰기 시점에 한 번 계산해 project_cards에 저장합니다.
+
+- 갱신 시점: 프로젝트 생성, 포지션 수정, 지원 승인(current_count 변경)
+  → 쓰기와 같은 트랜잭션에서 refresh_project_cards() 호출 (커밋 전)
+  → 스택 필터용 project_stacks 행도 같은 포지션으로 함께 교체
+- 마감 라벨(D-3, D-Day, 모집마감)은 날짜가 지나며 바뀌므로 저장하지 않고
+  min_deadline에서 조회 시 계산 (deadline_label)
+- 카드가 없는 프로젝트(읽기 모델 도입 전 데이터 등)는 목록 조회 때 만들어 저장
+"""
+import json
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project_recruitment import ProjectCard, ProjectRecruitmentPosition
+from app.services.project_stacks import parse_stacks, replace_project_stacks
+
+# 포지션 한글명
+POSITION_NAMES_KR = {
+    "FRONTEND": "프론트엔드",
+    "BACKEND": "백엔드",
+    "DESIGN": "디자인",
+    "DB": "DB",
+    "INFRA": "인프라",
+    "ETC": "기타",
+    "STUDY_MEMBER": "스터디원",
+}
+
+
+def deadline_label(min_deadline: Optional[date], today: Optional[date] = None) -> str:
+    """가장 빠른 모집 마감일 → 목록 마감 라벨"""
+    if min_deadline is None:
+        return "D-?"
+    diff_days = (min_deadline - (today or date.today())).days
+    if diff_days > 0:
+        return f"D-{diff_days}"
+    if diff_days == 0:
+        return "D-Day"
+    return "모집마감"
+
+
+def build_card(project_id: int, positions: Iterable[ProjectRecruitmentPosition]) -> Dict[str, Any]:
+    """포지션 목록 → project_cards 행 값"""
+    members_parts: List[str] = []
+    tags: List[str] = []
+    items: List[Dict[str, Any]] = []
+    deadlines: List[date] = []
+
+    for pos in positions:
+        pos_name = pos.position_type.value if pos.position_type else "미정"
+        current = pos.current_count or 0
+        target = pos.target_count or 0
+        stacks = parse_stacks(pos.required_stacks)
+        members_parts.append(f"{POSITION_NAMES_KR.get(pos_name, pos_name)} {current}/{target}")
+        tags.extend(s for s in stacks if s not in tags)
+        if pos.recruitment_deadline:
+            deadlines.append(pos.recruitment_deadline)
+        items.append({
+            "position_type": pos.position_type.value if pos.position_type else "UNKNOWN",
+            "required_stacks": stacks,
+            "target_count": target,
+            "current_count": current,
+            "recruitment_deadline": pos.recruitment_deadline.isoformat() if pos.recruitment_deadline else None,
+        })
+
+    return {
+        "project_id": project_id,
+        "members": ", ".join(members_parts) if members_parts else "0/0명",
+        "position": items[0]["position_type"] if items else "미정",
+        "tags": json.dumps(tags, ensure_ascii=False),
+        "positions": json.dumps(items, ensure_ascii=False),
+        "min_deadline": min(deadlines) if deadlines else None,
+    }
+
+
+async def refresh_project_cards(db: AsyncSession, project_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    프로젝트들의 카드(+ project_stacks)를 현재 포지션 기준으로 다시 계산해 저장 (커밋은 호출한 쪽에서)
+    반환: project_id → 저장한 행 값
+    """
+    ids = sorted(set(project_ids))
+    if not ids:
+        return {}
+
+    result = await db.execute(
+        select(ProjectRecruitmentPosition)
+        .where(ProjectRecruitmentPosition.project_id.in_(ids))
+        .order_by(ProjectRecruitmentPosition.project_id, ProjectRecruitmentPosition.position_type)
+    )
+    by_project: Dict[int, List[ProjectRecruitmentPosition]] = {pid: [] for pid in ids}
+    for pos in result.scalars().all():
+        by_project[pos.project_id].append(pos)
+
+    await replace_project_stacks(db, by_project)
+
+    rows = [build_card(pid, positions) for pid, positions in by_project.items()]
+    stmt = insert(ProjectCard).values(rows)
+    await db.execute(stmt.on_duplicate_key_update(
+        members=stmt.inserted.members,
+        position=stmt.inserted.position,
+        tags=stmt.inserted.tags,
+        positions=stmt.inserted.positions,
+        min_deadline=stmt.inserted.min_deadline,
+        updated_at=func.now(),
+    ))
+    return {row["project_id"]: row for row in rows}
+
+
+def card_fields(card: Any) -> Dict[str, Any]:
+    """ProjectCard(또는 refresh_project_cards 반환 행) → 목록 응답 필드"""
+    get = card.get if isinstance(card, dict) else lambda key: getattr(card, key)
+    return {
+        "deadline": deadline_label(get("min_deadline")),
+        "members": get("members"),
+        "tags": json.loads(get("tags") or "[]"),
+        "position": get("position"),
+        "recruitment_positions": json.loads(get("positions") or "[]"),
+    }
@@ -0,0 +1,102 @@
+"""
+프로젝트 목록 필터별 개수 (facet) 캐시
+
+목록 요청마다 COUNT(*)를 따로 실행하던 것을, 타입/상태 조합별 개수를
+`GROUP BY type, status` 한 번으로 구해 PROJECT_FACET_CACHE_TTL초 동안 재사용합니다.
+
+- 필터(type/status)가 무엇이든 전체 개수는 이 표의 합으로 계산
+- 캐시가 만료된 순간 동시 요청이 몰려도 집계 쿼리는 1번만 실행 (Lock)
+- 이 Pod에서 프로젝트가 생성/삭제되면 invalidate()로 바로 비움
+  (다른 Pod는 TTL 안에 반영)
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.project_recruitment import Project, ProjectStatus, ProjectType
+
+logger = logging.getLogger(__name__)
+
+
+def _key(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.value if hasattr(value, "value") else str(value)
+
+
+class ProjectFacetCache:
+    """타입/상태별 프로젝트 수 (프로세스 로컬 캐시)"""
+
+    def __init__(self):
+        # {"PROJECT": {"RECRUITING": 3, ...}, "STUDY": {...}}
+        self._counts: Optional[Dict[str, Dict[str, int]]] = None
+        self._expires = 0.0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self) -> None:
+        self._expires = 0.0
+
+    async def counts(self, db: AsyncSession) -> Dict[str, Dict[str, int]]:
+        if self._counts is not None and self._expires > time.monotonic():
+            self.hits += 1
+            return self._counts
+        async with self._lock:
+            # 기다리는 동안 다른 요청이 갱신했으면 그대로 사용
+            if self._counts is not None and self._expires > time.monotonic():
+                self.hits += 1
+                return self._counts
+            self.misses += 1
+            result = await db.execute(
+                select(Project.type, Project.status, func.count()).group_by(Project.type, Project.status)
+            )
+            counts: Dict[str, Dict[str, int]] = {t.value: {} for t in ProjectType}
+            for type_, status, n in result.all():
+                counts.setdefault(_key(type_), {})[_key(status)] = n
+            self._counts = counts
+            self._expires = time.monotonic() + settings.PROJECT_FACET_CACHE_TTL
+            return counts
+
+    async def total(self, db: AsyncSession, type: Any = None, status: Any = None) -> int:
+        """필터 조합에 해당하는 프로젝트 수"""
+        counts = await self.counts(db)
+        type_key, status_key = _key(type), _key(status)
+        return sum(
+            n
+            for t, by_status in counts.items() if type_key is None or t == type_key
+            for s, n in by_status.items() if status_key is None or s == status_key
+        )
+
+    async def facets(self, db: AsyncSession) -> Dict[str, Any]:
+        """API 응답용 요약 (전체/타입별/상태별/조합별)"""
+        counts = await self.counts(db)
+        by_status = {s.value: 0 for s in ProjectStatus}
+        for per_type in counts.values():
+            for s, n in per_type.items():
+                by_status[s] = by_status.get(s, 0) + n
+        return {
+            "total": sum(by_status.values()),
+            "by_type": {t: sum(per_type.values()) for t, per_type in counts.items()},
+            "by_status": by_status,
+            "by_type_status": counts,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "ttl": settings.PROJECT_FACET_CACHE_TTL,
+            "cached": self._counts is not None and self._expires > time.monotonic(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+# 싱글톤 인스턴스
+project_facets = ProjectFacetCache()
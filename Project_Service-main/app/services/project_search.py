@@ -0,0 +1,39 @@
+"""
+프로젝트 제목/설명 전문 검색 (MySQL FULLTEXT, ngram 파서)
+
+projects(title, description)에 `FULLTEXT ... WITH PARSER ngram` 인덱스를 두고
+MATCH ... AGAINST (BOOLEAN MODE)로 검색합니다.
+ngram 파서는 공백 없이 붙여 쓰는 한국어도 2글자 단위(ngram_token_size=2)로 색인하므로
+"리액트스터디" 같은 제목에서 "리액트"도 찾을 수 있습니다.
+
+- 검색어를 공백으로 나눈 각 단어를 구문(+"단어")으로 모두 요구 (AND)
+- 단어는 ngram_token_size(PROJECT_SEARCH_MIN_LENGTH)보다 짧으면 색인에 없으므로 제외
+- BOOLEAN MODE 연산자 문자는 제거해 사용자가 입력한 기호가 문법으로 해석되지 않도록 함
+"""
+import re
+from typing import List
+
+from sqlalchemy.dialects.mysql import match
+
+from app.core.config import settings
+from app.models.project_recruitment import Project
+
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+def search_terms(q: str) -> List[str]:
+    """검색어 → 검색할 단어 목록 (연산자 제거, 짧은 단어 제외, 중복 제거)"""
+    terms: List[str] = []
+    for term in _BOOLEAN_OPERATORS.sub(" ", q or "").split():
+        if len(term) >= settings.PROJECT_SEARCH_MIN_LENGTH and term not in terms:
+            terms.append(term)
+    return terms[:settings.PROJECT_SEARCH_MAX_TERMS]
+
+
+def boolean_query(terms: List[str]) -> str:
+    return " ".join(f'+"{term}"' for term in terms)
+
+
+def search_score(terms: List[str]):
+    """관련도 점수 식 (WHERE score > 0 / ORDER BY score DESC 에 같은 식을 써야 인덱스 사용)"""
+    return match(Project.title, Project.description, against=boolean_query(terms)).in_boolean_mode()
@@ -0,0 +1,78 @@
+"""
+기술 스택 필터용 정규화 테이블 (project_stacks)
+
+required_stacks는 포지션별 JSON 문자열이라 `LIKE '%React%'`로만 찾을 수 있었고
+(인덱스 사용 불가, "React"가 "React Native"에도 걸림) 프로젝트 수에 비례해 느려졌습니다.
+포지션의 스택을 (project_id, position_type, stack) 행으로 풀어 저장하고
+(stack, project_id) 인덱스로 조회합니다.
+
+- 갱신: 포지션이 바뀔 때 refresh_project_cards()가 카드와 함께 replace_project_stacks() 호출
+- 필터: stack_filter(stacks, "any") → 하나라도 포함 (OR)
+        stack_filter(stacks, "all") → 모두 포함 (AND, GROUP BY + HAVING)
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project_recruitment import Project, ProjectRecruitmentPosition, ProjectStack
+
+# project_stacks.stack 컬럼 길이
+STACK_MAX_LENGTH = 50
+
+STACK_MODES = ("any", "all")
+
+
+def parse_stacks(raw: Optional[str]) -> List[str]:
+    """required_stacks 텍스트 → 스택 목록 (JSON 배열, 예전 데이터는 콤마 구분)"""
+    if not raw:
+        return []
+    try:
+        stacks = json.loads(raw)
+        return [str(s) for s in stacks] if isinstance(stacks, list) else []
+    except ValueError:
+        return [s.strip() for s in raw.split(",") if s.strip()]
+
+
+def parse_stack_query(value: Optional[str]) -> List[str]:
+    """쿼리 파라미터 "React,TypeScript" → 중복 없는 스택 목록"""
+    stacks: List[str] = []
+    for part in (value or "").split(","):
+        part = part.strip()[:STACK_MAX_LENGTH]
+        if part and part.lower() not in (s.lower() for s in stacks):
+            stacks.append(part)
+    return stacks
+
+
+def stack_rows(project_id: int, positions: Iterable[ProjectRecruitmentPosition]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for pos in positions:
+        seen = set()
+        for stack in parse_stacks(pos.required_stacks):
+            stack = stack.strip()[:STACK_MAX_LENGTH]
+            # MySQL 기본 collation은 대소문자를 구분하지 않으므로 PK 중복도 같은 기준으로 제거
+            if stack and stack.lower() not in seen:
+                seen.add(stack.lower())
+                rows.append({"project_id": project_id, "position_type": pos.position_type, "stack": stack})
+    return rows
+
+
+async def replace_project_stacks(db: AsyncSession, positions_by_project: Dict[int, List[ProjectRecruitmentPosition]]) -> None:
+    """프로젝트들의 스택 행을 현재 포지션 기준으로 교체 (커밋은 호출한 쪽에서)"""
+    if not positions_by_project:
+        return
+    await db.execute(delete(ProjectStack).where(ProjectStack.project_id.in_(list(positions_by_project))))
+    rows = [row for pid, positions in positions_by_project.items() for row in stack_rows(pid, positions)]
+    if rows:
+        await db.execute(insert(ProjectStack), rows)
+
+
+def stack_filter(stacks: List[str], mode: str = "any"):
+    """Project.project_id 조건: 스택을 하나라도(any) / 모두(all) 요구하는 프로젝트"""
+    matched = select(ProjectStack.project_id).where(ProjectStack.stack.in_(stacks))
+    if mode == "all" and len(stacks) > 1:
+        matched = matched.group_by(ProjectStack.project_id).having(
+            func.count(func.distinct(ProjectStack.stack)) == len(stacks)
+        )
+    return Project.project_id.in_(matched)
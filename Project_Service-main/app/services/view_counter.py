@@ -0,0 +1,160 @@
+"""
+프로젝트 조회수 write-behind 카운터
+
+상세 조회마다 `views = views + 1` UPDATE + 커밋을 하면 읽기 요청이 행 잠금을 잡는 쓰기가 되고,
+인기 프로젝트는 동시 조회가 같은 행에서 잠금 대기를 합니다.
+조회수는 메모리에 프로젝트별로 모아두었다가 VIEW_FLUSH_INTERVAL초마다
+`UPDATE projects SET views = views + CASE project_id WHEN .. THEN .. END WHERE project_id IN (..)`
+한 문장(VIEW_FLUSH_BATCH개 단위)으로 반영합니다.
+
+- 상세 조회는 DB에 쓰지 않음 (응답의 views는 DB 값 + 이 Pod에서 아직 반영 안 된 수)
+- 반영 실패 시 모은 수를 다시 넣어 다음 주기에 재시도
+- Pod 종료(shutdown) 시 남은 수 반영
+- VIEW_DEDUP_WINDOW > 0이면 같은 사용자(또는 IP)가 그 시간 안에 다시 본 것은 세지 않음 (Pod 단위)
+- 프로젝트 ID 오름차순으로 갱신해 여러 Pod가 동시에 반영해도 잠금 순서가 같음 (데드락 방지)
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import case, update
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.project_recruitment import Project
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """프로젝트별 조회수 누적 + 주기적 일괄 반영 (프로세스 로컬)"""
+
+    def __init__(self):
+        self._pending: Dict[int, int] = {}
+        # (project_id, viewer) -> 중복 제외 만료 시각 (오래된 순)
+        self._seen: "OrderedDict[Tuple[int, str], float]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self.recorded = 0
+        self.deduped = 0
+        self.flushes = 0
+        self.flushed_views = 0
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running or settings.VIEW_FLUSH_INTERVAL <= 0:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        await self.flush()
+
+    # -----------------------------------------------------------------
+    # 기록
+    # -----------------------------------------------------------------
+    def _is_duplicate(self, project_id: int, viewer: Optional[str]) -> bool:
+        window = settings.VIEW_DEDUP_WINDOW
+        if window <= 0 or not viewer:
+            return False
+        now = time.monotonic()
+        # 만료된 항목은 앞쪽(오래된 순)부터 정리
+        while self._seen:
+            _, expires = next(iter(self._seen.items()))
+            if expires > now and len(self._seen) < settings.VIEW_DEDUP_MAX_KEYS:
+                break
+            self._seen.popitem(last=False)
+        key = (project_id, viewer)
+        if self._seen.get(key, 0.0) > now:
+            return True
+        self._seen[key] = now + window
+        self._seen.move_to_end(key)
+        return False
+
+    def record(self, project_id: int, viewer: Optional[str] = None) -> bool:
+        """조회 1회 기록 (중복 제외되면 False)"""
+        if self._is_duplicate(project_id, viewer):
+            self.deduped += 1
+            return False
+        self._pending[project_id] = self._pending.get(project_id, 0) + 1
+        self.recorded += 1
+        if not self.running:
+            # 주기 반영을 쓰지 않는 설정이면 바로 반영 (기존 동작)
+            asyncio.get_running_loop().create_task(self.flush())
+        return True
+
+    def pending(self, project_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        return self._pending.get(project_id, 0)
+
+    # -----------------------------------------------------------------
+    # 반영
+    # -----------------------------------------------------------------
+    async def flush(self) -> int:
+        """모은 조회수를 DB에 반영하고 반영한 조회 수를 반환"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            ids = sorted(batch)
+            written = 0
+            try:
+                async with AsyncSessionLocal() as db:
+                    for i in range(0, len(ids), settings.VIEW_FLUSH_BATCH):
+                        chunk = ids[i:i + settings.VIEW_FLUSH_BATCH]
+                        increment = case({pid: batch[pid] for pid in chunk}, value=Project.project_id, else_=0)
+                        await db.execute(
+                            update(Project)
+                            .where(Project.project_id.in_(chunk))
+                            # 조회는 수정이 아니므로 updated_at(onupdate)은 그대로 둠
+                            .values(views=Project.views + increment, updated_at=Project.updated_at)
+                            .execution_options(synchronize_session=False)
+                        )
+                        written += sum(batch[pid] for pid in chunk)
+                    await db.commit()
+            except Exception as e:
+                # 커밋 전 실패면 전부 되돌려 다음 주기에 재시도
+                self.errors += 1
+                for pid, n in batch.items():
+                    self._pending[pid] = self._pending.get(pid, 0) + n
+                logger.warning(f"조회수 반영 실패 ({len(batch)}개 프로젝트, 다음 주기 재시도): {e}")
+                return 0
+            self.flushes += 1
+            self.flushed_views += written
+            return written
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.VIEW_FLUSH_INTERVAL)
+            await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval": settings.VIEW_FLUSH_INTERVAL,
+            "dedup_window": settings.VIEW_DEDUP_WINDOW,
+            "pending_projects": len(self._pending),
+            "pending_views": sum(self._pending.values()),
+            "dedup_keys": len(self._seen),
+            "recorded": self.recorded,
+            "deduped": self.deduped,
+            "flushes": self.flushes,
+            "flushed_views": self.flushed_views,
+            "errors": self.errors,
+        }
+
+
+# 싱글톤 인스턴스
+view_counter = ViewCounter()
@@ -0,0 +1,23 @@
+"""
+클라이언트 IP 식별 (Support/Ai rate_limit.py의 client_ip와 같은 규칙)
+
+ALB 등 프록시는 X-Forwarded-For 끝에 실제 접속 IP를 붙이므로,
+클라이언트가 마음대로 넣을 수 있는 앞부분은 믿지 않고 오른쪽에서 TRUSTED_PROXIES번째 값을 사용합니다.
+"""
+from typing import Optional
+
+from app.core.config import settings
+
+
+def client_ip(headers, fallback: Optional[str]) -> Optional[str]:
+    """
+    클라이언트 IP
+    프록시 뒤(TRUSTED_PROXIES > 0)인데 헤더가 없으면 클러스터 내부 서비스 간 호출로 보고 None
+    """
+    hops = settings.TRUSTED_PROXIES
+    if hops <= 0:
+        return fallback
+    parts = [p.strip() for p in (headers.get("x-forwarded-for") or "").split(",") if p.strip()]
+    if not parts:
+        return None
+    return parts[-min(hops, len(parts))]
@@ -0,0 +1,75 @@
+"""
+프로젝트 목록 키셋(커서) 페이지네이션
+
+OFFSET은 앞 페이지 행을 모두 읽고 버리므로 뒤 페이지일수록 느려집니다.
+정렬 키 (created_at DESC, project_id DESC)의 마지막 값을 커서로 넘겨
+다음 페이지를 `WHERE (created_at, project_id) < (t, id)` 로 이어서 읽습니다.
+→ 인덱스(ix_projects_created / ix_projects_type_status_created)에서 바로 시작 위치를 찾으므로
+  1페이지와 500페이지의 비용이 같음
+
+커서는 `{"t": created_at ISO, "i": project_id}` JSON의 URL-safe base64 문자열입니다.
+검색 결과는 관련도 순이라 `{"s": score, "i": project_id}` 커서를 씁니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+
+def _encode(data: Dict[str, Any]) -> str:
+    raw = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Dict[str, Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def encode_cursor(created_at: datetime, project_id: int) -> str:
+    return _encode({"t": created_at.isoformat(), "i": int(project_id)})
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 → (created_at, project_id), 형식이 잘못되면 ValueError"""
+    try:
+        data = _decode(cursor)
+        return datetime.fromisoformat(data["t"]), int(data["i"])
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+
+def encode_score_cursor(score: float, project_id: int) -> str:
+    """검색 결과 커서 (관련도 점수 DESC, project_id DESC)"""
+    return _encode({"s": float(score), "i": int(project_id)})
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, int]:
+    """검색 커서 → (score, project_id), 형식이 잘못되면 ValueError"""
+    try:
+        data = _decode(cursor)
+        return float(data["s"]), int(data["i"])
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+
+def after_cursor(created_col: Any, id_col: Any, cursor: Tuple[datetime, int]):
+    """정렬 키가 커서보다 뒤(더 오래된)인 행 조건"""
+    created_at, project_id = cursor
+    return or_(created_col < created_at, and_(created_col == created_at, id_col < project_id))
+
+
+def after_score_cursor(score_expr: Any, id_col: Any, cursor: Tuple[float, int]):
+    """관련도 점수 순서에서 커서보다 뒤인 행 조건"""
+    score, project_id = cursor
+    return or_(score_expr < score, and_(score_expr == score, id_col < project_id))
+
+
+def next_cursor(projects: Sequence[Any], size: int) -> Optional[str]:
+    """가득 찬 페이지면 마지막 행 기준 다음 커서, 아니면 None (마지막 페이지)"""
+    if len(projects) < size or not projects:
+        return None
+    last = projects[-1]
+    return encode_cursor(last.created_at, last.project_id)
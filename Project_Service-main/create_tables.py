@@ -27,7 +27,7 @@ def create_tables():
         engine = create_engine(DATABASE_URL, echo=True)
         Base = declarative_base()
         
-        from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, BigInteger, Text, Boolean, Date, ForeignKey
+        from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, BigInteger, Text, Boolean, Date, ForeignKey, Index
         from sqlalchemy.dialects.mysql import CHAR
         import enum
         
@@ -62,6 +62,11 @@ def create_tables():
         
         class Project(Base):
             __tablename__ = "projects"
+            __table_args__ = (
+                Index("ix_projects_created", "created_at", "project_id"),
+                Index("ix_projects_type_status_created", "type", "status", "created_at", "project_id"),
+                Index("ft_projects_title_description", "title", "description", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+            )
             
             project_id = Column(BigInteger, primary_key=True, autoincrement=True)
             user_id = Column(CHAR(36), nullable=False, comment="팀장 ID")
@@ -77,6 +82,17 @@ def create_tables():
             created_at = Column(DateTime, nullable=False, default=func.now())
             updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
         
+        class ProjectCard(Base):
+            __tablename__ = "project_cards"
+            
+            project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+            members = Column(String(255), nullable=False, default="0/0명")
+            position = Column(String(20), nullable=False, default="미정")
+            tags = Column(Text, nullable=False)
+            positions = Column(Text, nullable=False)
+            min_deadline = Column(Date, nullable=True)
+            updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+        
         class ProjectRecruitmentPosition(Base):
             __tablename__ = "project_recruitment_positions"
             
@@ -90,6 +106,16 @@ def create_tables():
             created_at = Column(DateTime, nullable=False, default=func.now())
             updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
         
+        class ProjectStack(Base):
+            __tablename__ = "project_stacks"
+            __table_args__ = (
+                Index("ix_project_stacks_stack_project", "stack", "project_id"),
+            )
+            
+            project_id = Column(BigInteger, ForeignKey("projects.project_id", ondelete="CASCADE"), primary_key=True)
+            position_type = Column(SQLEnum(PositionType), primary_key=True)
+            stack = Column(String(50), primary_key=True)
+        
         class Application(Base):
             __tablename__ = "applications"
             
@@ -0,0 +1,35 @@
+"""Project list keyset indexes
+
+Revision ID: 002_project_list_indexes
+Revises: 001_create_project_tables
+Create Date: 2026-10-17
+
+프로젝트 목록 키셋 페이지네이션용 인덱스:
+- ix_projects_created: 필터 없는 메인 목록 (created_at DESC, project_id DESC)
+- ix_projects_type_status_created: 타입/상태 필터 목록
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_project_list_indexes'
+down_revision: Union[str, Sequence[str], None] = '001_create_project_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add project list indexes."""
+    op.create_index('ix_projects_created', 'projects', ['created_at', 'project_id'], unique=False)
+    op.create_index(
+        'ix_projects_type_status_created', 'projects',
+        ['type', 'status', 'created_at', 'project_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop project list indexes."""
+    op.drop_index('ix_projects_type_status_created', table_name='projects')
+    op.drop_index('ix_projects_created', table_name='projects')
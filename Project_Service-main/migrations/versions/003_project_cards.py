@@ -0,0 +1,40 @@
+"""Project card read model
+
+Revision ID: 003_project_cards
+Revises: 002_project_list_indexes
+Create Date: 2026-10-17
+
+project_cards: 프로젝트 목록 카드에 쓰는 포지션 계산 값(인원 문자열, 태그, 포지션 목록, 최소 마감일)
+- 기존 프로젝트의 카드는 목록 조회 때 없는 것부터 만들어 채움 (app.services.project_cards)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_project_cards'
+down_revision: Union[str, Sequence[str], None] = '002_project_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create project_cards table."""
+    op.create_table('project_cards',
+        sa.Column('project_id', sa.BigInteger(), nullable=False),
+        sa.Column('members', sa.String(length=255), nullable=False, comment='예: 프론트엔드 1/3, 백엔드 0/2'),
+        sa.Column('position', sa.String(length=20), nullable=False, comment='대표 포지션'),
+        sa.Column('tags', sa.Text(), nullable=False, comment='JSON 배열: 전체 포지션 기술 스택'),
+        sa.Column('positions', sa.Text(), nullable=False, comment='JSON 배열: 목록 응답용 모집 포지션'),
+        sa.Column('min_deadline', sa.Date(), nullable=True, comment='가장 빠른 모집 마감일 (D-day는 조회 시 계산)'),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id')
+    )
+
+
+def downgrade() -> None:
+    """Drop project_cards table."""
+    op.drop_table('project_cards')
@@ -0,0 +1,70 @@
+"""Normalized project_stacks table
+
+Revision ID: 004_project_stacks
+Revises: 003_project_cards
+Create Date: 2026-10-17
+
+project_stacks: 포지션별 기술 스택 (required_stacks JSON → 행), 스택 필터용
+- (stack, project_id) 인덱스로 LIKE '%...%' 서브쿼리 대신 인덱스 조회
+- 기존 포지션의 required_stacks를 읽어 채움 (backfill)
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_project_stacks'
+down_revision: Union[str, Sequence[str], None] = '003_project_cards'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STACK_MAX_LENGTH = 50
+BACKFILL_CHUNK = 1000
+
+
+def _parse_stacks(raw):
+    """required_stacks 텍스트 → 스택 목록 (JSON 배열, 예전 데이터는 콤마 구분)"""
+    if not raw:
+        return []
+    try:
+        stacks = json.loads(raw)
+        return [str(s) for s in stacks] if isinstance(stacks, list) else []
+    except ValueError:
+        return [s.strip() for s in raw.split(",") if s.strip()]
+
+
+def upgrade() -> None:
+    """Create project_stacks table and backfill from required_stacks."""
+    project_stacks = op.create_table('project_stacks',
+        sa.Column('project_id', sa.BigInteger(), nullable=False),
+        sa.Column('position_type', sa.Enum('FRONTEND', 'BACKEND', 'DB', 'INFRA', 'DESIGN', 'ETC', 'STUDY_MEMBER', name='positiontype'), nullable=False),
+        sa.Column('stack', sa.String(length=STACK_MAX_LENGTH), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'position_type', 'stack')
+    )
+    op.create_index('ix_project_stacks_stack_project', 'project_stacks', ['stack', 'project_id'], unique=False)
+
+    # Backfill: 기존 포지션의 required_stacks → project_stacks
+    positions = op.get_bind().execute(sa.text(
+        "SELECT project_id, position_type, required_stacks FROM project_recruitment_positions "
+        "WHERE required_stacks IS NOT NULL AND required_stacks <> ''"
+    ))
+    rows = []
+    for project_id, position_type, required_stacks in positions:
+        seen = set()
+        for stack in _parse_stacks(required_stacks):
+            stack = stack.strip()[:STACK_MAX_LENGTH]
+            if stack and stack.lower() not in seen:
+                seen.add(stack.lower())
+                rows.append({"project_id": project_id, "position_type": position_type, "stack": stack})
+    for i in range(0, len(rows), BACKFILL_CHUNK):
+        op.bulk_insert(project_stacks, rows[i:i + BACKFILL_CHUNK])
+
+
+def downgrade() -> None:
+    """Drop project_stacks table."""
+    op.drop_index('ix_project_stacks_stack_project', table_name='project_stacks')
+    op.drop_table('project_stacks')
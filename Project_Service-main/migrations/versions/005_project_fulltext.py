@@ -0,0 +1,30 @@
+"""Project title/description FULLTEXT index
+
+Revision ID: 005_project_fulltext
+Revises: 004_project_stacks
+Create Date: 2026-10-17
+
+프로젝트 검색(GET /projects/search)용 FULLTEXT 인덱스 (ngram 파서, 한국어 지원)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_project_fulltext'
+down_revision: Union[str, Sequence[str], None] = '004_project_stacks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add FULLTEXT (ngram) index on projects.title/description."""
+    op.execute(
+        "ALTER TABLE projects ADD FULLTEXT INDEX ft_projects_title_description (title, description) WITH PARSER ngram"
+    )
+
+
+def downgrade() -> None:
+    """Drop FULLTEXT index."""
+    op.drop_index('ft_projects_title_description', table_name='projects')
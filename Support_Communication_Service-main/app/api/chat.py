@@ -4,6 +4,7 @@ from datetime import datetime
 from app.schemas.chat import ChatLogResponse
 import boto3
 from app.core.config import settings
+from app.services.chat_service import build_chat_item, list_chat_messages
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
@@ -27,51 +28,25 @@ async def get_chat_logs(
     team_id: int,
     start_time: Optional[str] = Query(None, description="시작 시간 (ISO format)"),
     end_time: Optional[str] = Query(None, description="종료 시간 (ISO format)"),
-    limit: int = Query(100, description="조회할 메시지 수")
+    limit: Optional[int] = Query(100, description="조회할 메시지 수 (기간 지정 시 None이면 전체)")
 ):
     """팀 채팅 로그 조회 (AI 서비스에서 회의록 생성용)"""
     
     try:
-        dynamodb = get_dynamodb_client()
-        
-        # DynamoDB 쿼리 파라미터 구성
-        key_condition = f"project_id = :project_id"
-        expression_values = {
-            ":project_id": {"N": str(team_id)}
-        }
-        
-        # 시간 범위 필터 추가
-        if start_time and end_time:
-            key_condition += " AND #timestamp BETWEEN :start_time AND :end_time"
-            expression_values.update({
-                ":start_time": {"S": start_time},
-                ":end_time": {"S": end_time}
-            })
-        
-        # DynamoDB 쿼리 실행
-        response = dynamodb.query(
-            TableName="team_chats",
-            KeyConditionExpression=key_condition,
-            ExpressionAttributeValues=expression_values,
-            ExpressionAttributeNames={
-                "#timestamp": "timestamp"
-            } if start_time and end_time else None,
-            Limit=limit,
-            ScanIndexForward=True  # 시간순 정렬
-        )
-        
-        # 결과 변환
-        chat_logs = []
-        for item in response.get('Items', []):
-            chat_logs.append(ChatLogResponse(
-                message_id=item.get('message_id', {}).get('S', ''),
-                user_id=item.get('user_id', {}).get('S', ''),
-                message=item.get('message', {}).get('S', ''),
-                timestamp=item.get('timestamp', {}).get('S', ''),
-                created_at=item.get('created_at', {}).get('S', '')
-            ))
+        # chat_service가 LastEvaluatedKey를 따라가며 페이지를 모두 조회
+        # (기간 없이 limit만 주면 최신 메시지 limit개)
+        messages = await list_chat_messages(team_id, limit=limit, start_time=start_time, end_time=end_time)
         
-        return chat_logs
+        return [
+            ChatLogResponse(
+                message_id=m.get("message_id") or "",
+                user_id=m.get("user_id") or "",
+                message=m.get("message") or "",
+                timestamp=m.get("timestamp") or "",
+                created_at=m.get("created_at") or ""
+            )
+            for m in messages
+        ]
         
     except Exception as e:
         raise HTTPException(
@@ -95,7 +70,8 @@ async def get_recent_chat_logs(
     return await get_chat_logs(
         team_id=team_id,
         start_time=start_time.isoformat(),
-        end_time=end_time.isoformat()
+        end_time=end_time.isoformat(),
+        limit=None
     )
 
 @router.post("/team/{team_id}/meeting-logs")
@@ -110,7 +86,7 @@ async def get_meeting_chat_logs(
         team_id=team_id,
         start_time=start_time,
         end_time=end_time,
-        limit=1000  # 회의록 생성을 위해 더 많은 메시지 조회
+        limit=None  # 회의록 생성을 위해 기간 내 메시지 전체 조회
     )
     
     # AI 서비스에서 사용하기 쉬운 형태로 변환
@@ -135,7 +111,6 @@ async def get_meeting_chat_logs(
 # FE_latest 호환 API (TeamSpacePage.tsx / chatClient.ts)
 # =====================================================
 from pydantic import BaseModel
-import uuid
 import time
 
 class ChatMessageCreateRequest(BaseModel):
@@ -144,6 +119,8 @@ class ChatMessageCreateRequest(BaseModel):
     user: str
     message: str
     is_in_meeting: bool = False
+    client_msg_id: Optional[str] = None
+    timestamp: Optional[str] = None
 
 @router.post("/message")
 async def save_chat_message(request: ChatMessageCreateRequest):
@@ -151,18 +128,14 @@ async def save_chat_message(request: ChatMessageCreateRequest):
     try:
         dynamodb = get_dynamodb_client()
         
-        timestamp = datetime.now().isoformat()
-        message_id = str(uuid.uuid4())
-        
-        item = {
-            "project_id": {"N": str(request.team_id)},  # Partition Key (team_id 사용)
-            "timestamp": {"S": timestamp},              # Sort Key
-            "message_id": {"S": message_id},
-            "user_id": {"S": request.user},
-            "message": {"S": request.message},
-            "is_in_meeting": {"BOOL": request.is_in_meeting},
-            "created_at": {"S": timestamp}
-        }
+        # 정렬 키는 시각 + 노드 ID (같은 시각 메시지 덮어쓰기 방지, client_msg_id 재전송은 같은 키)
+        item = build_chat_item(request.team_id, {  # Partition Key (team_id 사용)
+            "user_id": request.user,
+            "message": request.message,
+            "client_msg_id": request.client_msg_id,
+            "timestamp": request.timestamp,
+        })
+        item["is_in_meeting"] = {"BOOL": request.is_in_meeting}
         
         dynamodb.put_item(
             TableName="team_chats",
@@ -206,7 +179,7 @@ async def get_messages_compat(
         
         messages = []
         for log in logs:
-            dt = datetime.fromisoformat(log.timestamp)
+            dt = datetime.fromisoformat(log.timestamp.replace("Z", "+00:00"))
             messages.append({
                 "user": log.user_id,
                 "msg": log.message,
@@ -4,6 +4,7 @@ from .events_controller import router as events_router
 from .admin_controller import router as admin_router
 from .content_controller import router as content_router
 from .chat_controller import router as chat_router
+from .internal_controller import router as internal_router
 
 # 모든 라우터를 튜플로 묶어 관리합니다.
 # (router, prefix, tags) 순서로 정의
@@ -17,4 +18,5 @@ all_routers = [
     (admin_router, "/admin", "Admin"),
     (content_router, "", "Content"),  # /notices, /banners 등
     (chat_router, "", "Chat"),        # /chat, /ws 등
+    (internal_router, "/internal", "Internal"),  # 서비스 간 내부 호출
 ]
@@ -153,31 +153,25 @@ async def handle_report(report_id: int, payload: ReportDecisionRequest, current_
         
         logger.info(f"알림 메시지: reporter='{message}', team='{team_message}'")
         
-        # 신고자에게 알림
+        # 신고자와 팀장에게 알림 (한 번의 INSERT로 저장)
+        link = f"/projects/{project_id}"
+        targets = []
         if reporter_id:
-            logger.info(f"신고자 {reporter_id}에게 알림 전송 시도")
-            result = await notification_service.create_notification(
-                user_id=reporter_id,
-                message=message,
-                link=f"/projects/{project_id}"
-            )
-            logger.info(f"✅ 신고자({reporter_id})에게 알림 전송 완료: {result}")
+            targets.append({"user_id": reporter_id, "message": message, "link": link})
         else:
             logger.warning("reporter_id가 없어 신고자 알림 전송 불가")
         
-        # 팀장에게 알림 (이미 조회한 leader_id 사용)
+        # 팀장 (이미 조회한 leader_id 사용)
         if leader_id and leader_id != reporter_id:
-            logger.info(f"팀장 {leader_id}에게 알림 전송 시도")
-            result = await notification_service.create_notification(
-                user_id=leader_id,
-                message=team_message,
-                link=f"/projects/{project_id}"
-            )
-            logger.info(f"✅ 팀장({leader_id})에게 알림 전송 완료: {result}")
+            targets.append({"user_id": leader_id, "message": team_message, "link": link})
         elif leader_id == reporter_id:
             logger.info(f"팀장과 신고자가 동일하여 중복 알림 방지")
         else:
             logger.warning("leader_id가 없어 팀장 알림 전송 불가")
+        
+        if targets:
+            count = await notification_service.create_notifications(targets)
+            logger.info(f"✅ 알림 {count}건 전송 완료: {[t['user_id'] for t in targets]}")
             
     except Exception as e:
         logger.error(f"❌ 알림 전송 중 오류 발생: {str(e)}", exc_info=True)
@@ -1,24 +1,54 @@
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Optional
 import logging
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Header, Query, WebSocket, WebSocketDisconnect
 from app.schemas.base import ResponseEnvelope
 from app.core.deps import get_current_user
+from app.core.exceptions import BusinessException, ErrorCode
+from app.core.chat_broker import chat_broker
+from app.core.chat_hub import chat_hub
+from app.core.config import settings
 from app.services.chat_service import (
-    save_chat_message,
+    SORT_KEY_SEP,
+    chat_user_key,
+    decode_cursor,
+    encode_cursor,
     list_chat_messages,
-    upsert_chat_room,
+    list_chat_page,
+    list_unread_counts,
+    mark_room_read,
 )
+from app.services.chat_writer import chat_writer
+from app.services.meeting_feed import meeting_counter_frame, meeting_tracker, parse_meeting_event
+from app.services.recent_messages import recent_messages
+from app.services.unread_feed import unread_feed
+from app.utils.rate_limit import client_ip, rate_limit, rate_limiter, verified_subject
+from app.utils.sort_keys import us_to_iso
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 도배로 연결을 끊을 때 쓰는 WebSocket 종료 코드 (Policy Violation)
+WS_POLICY_VIOLATION_CODE = 1008
 
-# In-memory websocket connections (per project) for broadcast.
-chat_connections: Dict[int, Set[WebSocket]] = {}
+
+# Websocket connections held by this process live in chat_hub (per project,
+# each with its own bounded send queue). Messages are published through
+# chat_broker, which delivers them back to every process that has sockets in
+# the room; chat_hub.broadcast then fans them out locally.
+async def _deliver(room_id: int, message: Dict[str, Any]) -> None:
+    recent_messages.observe(room_id, message)
+    await chat_hub.broadcast(room_id, message)
+    # 회의 중이면 메시지 카운터를 같은 소켓으로 push (시작/종료는 즉시, 나머지는 묶어서)
+    if meeting_tracker.observe(room_id, message):
+        immediate = parse_meeting_event(message.get("message")) is not None
+        meeting_tracker.schedule_push(room_id, chat_hub.broadcast, immediate=immediate)
+
+
+chat_broker.set_handler(_deliver)
 
 
 def _now_iso() -> str:
@@ -32,7 +62,9 @@ def _build_message(project_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
         "user_id": payload.get("user_id") or "unknown",
         "senderName": payload.get("senderName") or payload.get("user_name") or "Unknown",
         "message": payload.get("message") or payload.get("text") or "",
-        "timestamp": payload.get("timestamp") or _now_iso(),
+        # 정렬 키는 서버에서 생성 - 클라이언트 시각은 client_msg_id와 함께일 때만 키에 사용
+        "timestamp": payload.get("timestamp"),
+        "client_msg_id": payload.get("client_msg_id") or payload.get("idempotency_key"),
         "created_at": payload.get("created_at") or _now_iso(),
     }
 
@@ -43,78 +75,214 @@ async def get_messages(project_id: int, current_user=Depends(get_current_user)):
     return ResponseEnvelope(success=True, code="CHAT_000", message="Messages", data=data)
 
 
-@router.post("/chat/{project_id}/messages", response_model=ResponseEnvelope)
-async def post_message(project_id: int, body: Dict[str, Any], current_user=Depends(get_current_user)):
+@router.get("/chat/{project_id}/history", response_model=ResponseEnvelope)
+async def get_message_history(
+    project_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[str] = Query(None, description="이전 페이지 커서 (next_before)"),
+    after: Optional[str] = Query(None, description="이후 메시지 커서 (next_after)"),
+    current_user=Depends(get_current_user),
+):
+    """
+    커서 기반 채팅 기록 조회 (오래된 순 정렬로 반환)
+    - 커서 없음: 최신 limit개
+    - before: 더 오래된 메시지 (무한 스크롤)
+    - after: 커서 이후 새 메시지
+    """
+    if before and after:
+        raise BusinessException(ErrorCode.INVALID_INPUT, "before와 after는 함께 사용할 수 없습니다.")
+    try:
+        page = await list_chat_page(project_id, limit=limit, before=before, after=after)
+    except ValueError:
+        raise BusinessException(ErrorCode.INVALID_INPUT, "유효하지 않은 커서입니다.")
+    return ResponseEnvelope(success=True, code="CHAT_000", message="Messages", data=page)
+
+
+@router.get("/chat/unread", response_model=ResponseEnvelope)
+async def get_unread_counts(current_user=Depends(get_current_user)):
+    """
+    내 모든 채팅방의 안 읽은 메시지 수 (헤더 배지용)
+    chat_rooms_ddb에서 내 읽음 위치 Query 1번 + 방 순번 BatchGetItem 1번
+    """
+    data = await list_unread_counts(chat_user_key(current_user.get("id")))
+    return ResponseEnvelope(success=True, code="CHAT_000", message="Unread counts", data=data)
+
+
+@router.post("/chat/{project_id}/read", response_model=ResponseEnvelope)
+async def mark_read(project_id: int, current_user=Depends(get_current_user)):
+    """채팅방을 현재 메시지까지 읽음 처리"""
+    user_key = chat_user_key(current_user.get("id"))
+    read_seq = await mark_room_read(user_key, project_id)
+    await unread_feed.refresh_user(user_key)
+    return ResponseEnvelope(success=True, code="CHAT_000", message="Marked read", data={"room_id": project_id, "read_seq": read_seq})
+
+
+def _connection_authorization(websocket: WebSocket) -> Optional[str]:
+    """WebSocket 연결의 Bearer 토큰 (브라우저 WebSocket은 헤더를 넣을 수 없으므로 ?token= 쿼리도 받음)"""
+    authorization = websocket.headers.get("authorization")
+    if not authorization and websocket.query_params.get("token"):
+        authorization = f"Bearer {websocket.query_params['token']}"
+    return authorization
+
+
+async def _connection_user(websocket: WebSocket) -> Optional[Dict[str, Any]]:
+    """WebSocket 연결의 사용자 (REST와 같은 get_current_user로 토큰에서 확인, 토큰이 없으면 None)"""
+    authorization = _connection_authorization(websocket)
+    if not authorization:
+        return None
+    return await get_current_user(authorization)
+
+
+async def _handle_control_frame(conn, project_id: int, payload: Dict[str, Any], user: Optional[Dict[str, Any]]) -> bool:
+    """
+    메시지가 아닌 WebSocket 제어 프레임 처리 (처리했으면 True)
+    - {"type": "read"}: 이 방을 읽음 처리
+    - {"type": "unread_subscribe"}: 내 전체 방 안 읽은 수 push 구독
+    사용자는 프레임의 user_id가 아니라 연결 토큰에서 확인한 사용자 (다른 사용자 행을 건드릴 수 없음)
+    """
+    frame_type = payload.get("type")
+    if frame_type not in ("read", "unread_subscribe"):
+        return False
+    if not user:
+        await conn.send_json({"error": "authentication required"})
+        return True
+    user_key = chat_user_key(user.get("id"))
+    try:
+        if frame_type == "read":
+            await mark_room_read(user_key, project_id)
+            await unread_feed.refresh_user(user_key)
+        else:
+            await unread_feed.watch(user_key, conn)
+    except Exception as e:
+        logger.warning(f"채팅 제어 프레임 처리 실패: type={frame_type}, room={project_id}, {e}")
+    return True
+
+
+@router.get("/chat/team/{team_id}/logs")
+async def get_chat_logs(
+    team_id: int,
+    start_time: Optional[str] = Query(None, description="시작 시간 (ISO format)"),
+    end_time: Optional[str] = Query(None, description="종료 시간 (ISO format)"),
+    limit: Optional[int] = Query(None, ge=1, description="최대 메시지 수 (기간 지정 시 생략하면 전체)"),
+):
+    """
+    팀 채팅 로그 조회 (AI 서비스에서 회의록 생성용)
+    기간이 주어지면 페이지를 끝까지 따라가 전체를 반환하고, 없으면 최신 메시지를 반환합니다.
+    """
+    if not start_time and not end_time and limit is None:
+        limit = 100
+    return await list_chat_messages(team_id, limit=limit, start_time=start_time, end_time=end_time)
+
+
+@router.post("/chat/{project_id}/messages", response_model=ResponseEnvelope, dependencies=[Depends(rate_limit("chat_send"))])
+async def post_message(
+    project_id: int,
+    body: Dict[str, Any],
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    current_user=Depends(get_current_user),
+):
     msg = _build_message(project_id, body)
-    # Persist to DynamoDB (ensures required fields)
+    msg["client_msg_id"] = msg["client_msg_id"] or idempotency_key
+    # Persist to DynamoDB (ensures required fields) and update chat room recency
+    # for the user. Batched in the background unless CHAT_PERSIST_MODE is sync/durable.
     try:
-        saved = await save_chat_message(project_id, msg)
+        saved = await chat_writer.persist(project_id, msg, sender_id=current_user.get("id"))
         # also keep senderName for FE display
         saved["senderName"] = msg["senderName"]
     except Exception as e:
         logger.exception("Failed to save chat message")
         return ResponseEnvelope(success=False, code="CHAT_500", message="Failed to save message", data=None)
 
-    # Update chat room recency for the user
-    try:
-        await upsert_chat_room(str(msg["user_id"]), project_id)
-    except Exception:
-        logger.exception("Failed to upsert chat room")
-
-    # Broadcast to live connections, if any.
-    for ws in list(chat_connections.get(project_id, set())):
-        try:
-            await ws.send_json(saved)
-        except Exception:
-            chat_connections[project_id].discard(ws)
+    # Broadcast to live connections on every pod via the broker
+    # (a retried send with the same client_msg_id was already broadcast).
+    if not saved.get("duplicate"):
+        await chat_broker.publish(project_id, saved)
     return ResponseEnvelope(success=True, code="CHAT_001", message="Message sent", data=saved)
 
 
+async def _check_ws_rate(websocket: WebSocket, conn, subject: Optional[str], state: Dict[str, int]) -> bool:
+    """
+    WebSocket 메시지 전송 제한 (REST와 같은 chat_send 버킷)
+    subject는 접속 시 서명을 확인한 토큰의 sub (없으면 IP 버킷만 적용, 프레임의 user_id는 쓰지 않음)
+    허용되면 True. 제한에 연속으로 CHAT_WS_FLOOD_STRIKES번 넘게 걸리면 도배로 보고 연결 종료
+    """
+    retry = await rate_limiter.hit(
+        "chat_send",
+        user=subject,
+        ip=client_ip(websocket.headers, websocket.client.host if websocket.client else None),
+    )
+    if retry <= 0:
+        state["strikes"] = 0
+        return True
+    state["strikes"] += 1
+    if state["strikes"] > settings.CHAT_WS_FLOOD_STRIKES:
+        logger.warning(f"채팅 도배로 WebSocket 종료: room={conn.room_id}")
+        await conn.close(code=WS_POLICY_VIOLATION_CODE)
+        raise WebSocketDisconnect(code=WS_POLICY_VIOLATION_CODE)
+    await conn.send_json({"error": "rate_limited", "retry_after": round(retry, 1)})
+    return False
+
+
 @router.websocket("/ws/chat/{project_id}")
 async def websocket_chat(websocket: WebSocket, project_id: int):
     await websocket.accept()
-    connections = chat_connections.setdefault(project_id, set())
-    connections.add(websocket)
+    user = await _connection_user(websocket)
+    rate_subject = await verified_subject(_connection_authorization(websocket))
+    conn, first = chat_hub.connect(project_id, websocket)
+    rate_state = {"strikes": 0}
+    if first:
+        await chat_broker.subscribe(project_id)
+        recent_messages.activate(project_id)
 
     try:
+        # 접속 직후 현재 회의 상태 전달 (이후 변경은 meeting_counter 프레임으로 push)
+        try:
+            meeting = await meeting_tracker.snapshot(project_id)
+            await conn.send_json(meeting_counter_frame(project_id, meeting))
+        except Exception as e:
+            logger.warning(f"회의 상태 조회 실패: room={project_id}, {e}")
+
         while True:
             raw = await websocket.receive_text()
             try:
                 payload = json.loads(raw)
             except json.JSONDecodeError:
-                await websocket.send_json({"error": "Invalid JSON payload"})
+                await conn.send_json({"error": "Invalid JSON payload"})
+                continue
+            if await _handle_control_frame(conn, project_id, payload, user):
+                continue
+            if not await _check_ws_rate(websocket, conn, rate_subject, rate_state):
                 continue
 
             msg = _build_message(project_id, payload)
             try:
-                saved = await save_chat_message(project_id, msg)
+                saved = await chat_writer.persist(project_id, msg, sender_id=user.get("id") if user else None)
                 saved["senderName"] = msg["senderName"]
             except Exception:
                 logger.exception("Failed to save chat message via WS")
-                await websocket.send_json({"error": "Failed to save message"})
+                await conn.send_json({"error": "Failed to save message"})
                 continue
 
-            try:
-                await upsert_chat_room(str(msg["user_id"]), project_id)
-            except Exception:
-                logger.exception("Failed to upsert chat room")
-
-            # Broadcast to all connections in the same project.
-            for ws in list(connections):
-                try:
-                    await ws.send_json(saved)
-                except Exception:
-                    connections.discard(ws)
+            # Broadcast to all connections in the same project (all pods).
+            if not saved.get("duplicate"):
+                await chat_broker.publish(project_id, saved)
     except WebSocketDisconnect:
-        connections.discard(websocket)
+        pass
+    except RuntimeError:
+        # 느린 소비자로 강제 종료된 소켓에서 receive가 호출된 경우
+        if not conn.closed:
+            raise
     finally:
-        connections.discard(websocket)
+        unread_feed.unwatch(conn)
+        if await chat_hub.disconnect(conn):
+            await chat_broker.unsubscribe(project_id)
+            meeting_tracker.forget(project_id)
+            recent_messages.forget(project_id)
 
 
 # ==============================================================================
 # FE_latest 호환용 라우터 (TeamSpacePage.tsx 대응)
 # ==============================================================================
-from typing import Optional
 from pydantic import BaseModel
 
 class ChatMessageCompatRequest(BaseModel):
@@ -123,8 +291,10 @@ class ChatMessageCompatRequest(BaseModel):
     user: str   # FE에서는 닉네임을 user필드에 담아 보냄
     message: str
     is_in_meeting: bool = False
+    client_msg_id: Optional[str] = None  # 재전송 중복 방지 (재시도 시 같은 값)
+    timestamp: Optional[str] = None      # 클라이언트 전송 시각 (ISO)
 
-@router.post("/chat/message")
+@router.post("/chat/message", dependencies=[Depends(rate_limit("chat_send"))])
 async def save_chat_message_compat(req: ChatMessageCompatRequest):
     """
     FE_latest(TeamSpacePage) 호환용 메시지 저장 API
@@ -137,6 +307,8 @@ async def save_chat_message_compat(req: ChatMessageCompatRequest):
         "user_id": req.user,  # user_id 필드에 닉네임 저장 (auth user_id가 아님 주의)
         "message": req.message,
         "senderName": req.user,
+        "client_msg_id": req.client_msg_id,
+        "timestamp": req.timestamp,
     }
     
     # DynamoDB 테이블이 없어도 FE가 동작하도록 예외 처리
@@ -145,7 +317,11 @@ async def save_chat_message_compat(req: ChatMessageCompatRequest):
     ts = int(now.timestamp() * 1000)
     
     try:
-        saved = await save_chat_message(req.project_id, payload)
+        saved = await chat_writer.persist(req.project_id, payload, upsert_room=False)
+        # 소켓이 끊겼을 때의 대체 경로이므로 WebSocket과 같이 브로커로 발행
+        # (다른 사용자 소켓 전달 + 각 Pod의 최근 메시지 버퍼 반영)
+        if not saved.get("duplicate"):
+            await chat_broker.publish(req.project_id, {**saved, "senderName": req.user})
         # timestamp 파싱
         if saved.get("timestamp"):
             try:
@@ -180,11 +356,18 @@ async def get_messages_compat(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     limit: Optional[int] = None,
+    since: Optional[str] = Query(None, description="이후 메시지만 조회 (응답의 cursor 또는 epoch ms)"),
 ):
     """
     FE_latest 호환용 메시지 목록 조회
     Endpoint: GET /chat/messages/{team_id}/{project_id}
+
+    since가 있으면 그 이후의 새 메시지만 반환하고, 서버에서 집계한 회의 상태(meeting)와
+    다음 요청에 쓸 cursor를 함께 내려줍니다. (회의 중 전체 목록 재조회 대체)
     """
+    if since is not None:
+        return await _get_messages_since(project_id, since, limit)
+
     # project_id로 조회 (DynamoDB 테이블이 없으면 빈 배열 반환)
     try:
         use_limit = None if (start_date or end_date) else (limit if limit is not None else 100)
@@ -199,29 +382,67 @@ async def get_messages_compat(
         return {"messages": [], "count": 0}
     
     # FE 형식으로 변환
-    messages = []
-    for d in data:
-        ts = 0
-        time_str = ""
-        if d.get("timestamp"):
-            try:
-                t_str = d["timestamp"].replace("Z", "+00:00")
-                dt = datetime.fromisoformat(t_str)
-                ts = int(dt.timestamp() * 1000)
-                time_str = dt.strftime("%H:%M")
-            except:
-                pass
-                
-        messages.append({
-            "user": d.get("user_id"),
-            "msg": d.get("message"),
-            "time": time_str,
-            "timestamp": ts,
-            "isInMeeting": False 
-        })
-        
+    messages = [_to_compat_message(d) for d in data]
+
     return {
         "messages": messages,
         "count": len(messages)
     }
 
+
+def _to_compat_message(d: Dict[str, Any]) -> Dict[str, Any]:
+    """DynamoDB 메시지를 FE 형식으로 변환"""
+    ts = 0
+    time_str = ""
+    if d.get("timestamp"):
+        try:
+            t_str = d["timestamp"].replace("Z", "+00:00")
+            dt = datetime.fromisoformat(t_str)
+            ts = int(dt.timestamp() * 1000)
+            time_str = dt.strftime("%H:%M")
+        except:
+            pass
+    return {
+        "user": d.get("user_id"),
+        "msg": d.get("message"),
+        "time": time_str,
+        "timestamp": ts,
+        "isInMeeting": False
+    }
+
+
+def _since_cursor(since: str) -> str:
+    """
+    since(cursor 또는 epoch ms)를 list_chat_page의 after 커서로 변환
+    epoch ms는 그 밀리초의 마지막 정렬 키(…sss999Z#\uffff)로 바꿔 그 밀리초 메시지까지 제외
+    (클라이언트가 마지막으로 받은 메시지의 ms를 보내므로 같은 메시지를 다시 받지 않음)
+    """
+    if since.isdigit():
+        last_us = int(since) * 1000 + 999
+        return encode_cursor(f"{us_to_iso(last_us)}{SORT_KEY_SEP}\uffff")
+    decode_cursor(since)  # 형식 검증 (ValueError)
+    return since
+
+
+async def _get_messages_since(project_id: int, since: str, limit: Optional[int]) -> Dict[str, Any]:
+    try:
+        after = _since_cursor(since)
+    except (ValueError, OverflowError, OSError):
+        raise BusinessException(ErrorCode.INVALID_INPUT, "유효하지 않은 since 값입니다.")
+
+    try:
+        page = await list_chat_page(project_id, limit=min(limit or 200, 200), after=after)
+        meeting = await meeting_tracker.snapshot(project_id)
+    except Exception as e:
+        logger.warning(f"채팅 메시지 조회 실패 (테이블 미존재 가능): {e}")
+        return {"messages": [], "count": 0, "cursor": since, "has_more": False, "meeting": None}
+
+    messages = [_to_compat_message(d) for d in page["messages"]]
+    return {
+        "messages": messages,
+        "count": len(messages),
+        "cursor": page["next_after"],
+        "has_more": page["has_more"],
+        "meeting": meeting,
+    }
+
@@ -2,7 +2,20 @@ from fastapi import APIRouter
 from sqlalchemy import text
 
 from app.schemas.base import ResponseEnvelope
+from app.utils.http_pool import http_pool
+from app.utils.rate_limit import rate_limiter
+from app.core.database import aws_manager
 from app.core.database import engine
+from app.core.identity_cache import identity_cache
+from app.core.chat_broker import chat_broker
+from app.core.chat_hub import chat_hub
+from app.services.chat_writer import chat_writer
+from app.services.meeting_feed import meeting_tracker
+from app.services.chat_shards import shard_directory
+from app.services.chat_archive import chat_archive
+from app.services.recent_messages import recent_messages
+from app.services.unread_feed import unread_feed
+from app.services.notification_feed import notification_feed
 
 router = APIRouter()
 
@@ -30,3 +43,82 @@ async def readiness_check():
     code = "COMMON_000" if success else "COMMON_999"
     msg = "Ready" if success else "Not ready"
     return ResponseEnvelope(success=success, code=code, message=msg, data=checks)
+
+
+@router.get("/http-pool", response_model=ResponseEnvelope)
+async def http_pool_check():
+    """서비스 간 HTTP 커넥션 풀 현황 (대상별 요청/에러/지연시간, 커넥션 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="HTTP pool", data=http_pool.stats())
+
+
+@router.get("/identity-cache", response_model=ResponseEnvelope)
+async def identity_cache_check():
+    """email → 사용자 캐시 현황 (히트/미스/네거티브/동시 조회 병합 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Identity cache", data=identity_cache.stats())
+
+
+@router.get("/chat-broker", response_model=ResponseEnvelope)
+async def chat_broker_check():
+    """채팅 Pub/Sub 브로커 현황 (구독 방 수, publish/전달 수, 연결 상태)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat broker", data=chat_broker.stats())
+
+
+@router.get("/chat-fanout", response_model=ResponseEnvelope)
+async def chat_fanout_check():
+    """WebSocket 팬아웃 현황 (방별 연결 수, 큐 길이, 팬아웃 지연시간, 느린 소비자 종료 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat fan-out", data=chat_hub.stats())
+
+
+@router.get("/chat-writer", response_model=ResponseEnvelope)
+async def chat_writer_check():
+    """채팅 write-behind 현황 (큐 길이, 배치/재시도/실패 수, 채팅방 갱신 병합 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat writer", data=chat_writer.stats())
+
+
+@router.get("/meeting-feed", response_model=ResponseEnvelope)
+async def meeting_feed_check():
+    """회의 메시지 카운터 현황 (상태를 들고 있는 방 수, 진행 중 회의 수, 대기 중 push 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Meeting feed", data=meeting_tracker.stats())
+
+
+@router.get("/chat-shards", response_model=ResponseEnvelope)
+async def chat_shards_check():
+    """핫 채팅방 쓰기 샤딩 현황 (고정/자동 샤딩된 방, 샤드 확장 횟수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat shards", data=shard_directory.stats())
+
+
+@router.get("/chat-recent", response_model=ResponseEnvelope)
+async def chat_recent_check():
+    """방별 최근 메시지 버퍼 현황 (버퍼 중인 방/메시지 수, 메모리 사용량, 적중률, LRU 제거 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat recent messages", data=recent_messages.stats())
+
+
+@router.get("/chat-unread", response_model=ResponseEnvelope)
+async def chat_unread_check():
+    """안 읽은 수 push 현황 (구독 중인 사용자/연결 수, 재계산/push/오류 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat unread", data=unread_feed.stats())
+
+
+@router.get("/chat-archive", response_model=ResponseEnvelope)
+async def chat_archive_check():
+    """채팅 S3 아카이브 현황 (아카이브 경계 날짜, 파일 읽기/없음/쓰기 수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Chat archive", data=chat_archive.stats())
+
+
+@router.get("/notification-stream", response_model=ResponseEnvelope)
+async def notification_stream_check():
+    """알림 SSE 현황 (스트림 중인 사용자/연결 수, 수신 신호/깨운 스트림 수, 브로커 상태)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Notification stream", data=notification_feed.stats())
+
+
+@router.get("/rate-limit", response_model=ResponseEnvelope)
+async def rate_limit_check():
+    """요청 제한 현황 (백엔드, 정책별 허용/제한 수, Redis 오류/로컬 대체 횟수)"""
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Rate limit", data=rate_limiter.stats())
+
+
+@router.get("/aws", response_model=ResponseEnvelope)
+async def aws_clients_check():
+    """공유 AWS 클라이언트 현황 및 상태 확인 (열려 있는 클라이언트만 가벼운 호출로 확인)"""
+    data = {**aws_manager.clients.stats(), "probes": await aws_manager.health()}
+    return ResponseEnvelope(success=True, code="COMMON_000", message="AWS clients", data=data)
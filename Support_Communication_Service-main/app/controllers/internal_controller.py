@@ -0,0 +1,27 @@
+from typing import Optional
+
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+from app.schemas.base import ResponseEnvelope
+from app.core.identity_cache import identity_cache
+
+router = APIRouter()
+
+
+class IdentityInvalidateRequest(BaseModel):
+    email: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+@router.post("/identity-cache/invalidate", response_model=ResponseEnvelope)
+async def invalidate_identity_cache(body: IdentityInvalidateRequest):
+    """
+    MSA 내부 통신용: 사용자 정보 캐시 무효화
+    Auth Service가 닉네임 변경/회원 탈퇴 시 호출합니다.
+    요청은 Pod 하나에만 도착하므로 브로커로 발행해 다른 API/채팅 Pod의 캐시도 제거합니다.
+    (removed는 이 Pod에서 제거된 개수)
+    """
+    removed = identity_cache.invalidate(email=body.email, user_id=body.user_id)
+    await identity_cache.broadcast_invalidate(email=body.email, user_id=body.user_id)
+    return ResponseEnvelope(success=True, code="COMMON_000", message="Invalidated", data={"removed": removed})
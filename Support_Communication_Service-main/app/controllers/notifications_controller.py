@@ -1,12 +1,33 @@
-from fastapi import APIRouter, Depends
-from typing import Optional
+import asyncio
+import json
+import logging
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel
 
 from app.schemas.base import ResponseEnvelope
+from app.core.config import settings
 from app.core.deps import get_current_user
-from app.services.notification_service import list_notifications, create_notification, mark_notifications_read
+from app.core.exceptions import BusinessException, ErrorCode
+from app.services.notification_service import (
+    NOTIFICATION_PAGE_MAX,
+    NOTIFICATION_PAGE_SIZE,
+    count_unread_notifications,
+    create_notification,
+    create_notifications,
+    decode_cursor,
+    latest_notification_cursor,
+    list_notifications,
+    list_notifications_after,
+    mark_notifications_read,
+)
+from app.services.notification_feed import notification_feed
+from app.utils.rate_limit import rate_limit
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class NotificationCreate(BaseModel):
@@ -15,13 +36,56 @@ class NotificationCreate(BaseModel):
     link: Optional[str] = None
 
 
+class NotificationBatchCreate(BaseModel):
+    """
+    알림 일괄 생성 (둘 중 하나 또는 둘 다)
+    - notifications: 수신자별로 내용이 다른 알림 목록
+    - user_ids + message (+ link): 같은 내용을 여러 사용자에게 (팬아웃)
+    """
+    notifications: List[NotificationCreate] = []
+    user_ids: List[str] = []
+    message: Optional[str] = None
+    link: Optional[str] = None
+
+
+class NotificationReadRequest(BaseModel):
+    notification_ids: Optional[List[int]] = None  # 생략하면 전체 읽음 처리
+
+
+# 일괄 생성 1회 요청당 최대 알림 수
+NOTIFICATION_BATCH_MAX = 5000
+
+
 @router.get("", response_model=ResponseEnvelope)
-async def list_notifications_api(user_id: Optional[str] = None, current_user=Depends(get_current_user)):
-    data = await list_notifications(user_id or str(current_user.get("id")))
+async def list_notifications_api(
+    user_id: Optional[str] = None,
+    limit: int = Query(NOTIFICATION_PAGE_SIZE, ge=1, le=NOTIFICATION_PAGE_MAX),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor)"),
+    unread_only: bool = False,
+    current_user=Depends(get_current_user),
+):
+    """
+    알림 목록 (최신순, 커서 기반 페이지)
+    - 커서 없음: 최신 limit개
+    - cursor: 이전 응답의 next_cursor 이후(더 오래된) limit개
+    """
+    try:
+        data = await list_notifications(
+            user_id or str(current_user.get("id")), limit=limit, cursor=cursor, unread_only=unread_only
+        )
+    except ValueError:
+        raise BusinessException(ErrorCode.INVALID_INPUT, "유효하지 않은 커서입니다.")
     return ResponseEnvelope(success=True, code="NOTI_000", message="Notifications", data=data)
 
 
-@router.post("", response_model=ResponseEnvelope)
+@router.get("/unread-count", response_model=ResponseEnvelope)
+async def unread_count_api(user_id: Optional[str] = None, current_user=Depends(get_current_user)):
+    """안 읽은 알림 수 (헤더 배지 폴링용 - 목록 대신 이 값만 주기적으로 조회)"""
+    count = await count_unread_notifications(user_id or str(current_user.get("id")))
+    return ResponseEnvelope(success=True, code="NOTI_000", message="Unread notifications", data={"unread": count})
+
+
+@router.post("", response_model=ResponseEnvelope, dependencies=[Depends(rate_limit("notification_create"))])
 async def create_notification_api(notification: NotificationCreate):
     """알림 생성 API (다른 서비스에서 호출)"""
     data = await create_notification(
@@ -32,9 +96,104 @@ async def create_notification_api(notification: NotificationCreate):
     return ResponseEnvelope(success=True, code="NOTI_001", message="Notification created", data=data)
 
 
+@router.post("/batch", response_model=ResponseEnvelope, dependencies=[Depends(rate_limit("notification_create"))])
+async def create_notifications_api(batch: NotificationBatchCreate):
+    """알림 일괄 생성 API (다른 서비스에서 팬아웃을 한 번에 호출, 한 트랜잭션의 다중 행 INSERT)"""
+    if batch.user_ids and not batch.message:
+        raise BusinessException(ErrorCode.INVALID_INPUT, "user_ids를 보낼 때는 message가 필요합니다.")
+    items = [n.model_dump() for n in batch.notifications]
+    items += [{"user_id": uid, "message": batch.message, "link": batch.link} for uid in dict.fromkeys(batch.user_ids)]
+    if len(items) > NOTIFICATION_BATCH_MAX:
+        raise BusinessException(ErrorCode.INVALID_INPUT, f"한 번에 최대 {NOTIFICATION_BATCH_MAX}개까지 생성할 수 있습니다.")
+    count = await create_notifications(items)
+    return ResponseEnvelope(success=True, code="NOTI_001", message=f"{count} notifications created", data={"count": count})
+
+
 @router.post("/read", response_model=ResponseEnvelope)
-async def mark_notifications_read_api(user_id: str):
-    """사용자의 모든 알림을 읽음 처리"""
-    count = await mark_notifications_read(user_id)
+async def mark_notifications_read_api(user_id: str, body: Optional[NotificationReadRequest] = None):
+    """사용자의 알림 읽음 처리 (notification_ids를 주면 해당 알림만)"""
+    count = await mark_notifications_read(user_id, body.notification_ids if body else None)
     return ResponseEnvelope(success=True, code="NOTI_002", message=f"{count} notifications marked as read", data={"count": count})
 
+
+# ==============================================================================
+# 알림 push (SSE)
+# ==============================================================================
+def _sse(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(jsonable_encoder(data), ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def _notification_events(request: Request, user_id: str, cursor: Optional[str]) -> AsyncIterator[str]:
+    """
+    SSE 이벤트 스트림
+    - ready: 연결 직후 1회 (id = 시작 커서, 안 읽은 수)
+    - notification: 새 알림 (id = 알림 커서 → 재연결 시 브라우저가 Last-Event-ID로 보내 이어받음)
+    - unread: 알림을 보낸 뒤 갱신된 안 읽은 수
+    - 주석(: ping): NOTIFICATION_STREAM_HEARTBEAT마다 연결 유지
+    """
+    if cursor is None:
+        cursor = await latest_notification_cursor(user_id)
+    # 커서를 먼저 정한 뒤 등록하고 한 번 따라잡기 → 그 사이 커밋된 알림도 빠지지 않음
+    wakeup = notification_feed.register(user_id)
+    wakeup.set()
+    generation = notification_feed.generation
+    try:
+        yield f"retry: {settings.NOTIFICATION_STREAM_RETRY_MS}\n\n"
+        yield _sse("ready", {"unread": await count_unread_notifications(user_id)}, event_id=cursor)
+        while not await request.is_disconnected():
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=settings.NOTIFICATION_STREAM_HEARTBEAT)
+            except asyncio.TimeoutError:
+                if notification_feed.generation == generation:
+                    yield ": ping\n\n"
+                    continue
+                # 브로커가 재연결됨 → 놓친 신호가 있을 수 있으니 커서로 확인
+                generation = notification_feed.generation
+            wakeup.clear()
+            try:
+                sent = 0
+                while True:
+                    items = await list_notifications_after(user_id, cursor, settings.NOTIFICATION_STREAM_CATCHUP_LIMIT)
+                    for item in items:
+                        cursor = item.pop("cursor")
+                        sent += 1
+                        yield _sse("notification", item, event_id=cursor)
+                    if len(items) < settings.NOTIFICATION_STREAM_CATCHUP_LIMIT:
+                        break
+                if sent:
+                    yield _sse("unread", {"unread": await count_unread_notifications(user_id)})
+            except Exception as e:
+                # 일시적인 DB 오류 - 커서는 그대로이므로 다음 신호/heartbeat 때 다시 시도
+                logger.warning(f"알림 스트림 조회 실패: user={user_id}, {e}")
+    finally:
+        notification_feed.unregister(user_id, wakeup)
+
+
+@router.get("/stream")
+async def notification_stream_api(
+    request: Request,
+    user_id: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이어받을 커서 (마지막으로 받은 이벤트 id)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user=Depends(get_current_user),
+):
+    """
+    새 알림 push (Server-Sent Events)
+    EventSource 재연결 시 Last-Event-ID(또는 cursor) 이후 놓친 알림부터 전송합니다.
+    연결이 안 되는 환경에서는 기존 /unread-count 폴링을 그대로 사용합니다.
+    """
+    resume = last_event_id or cursor
+    if resume:
+        try:
+            decode_cursor(resume)
+        except ValueError:
+            raise BusinessException(ErrorCode.INVALID_INPUT, "유효하지 않은 커서입니다.")
+    return StreamingResponse(
+        _notification_events(request, user_id or str(current_user.get("id")), resume),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
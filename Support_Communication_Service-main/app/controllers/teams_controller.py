@@ -3,8 +3,8 @@ from pydantic import BaseModel
 from app.schemas.base import ResponseEnvelope
 from app.core.deps import get_current_user
 from app.schemas.chat import ChatMessageRequest
-import uuid
-from app.services.chat_service import save_chat_message, list_chat_messages, upsert_chat_room
+from app.utils.rate_limit import rate_limit
+from app.services.chat_service import bump_room_seq, chat_user_key, save_chat_message, list_chat_messages, upsert_chat_room
 
 router = APIRouter()
 
@@ -83,23 +83,26 @@ async def list_chats(
     return ResponseEnvelope(success=True, code="TEAM_002", message="Chat history", data=chats)
 
 
-@router.post("/{project_id}/chats", response_model=ResponseEnvelope)
+@router.post("/{project_id}/chats", response_model=ResponseEnvelope, dependencies=[Depends(rate_limit("chat_send"))])
 async def post_chat(
     project_id: int, 
     payload: ChatMessageRequest, 
     current_user=Depends(get_current_user),
 ):
     user_id_val = current_user.get("id")
-    sender_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, str(user_id_val)))
+    sender_uuid = chat_user_key(user_id_val)
 
     message_payload = {
         "user_id": sender_uuid,
         "message": payload.message,
         "message_type": payload.message_type,
         "senderName": current_user.get("name", "Unknown"),
+        "client_msg_id": payload.client_msg_id,
+        "timestamp": payload.timestamp,
     }
     saved = await save_chat_message(project_id, message_payload)
-    await upsert_chat_room(sender_uuid, project_id)
+    seq = await bump_room_seq(project_id, 1, saved["timestamp"])
+    await upsert_chat_room(sender_uuid, project_id, read_seq=seq)
     return ResponseEnvelope(success=True, code="TEAM_003", message="Message sent", data=saved)
 
 
@@ -108,9 +111,10 @@ async def trigger_meeting(project_id: int, payload: MeetingTriggerRequest, curre
     """회의 시작/종료를 Team Service로 전달"""
     import httpx
     from app.core.config import settings
+    from app.utils.http_pool import http_pool
     
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_pool.target("team") as client:
             response = await client.post(
                 f"{settings.TEAM_SERVICE_URL}/api/v1/teams/{project_id}/meeting_trigger",
                 json={"action": payload.action},
@@ -138,9 +142,10 @@ async def list_meetings(project_id: int, current_user=Depends(get_current_user))
     """회의 목록을 Team Service에서 가져오기"""
     import httpx
     from app.core.config import settings
+    from app.utils.http_pool import http_pool
     
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_pool.target("team") as client:
             response = await client.get(
                 f"{settings.TEAM_SERVICE_URL}/api/v1/teams/{project_id}/meetings",
                 timeout=10.0
@@ -158,10 +163,11 @@ async def create_meeting(project_id: int, payload: MeetingRequest, current_user=
     """회의 생성을 Team Service로 전달"""
     import httpx
     from app.core.config import settings
+    from app.utils.http_pool import http_pool
     from fastapi.responses import JSONResponse
     
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_pool.target("team") as client:
             response = await client.post(
                 f"{settings.TEAM_SERVICE_URL}/api/v1/teams/{project_id}/meetings",
                 json=payload.model_dump(),
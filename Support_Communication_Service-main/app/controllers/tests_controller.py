@@ -7,6 +7,7 @@ from pydantic import BaseModel
 from app.schemas.base import ResponseEnvelope
 from app.core.deps import get_current_user
 from app.utils.msa_client import MSAClient
+from app.utils.rate_limit import rate_limit
 
 router = APIRouter()
 msa_client = MSAClient()
@@ -23,7 +24,7 @@ class TestResultRequest(BaseModel):
     application_id: int | None = None
 
 
-@router.post("/generate", response_model=ResponseEnvelope, status_code=201)
+@router.post("/generate", response_model=ResponseEnvelope, status_code=201, dependencies=[Depends(rate_limit("ai_generate"))])
 async def generate_test(
     payload: TestGenerateRequest, 
     current_user=Depends(get_current_user)
@@ -0,0 +1,269 @@
+"""
+WebSocket 채팅 브로드캐스트용 Pub/Sub 브로커
+
+chat_controller는 자기 프로세스의 소켓만 들고 있으므로, 여러 Pod로 스케일 아웃하면
+다른 Pod에 붙은 사용자에게 메시지가 전달되지 않습니다.
+메시지는 항상 브로커에 publish하고, 브로커가 구독 중인 모든 Pod에 다시 전달합니다.
+
+- InProcessBroker: 단일 프로세스용 (로컬 개발, replicas 1) - publish가 곧바로 로컬 전달
+- RedisBroker: Redis PUBLISH/SUBSCRIBE 사용 (app/utils/redis_resp.py의 RESP 최소 구현, 추가 의존성 없음)
+  · 로컬 소켓이 있는 방만 구독 (첫 접속 시 SUBSCRIBE, 마지막 접속 종료 시 UNSUBSCRIBE)
+  · 구독 연결이 끊기면 백오프 후 재연결 및 재구독
+  · publish 실패 시 최소한 같은 Pod의 사용자에게는 전달되도록 로컬 전달로 대체
+
+설정: CHAT_BROKER=memory|redis, CHAT_REDIS_URL=redis://[:password@]host:port/db
+"""
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.utils.redis_resp import RedisConnection, read_reply
+
+logger = logging.getLogger(__name__)
+
+# 브로커가 받은 메시지를 로컬 소켓으로 전달하는 콜백 (room_id, message)
+MessageHandler = Callable[[int, Dict[str, Any]], Awaitable[None]]
+
+
+class ChatBroker(ABC):
+    """브로커 공통 인터페이스"""
+
+    name = "base"
+
+    def __init__(self):
+        self._handler: Optional[MessageHandler] = None
+        self._rooms: Set[int] = set()
+        self.published = 0
+        self.delivered = 0
+        self.publish_errors = 0
+
+    def set_handler(self, handler: MessageHandler) -> None:
+        self._handler = handler
+
+    async def _dispatch(self, room_id: int, message: Dict[str, Any]) -> None:
+        if self._handler is None:
+            return
+        self.delivered += 1
+        try:
+            await self._handler(room_id, message)
+        except Exception:
+            logger.exception(f"채팅 메시지 로컬 전달 실패: room={room_id}")
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def subscribe(self, room_id: int) -> None:
+        self._rooms.add(room_id)
+
+    async def unsubscribe(self, room_id: int) -> None:
+        self._rooms.discard(room_id)
+
+    @abstractmethod
+    async def publish(self, room_id: int, message: Dict[str, Any]) -> None:
+        """방의 모든 구독자(Pod)에게 메시지 발행"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "broker": self.name,
+            "rooms": len(self._rooms),
+            "published": self.published,
+            "delivered": self.delivered,
+            "publish_errors": self.publish_errors,
+        }
+
+
+class InProcessBroker(ChatBroker):
+    """단일 프로세스 브로커 - publish한 메시지를 같은 프로세스의 소켓에만 전달"""
+
+    name = "memory"
+
+    async def publish(self, room_id: int, message: Dict[str, Any]) -> None:
+        self.published += 1
+        await self._dispatch(room_id, message)
+
+
+class RedisBroker(ChatBroker):
+    """Redis PUBLISH/SUBSCRIBE 기반 브로커 - Pod 간 채팅 메시지 전달"""
+
+    name = "redis"
+
+    def __init__(self, url: str, channel_prefix: str):
+        super().__init__()
+        self._url = url
+        self._prefix = channel_prefix
+        self._node_id = uuid.uuid4().hex[:12]
+        self._pub = RedisConnection(url, settings.CHAT_REDIS_CONNECT_TIMEOUT)
+        self._pub_lock = asyncio.Lock()
+        self._sub = RedisConnection(url, settings.CHAT_REDIS_CONNECT_TIMEOUT)
+        self._sub_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.reconnects = 0
+
+    def _channel(self, room_id: int) -> str:
+        return f"{self._prefix}{room_id}"
+
+    def _room_of(self, channel: bytes) -> Optional[int]:
+        name = channel.decode()
+        if not name.startswith(self._prefix):
+            return None
+        try:
+            return int(name[len(self._prefix):])
+        except ValueError:
+            return None
+
+    # -----------------------------------------------------------------
+    # 수명 주기
+    # -----------------------------------------------------------------
+    async def start(self) -> None:
+        self._closing = False
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._reader_loop())
+        logger.info(f"채팅 브로커 시작: redis {self._sub.host}:{self._sub.port} (node={self._node_id})")
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader_task = None
+        await self._sub.close()
+        await self._pub.close()
+        logger.info("채팅 브로커 종료")
+
+    # -----------------------------------------------------------------
+    # 구독
+    # -----------------------------------------------------------------
+    async def subscribe(self, room_id: int) -> None:
+        await super().subscribe(room_id)
+        async with self._sub_lock:
+            if self._sub.connected:
+                try:
+                    await self._sub.send("SUBSCRIBE", self._channel(room_id))
+                except Exception as e:
+                    # 재연결 시 _rooms 기준으로 다시 구독됨
+                    logger.warning(f"채팅 채널 구독 실패 (재연결 시 재시도): room={room_id}, {e}")
+
+    async def unsubscribe(self, room_id: int) -> None:
+        await super().unsubscribe(room_id)
+        async with self._sub_lock:
+            if self._sub.connected:
+                try:
+                    await self._sub.send("UNSUBSCRIBE", self._channel(room_id))
+                except Exception as e:
+                    logger.warning(f"채팅 채널 구독 해제 실패: room={room_id}, {e}")
+
+    async def _connect_subscriber(self) -> None:
+        async with self._sub_lock:
+            await self._sub.close()
+            await self._sub.connect()
+            rooms: List[int] = list(self._rooms)
+            if rooms:
+                await self._sub.send("SUBSCRIBE", *[self._channel(r) for r in rooms])
+
+    async def _reader_loop(self) -> None:
+        """구독 연결에서 메시지를 읽어 로컬 소켓으로 전달 (끊기면 재연결)"""
+        backoff = settings.CHAT_REDIS_RECONNECT_MIN
+        while not self._closing:
+            try:
+                await self._connect_subscriber()
+                backoff = settings.CHAT_REDIS_RECONNECT_MIN
+                while True:
+                    reply = await read_reply(self._sub.reader)
+                    if not isinstance(reply, list) or len(reply) < 3 or reply[0] != b"message":
+                        # subscribe/unsubscribe 확인 응답 등은 무시
+                        continue
+                    room_id = self._room_of(reply[1])
+                    if room_id is None:
+                        continue
+                    try:
+                        envelope = json.loads(reply[2])
+                    except (TypeError, ValueError):
+                        logger.warning("잘못된 채팅 브로커 메시지 무시")
+                        continue
+                    await self._dispatch(room_id, envelope.get("message") or {})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._closing:
+                    break
+                self.reconnects += 1
+                logger.warning(f"Redis 구독 연결 오류 - {backoff:.1f}초 후 재연결: {e}")
+                await self._sub.close()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, settings.CHAT_REDIS_RECONNECT_MAX)
+
+    # -----------------------------------------------------------------
+    # 발행
+    # -----------------------------------------------------------------
+    async def publish(self, room_id: int, message: Dict[str, Any]) -> None:
+        payload = json.dumps({"origin": self._node_id, "message": message}, ensure_ascii=False, default=str)
+        try:
+            async with self._pub_lock:
+                try:
+                    if not self._pub.connected:
+                        await self._pub.connect()
+                    try:
+                        await self._execute_publish(room_id, payload)
+                    except asyncio.TimeoutError:
+                        # 응답 지연은 재연결해도 나아지지 않으므로 바로 로컬 전달로
+                        raise
+                    except (ConnectionError, OSError, asyncio.IncompleteReadError):
+                        # 유휴 연결이 끊긴 경우 한 번 재연결 후 재시도
+                        await self._pub.close()
+                        await self._pub.connect()
+                        await self._execute_publish(room_id, payload)
+                except BaseException:
+                    # 응답을 다 읽지 못한 연결(타임아웃 포함)은 재사용하지 않음
+                    await self._pub.close()
+                    raise
+            self.published += 1
+        except Exception as e:
+            self.publish_errors += 1
+            logger.error(f"채팅 메시지 publish 실패 - 로컬 소켓에만 전달: room={room_id}, {e}")
+            await self._dispatch(room_id, message)
+
+    async def _execute_publish(self, room_id: int, payload: str) -> None:
+        # Redis가 느리거나 연결이 반쯤 끊겨도 전송이 멈추지 않도록 응답 대기 시간 제한
+        # (시간 초과 시 publish의 예외 처리로 넘어가 로컬 전달로 대체)
+        await asyncio.wait_for(
+            self._pub.execute("PUBLISH", self._channel(room_id), payload),
+            settings.CHAT_REDIS_COMMAND_TIMEOUT,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        data = super().stats()
+        data.update({
+            "node_id": self._node_id,
+            "subscriber_connected": self._sub.connected,
+            "publisher_connected": self._pub.connected,
+            "reconnects": self.reconnects,
+        })
+        return data
+
+
+def create_chat_broker(channel_prefix: Optional[str] = None) -> ChatBroker:
+    """
+    CHAT_BROKER 설정에 맞는 브로커 생성
+    channel_prefix를 주면 같은 Redis에서 채널 이름만 다른 별도 브로커 (예: 알림 push)
+    """
+    kind = (settings.CHAT_BROKER or "memory").lower()
+    if kind == "redis":
+        return RedisBroker(settings.CHAT_REDIS_URL, channel_prefix or settings.CHAT_REDIS_CHANNEL_PREFIX)
+    if kind != "memory":
+        logger.warning(f"⚠️ 알 수 없는 CHAT_BROKER={settings.CHAT_BROKER} - memory 브로커 사용")
+    return InProcessBroker()
+
+
+# 싱글톤 인스턴스
+chat_broker = create_chat_broker()
@@ -0,0 +1,202 @@
+"""
+프로세스 로컬 WebSocket 채팅 연결 관리 (방별 팬아웃)
+
+- 연결마다 크기 제한이 있는 송신 큐 + 전용 writer 태스크
+  → 브로드캐스트는 큐에 넣기만 하므로 느린 클라이언트 하나가 방 전체/보낸 사람의 수신 루프를 막지 않음
+- 메시지는 방 단위로 한 번만 JSON 인코딩하고 같은 문자열을 모든 연결에 공유
+- 큐가 가득 차거나 전송이 CHAT_WS_SEND_TIMEOUT을 넘기면 느린 소비자로 보고 연결 종료
+- 방별 팬아웃 지연시간(큐 투입→전송 완료), 큐 길이, 강제 종료 수 메트릭 제공
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+from fastapi import WebSocket
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# WebSocket close code: 1013 Try Again Later (서버 과부하/느린 소비자)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    return json.dumps(message, ensure_ascii=False, default=str)
+
+
+class ChatConnection:
+    """WebSocket 하나 + 송신 큐 + writer 태스크"""
+
+    def __init__(self, hub: "ChatHub", room_id: int, websocket: WebSocket):
+        self.hub = hub
+        self.room_id = room_id
+        self.websocket = websocket
+        self.queue: "asyncio.Queue[tuple[str, float]]" = asyncio.Queue(maxsize=settings.CHAT_WS_QUEUE_SIZE)
+        self.closed = False
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, text: str) -> bool:
+        """큐에 넣기 (가득 차면 False)"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait((text, time.perf_counter()))
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def send_json(self, message: Dict[str, Any]) -> None:
+        """이 연결에만 보내는 메시지 (에러 응답 등) - writer 태스크를 거쳐 순서 보장"""
+        if not self.enqueue(encode_message(message)):
+            await self.hub.evict(self, "queue full")
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                text, enqueued_at = await self.queue.get()
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(text), timeout=settings.CHAT_WS_SEND_TIMEOUT)
+                except asyncio.TimeoutError:
+                    await self.hub.evict(self, "send timeout")
+                    return
+                except Exception:
+                    # 이미 끊어진 연결 - 수신 루프 쪽에서 정리됨
+                    self.closed = True
+                    return
+                self.hub.record_sent(self.room_id, time.perf_counter() - enqueued_at)
+        except asyncio.CancelledError:
+            pass
+
+    async def close(self, code: Optional[int] = None) -> None:
+        if self.closed and code is None:
+            return
+        self.closed = True
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        # 보내지 못한 메시지 버림
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        if code is not None:
+            try:
+                await self.websocket.close(code=code)
+            except Exception:
+                pass
+
+
+class _RoomStats:
+    __slots__ = ("messages", "deliveries", "evictions", "latency_total", "latency_max", "latency_count")
+
+    def __init__(self):
+        self.messages = 0
+        self.deliveries = 0
+        self.evictions = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.latency_count = 0
+
+
+class ChatHub:
+    """방별 로컬 연결 목록과 팬아웃"""
+
+    def __init__(self):
+        self.rooms: Dict[int, Set[ChatConnection]] = {}
+        self._stats: Dict[int, _RoomStats] = {}
+        self.evictions = 0
+
+    def _room_stats(self, room_id: int) -> _RoomStats:
+        stats = self._stats.get(room_id)
+        if stats is None:
+            stats = _RoomStats()
+            self._stats[room_id] = stats
+        return stats
+
+    def connect(self, room_id: int, websocket: WebSocket) -> tuple[ChatConnection, bool]:
+        """연결 등록, (연결, 방의 첫 연결 여부) 반환"""
+        conn = ChatConnection(self, room_id, websocket)
+        conn.start()
+        connections = self.rooms.setdefault(room_id, set())
+        first = not connections
+        connections.add(conn)
+        return conn, first
+
+    async def disconnect(self, conn: ChatConnection) -> bool:
+        """연결 해제, 방에 남은 연결이 없으면 True"""
+        await conn.close()
+        connections = self.rooms.get(conn.room_id)
+        if connections is None:
+            return False
+        connections.discard(conn)
+        if connections:
+            return False
+        self.rooms.pop(conn.room_id, None)
+        self._stats.pop(conn.room_id, None)
+        return True
+
+    async def evict(self, conn: ChatConnection, reason: str) -> None:
+        """느린 소비자 강제 종료 (수신 루프가 끊김을 감지하고 disconnect 처리)"""
+        if conn.closed:
+            return
+        self.evictions += 1
+        self._room_stats(conn.room_id).evictions += 1
+        logger.warning(f"⚠️ 느린 WebSocket 소비자 연결 종료: room={conn.room_id}, reason={reason}")
+        # 이후 브로드캐스트 대상에서 바로 제외 (방 정리/구독 해제는 disconnect에서)
+        self.rooms.get(conn.room_id, set()).discard(conn)
+        await conn.close(code=SLOW_CONSUMER_CLOSE_CODE)
+
+    async def broadcast(self, room_id: int, message: Dict[str, Any]) -> None:
+        """방의 모든 로컬 연결에 전달 (한 번 인코딩, 큐에 넣기만 함)"""
+        connections = self.rooms.get(room_id)
+        if not connections:
+            return
+        text = encode_message(message)
+        stats = self._room_stats(room_id)
+        stats.messages += 1
+        overflowed = [conn for conn in list(connections) if not conn.enqueue(text)]
+        for conn in overflowed:
+            await self.evict(conn, "queue full")
+
+    def record_sent(self, room_id: int, elapsed: float) -> None:
+        stats = self._stats.get(room_id)
+        if stats is None:
+            return
+        stats.deliveries += 1
+        stats.latency_count += 1
+        stats.latency_total += elapsed
+        stats.latency_max = max(stats.latency_max, elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        """팬아웃 메트릭 스냅샷 (방별 연결 수/큐 길이/지연시간)"""
+        rooms = {}
+        total_connections = 0
+        for room_id, connections in self.rooms.items():
+            depths = [conn.queue.qsize() for conn in connections]
+            total_connections += len(connections)
+            s = self._room_stats(room_id)
+            rooms[room_id] = {
+                "connections": len(connections),
+                "queue_depth_total": sum(depths),
+                "queue_depth_max": max(depths) if depths else 0,
+                "messages": s.messages,
+                "deliveries": s.deliveries,
+                "evictions": s.evictions,
+                "avg_fanout_ms": round(s.latency_total / s.latency_count * 1000, 2) if s.latency_count else 0.0,
+                "max_fanout_ms": round(s.latency_max * 1000, 2),
+            }
+        return {
+            "rooms": len(self.rooms),
+            "connections": total_connections,
+            "evictions": self.evictions,
+            "queue_size": settings.CHAT_WS_QUEUE_SIZE,
+            "send_timeout": settings.CHAT_WS_SEND_TIMEOUT,
+            "per_room": rooms,
+        }
+
+
+# 싱글톤 인스턴스
+chat_hub = ChatHub()
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     # [AWS Infrastructure - LocalStack/MinIO]
     DDB_ENDPOINT_URL: str = ""
     S3_ENDPOINT_URL: str = ""
+    S3_BUCKET_TEAM: str = "portforge-team"
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
     AWS_REGION: str = "ap-northeast-2"
@@ -32,6 +33,128 @@ class Settings(BaseSettings):
     AI_SERVICE_URL: str = "http://ai-service"
     SUPPORT_SERVICE_URL: str = "http://support-service"
     
+    # [MSA HTTP Connection Pool]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_HTTP_CONNECT_TIMEOUT: float = 5.0
+    MSA_HTTP_MAX_CONNECTIONS: int = 100
+    MSA_HTTP_MAX_KEEPALIVE: int = 20
+    MSA_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    MSA_HTTP_PER_TARGET_LIMIT: int = 50
+    MSA_HTTP2: bool = False
+    
+    # [AWS Client Registry - aioboto3 클라이언트 재사용]
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_HEALTH_TIMEOUT: float = 3.0
+    
+    # [Identity Cache - email → user]
+    IDENTITY_CACHE_TTL: float = 300.0
+    IDENTITY_NEGATIVE_TTL: float = 30.0
+    IDENTITY_CACHE_SIZE: int = 10000
+    IDENTITY_LOOKUP_TIMEOUT: float = 5.0
+    # 무효화 신호 채널 (CHAT_BROKER로 모든 API/채팅 Pod에 전달)
+    IDENTITY_CHANNEL_PREFIX: str = "portforge:identity:"
+    
+    # [Chat Broker - WebSocket Pod 간 브로드캐스트]
+    # memory: 단일 Pod용, redis: 여러 Pod로 스케일 아웃 시 사용
+    CHAT_BROKER: str = "memory"
+    CHAT_REDIS_URL: str = "redis://localhost:6379/0"
+    CHAT_REDIS_CHANNEL_PREFIX: str = "portforge:chat:"
+    CHAT_REDIS_CONNECT_TIMEOUT: float = 5.0
+    # PUBLISH 응답 대기 시간 (초과 시 이 Pod 소켓에만 전달)
+    CHAT_REDIS_COMMAND_TIMEOUT: float = 1.0
+    CHAT_REDIS_RECONNECT_MIN: float = 0.5
+    CHAT_REDIS_RECONNECT_MAX: float = 10.0
+    
+    # [Chat WebSocket Fan-out]
+    # 연결별 송신 큐 크기, 넘치거나 전송이 타임아웃되면 느린 소비자로 보고 연결 종료
+    CHAT_WS_QUEUE_SIZE: int = 256
+    CHAT_WS_SEND_TIMEOUT: float = 5.0
+    
+    # [Chat Persistence - DynamoDB write-behind]
+    # write_behind: 즉시 브로드캐스트 후 배치 저장 / durable: 배치 저장 완료 후 응답 / sync: 요청마다 put_item
+    CHAT_PERSIST_MODE: str = "write_behind"
+    CHAT_WRITE_BATCH_SIZE: int = 25
+    CHAT_WRITE_FLUSH_INTERVAL: float = 0.2
+    CHAT_WRITE_QUEUE_MAX: int = 10000
+    CHAT_WRITE_MAX_RETRIES: int = 5
+    CHAT_WRITE_RETRY_BASE: float = 0.05
+    CHAT_WRITE_SHUTDOWN_TIMEOUT: float = 20.0
+    
+    # [Chat Sort Key / Idempotency]
+    # client_msg_id로 재전송을 걸러내는 기간/개수, 정렬 키에 클라이언트 시각을 허용하는 오차(초)
+    CHAT_IDEMPOTENCY_TTL: float = 600.0
+    CHAT_IDEMPOTENCY_CACHE_SIZE: int = 10000
+    CHAT_CLIENT_TS_SKEW: float = 300.0
+    
+    # [Chat Write Sharding - 핫 채팅방 파티션 분산]
+    # CHAT_HOT_ROOMS="방ID:샤드수,..." 고정 지정, CHAT_SHARD_ADAPTIVE면 쓰기 속도에 따라 자동 확장
+    CHAT_HOT_ROOMS: str = ""
+    CHAT_SHARD_ADAPTIVE: bool = False
+    CHAT_SHARD_MAX: int = 16
+    CHAT_SHARD_HOT_WRITES_PER_SEC: float = 200.0
+    CHAT_SHARD_WINDOW: float = 30.0
+    CHAT_SHARD_CACHE_TTL: float = 30.0
+    
+    # [Chat Archive - 오래된 채팅을 S3 일별 파일로 이동]
+    # AFTER_DAYS보다 오래된 날짜는 S3에서 조회, DynamoDB 항목은 S3 저장 후 GRACE_DAYS 뒤 TTL로 삭제
+    CHAT_ARCHIVE_ENABLED: bool = False
+    CHAT_ARCHIVE_AFTER_DAYS: int = 30
+    CHAT_ARCHIVE_GRACE_DAYS: int = 7
+    CHAT_ARCHIVE_READ_CONCURRENCY: int = 8
+    
+    # [Meeting Feed - 회의 메시지 카운터]
+    # 새 메시지만 조회하는 최소 간격, WebSocket 카운터 push 묶음 간격, 최초 복원 시 역방향 조회 한도
+    CHAT_MEETING_REFRESH_INTERVAL: float = 2.0
+    CHAT_MEETING_PUSH_INTERVAL: float = 1.0
+    CHAT_MEETING_BOOTSTRAP_PAGE: int = 200
+    CHAT_MEETING_BOOTSTRAP_MAX: int = 5000
+    CHAT_MEETING_ROOMS_MAX: int = 5000
+
+    # [Recent Messages - 방별 최근 메시지 링 버퍼]
+    # 구독 중인 방마다 최근 N개를 메모리에 보관해 접속 시 기록을 바로 응답 (0이면 끔)
+    # 전체 메모리 상한 (support-chat limit 512Mi 기준 64MB)
+    CHAT_RECENT_PER_ROOM: int = 200
+    CHAT_RECENT_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # [Unread Counters - 채팅방 안 읽은 수]
+    # WebSocket 구독자에게 안 읽은 수를 다시 계산해 push하는 주기(초, 0이면 push 안 함)와 동시 계산 수
+    CHAT_UNREAD_PUSH_INTERVAL: float = 5.0
+    CHAT_UNREAD_REFRESH_CONCURRENCY: int = 16
+
+    # [Notification Push - 알림 SSE 스트림]
+    # 새 알림이 커밋되면 CHAT_BROKER로 모든 Pod에 알리고, 해당 사용자의 스트림이 커서 이후 알림을 전송
+    # HEARTBEAT: 연결 유지용 주석 전송 주기(초, ALB idle timeout 60초보다 짧게)
+    NOTIFICATION_PUSH_ENABLED: bool = True
+    NOTIFICATION_CHANNEL_PREFIX: str = "portforge:noti:"
+    NOTIFICATION_STREAM_HEARTBEAT: float = 20.0
+    NOTIFICATION_STREAM_CATCHUP_LIMIT: int = 100
+    # 클라이언트 재연결 대기(ms) - SSE retry 필드
+    NOTIFICATION_STREAM_RETRY_MS: int = 5000
+
+    # [Rate Limit - 사용자/IP 토큰 버킷]
+    # 정책 형식: "user=횟수/초,ip=횟수/초" (해당 scope를 빼면 그 기준으로는 제한 안 함)
+    # BACKEND=redis면 모든 Pod가 버킷을 공유 (Redis 장애 시 RATE_LIMIT_REDIS_RETRY초 동안 Pod 로컬 버킷 사용)
+    # TRUSTED_PROXIES: X-Forwarded-For 오른쪽에서 몇 번째 값을 클라이언트 IP로 볼지
+    #   (ALB 1단 = 1, 헤더 없는 요청은 내부 호출로 보고 IP 제한 안 함 / 0이면 헤더 무시하고 접속 IP 사용)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_REDIS_URL: str = ""
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.5
+    RATE_LIMIT_REDIS_POOL: int = 4
+    RATE_LIMIT_REDIS_RETRY: float = 10.0
+    RATE_LIMIT_KEY_PREFIX: str = "portforge:rl:"
+    RATE_LIMIT_MEMORY_KEYS: int = 100000
+    RATE_LIMIT_TRUSTED_PROXIES: int = 1
+    # 모든 쓰기 요청(POST/PUT/PATCH/DELETE) 공통 상한
+    RATE_LIMIT_WRITE: str = "user=120/60,ip=300/60"
+    # 채팅 전송 (REST/WebSocket 공통), 알림 생성
+    RATE_LIMIT_CHAT_SEND: str = "user=20/10,ip=60/10"
+    RATE_LIMIT_NOTIFICATION_CREATE: str = "user=30/60,ip=120/60"
+    # AI 생성 프록시 (/tests/generate)
+    RATE_LIMIT_AI_GENERATE: str = "user=10/60,ip=30/60"
+    # WebSocket에서 제한에 연속으로 걸린 횟수가 이 값을 넘으면 연결 종료 (도배 방지)
+    CHAT_WS_FLOOD_STRIKES: int = 10
+    
     # [CORS]
     CORS_ORIGINS: str = "*"
     
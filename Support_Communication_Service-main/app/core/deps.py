@@ -11,7 +11,7 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> Dict[
     """
     Authorization 헤더에서 사용자 정보를 추출합니다.
     - Bearer 토큰이 있으면 JWT 페이로드에서 email 추출
-    - email로 Auth Service API 호출하여 실제 user_id 반환
+    - email로 Auth Service API 호출하여 실제 user_id 반환 (identity_cache로 캐싱)
     - 없으면 더미 사용자 반환
     """
     if authorization and authorization.startswith("Bearer "):
@@ -32,22 +32,16 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> Dict[
                 email = payload.get("email")
                 jwt_sub = payload.get("sub")
                 
-                logger.info(f"✅ JWT 파싱 성공: email={email}, sub={jwt_sub}")
+                logger.debug(f"✅ JWT 파싱 성공: email={email}, sub={jwt_sub}")
                 
-                # email로 Auth Service API 호출
+                # email로 사용자 조회 (identity_cache 경유, 미스일 때만 Auth Service 호출)
                 if email:
                     try:
-                        from app.utils.msa_client import msa_client
-                        user_data = await msa_client.get_user_by_email(email)
+                        from app.core.identity_cache import identity_cache
+                        user = await identity_cache.get(email)
                         
-                        if user_data:
-                            # Auth Service가 직접 데이터를 반환 (ResponseEnvelope 없음)
-                            logger.info(f"✅ Auth Service 조회 성공: user_id={user_data.get('user_id')}")
-                            return {
-                                "id": user_data.get("user_id"),
-                                "email": user_data.get("email"),
-                                "nickname": user_data.get("nickname"),
-                            }
+                        if user:
+                            return user
                         else:
                             logger.warning(f"⚠️ Auth Service에 사용자 없음: email={email}")
                     except Exception as e:
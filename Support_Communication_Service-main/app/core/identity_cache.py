@@ -0,0 +1,208 @@
+"""
+email → 사용자 정보 캐시 (Support Service 프로세스 내부)
+
+get_current_user가 요청마다 Auth Service `/auth/internal/user-by-email`을 호출하지 않도록
+조회 결과를 메모리에 보관합니다.
+
+- TTL + LRU: IDENTITY_CACHE_TTL 동안 유효, IDENTITY_CACHE_SIZE 초과 시 오래된 항목부터 제거
+- 네거티브 캐시: Auth에 없는 email(404)은 IDENTITY_NEGATIVE_TTL 동안 "없음"으로 기억
+  (타임아웃/5xx 같은 일시적 실패는 캐시하지 않음)
+- single-flight: 같은 email에 대한 동시 조회는 Auth 호출 1회로 합침
+- 무효화: Auth가 닉네임 변경/회원 탈퇴 시 /internal/identity-cache/invalidate 호출
+  → 요청을 받은 Pod가 채팅과 같은 브로커(CHAT_BROKER)의 IDENTITY_CHANNEL_PREFIX 채널로 발행하고
+    API/채팅 Pod 모두 구독 중이라 각자 로컬 캐시에서 제거
+  → 브로커 재연결 사이에 놓친 신호는 IDENTITY_CACHE_TTL이 지나면 반영됨
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.chat_broker import create_chat_broker
+from app.core.config import settings
+from app.utils.http_pool import http_pool
+
+logger = logging.getLogger(__name__)
+
+# 네거티브 캐시 항목 표시용
+_NOT_FOUND: Dict[str, Any] = {}
+
+# 무효화 신호는 채널 하나(room 0)로 발행
+INVALIDATION_ROOM = 0
+
+
+class IdentityLookupError(Exception):
+    """Auth Service 조회 중 일시적 오류 (캐시하지 않음)"""
+
+
+class IdentityCache:
+    """email 기준 TTL/LRU 사용자 캐시"""
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._broker = create_chat_broker(settings.IDENTITY_CHANNEL_PREFIX)
+        self._broker.set_handler(self._on_invalidate)
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.invalidation_signals = 0
+
+    async def start(self) -> None:
+        await self._broker.start()
+        await self._broker.subscribe(INVALIDATION_ROOM)
+
+    async def close(self) -> None:
+        await self._broker.close()
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return email.strip().lower()
+
+    # -----------------------------------------------------------------
+    # 캐시 조회/저장
+    # -----------------------------------------------------------------
+    def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def _store(self, key: str, user: Optional[Dict[str, Any]]) -> None:
+        ttl = settings.IDENTITY_CACHE_TTL if user else settings.IDENTITY_NEGATIVE_TTL
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, user or _NOT_FOUND)
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.IDENTITY_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    async def _fetch(self, email: str) -> Optional[Dict[str, Any]]:
+        """Auth Service 조회 (404면 None, 그 외 실패는 IdentityLookupError)"""
+        url = f"{settings.AUTH_SERVICE_URL}/auth/internal/user-by-email"
+        try:
+            async with http_pool.target("auth", timeout=settings.IDENTITY_LOOKUP_TIMEOUT) as client:
+                response = await client.get(url, params={"email": email})
+        except Exception as e:
+            raise IdentityLookupError(str(e)) from e
+
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise IdentityLookupError(f"{response.status_code} - {response.text}")
+
+        # Auth Service가 직접 데이터를 반환 (ResponseEnvelope 없음)
+        data = response.json()
+        return {
+            "id": data.get("user_id"),
+            "email": data.get("email"),
+            "nickname": data.get("nickname"),
+        }
+
+    async def get(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        email로 사용자 정보 반환
+        - 캐시 히트: 즉시 반환 (네거티브 캐시면 None)
+        - 미스: 같은 email의 진행 중인 조회가 있으면 그 결과를 함께 기다림
+        - Auth 일시 장애 시 IdentityLookupError
+        """
+        key = self._key(email)
+        cached = self._get_cached(key)
+        if cached is not None:
+            if cached is _NOT_FOUND:
+                self.negative_hits += 1
+                return None
+            self.hits += 1
+            return dict(cached)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            user = await asyncio.shield(inflight)
+            return dict(user) if user else None
+
+        self.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            user = await self._fetch(email)
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            # 조회 도중 무효화되었다면 옛 값을 캐시하지 않음
+            if self._inflight.get(key) is future:
+                self._store(key, user)
+            future.set_result(user)
+            return dict(user) if user else None
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    # -----------------------------------------------------------------
+    # 무효화
+    # -----------------------------------------------------------------
+    def invalidate(self, email: Optional[str] = None, user_id: Optional[str] = None) -> int:
+        """email 또는 user_id에 해당하는 항목 제거, 제거된 개수 반환"""
+        keys = set()
+        if email:
+            keys.add(self._key(email))
+        if user_id:
+            keys.update(
+                k for k, (_, user) in self._entries.items()
+                if user is not _NOT_FOUND and str(user.get("id")) == str(user_id)
+            )
+
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+            # 진행 중인 조회 결과가 캐시에 들어가지 않도록 분리
+            self._inflight.pop(key, None)
+        self.invalidations += removed
+        return removed
+
+    async def broadcast_invalidate(self, email: Optional[str] = None, user_id: Optional[str] = None) -> None:
+        """모든 Pod(이 Pod 포함)의 캐시에서 제거하도록 브로커로 발행 (발행 실패 시 이 Pod만 제거됨)"""
+        await self._broker.publish(INVALIDATION_ROOM, {"email": email, "user_id": user_id})
+
+    async def _on_invalidate(self, room_id: int, message: Dict[str, Any]) -> None:
+        self.invalidation_signals += 1
+        self.invalidate(email=message.get("email"), user_id=message.get("user_id"))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 현황 (모니터링용)"""
+        negative = sum(1 for _, user in self._entries.values() if user is _NOT_FOUND)
+        return {
+            "size": len(self._entries),
+            "negative_entries": negative,
+            "max_size": settings.IDENTITY_CACHE_SIZE,
+            "ttl_seconds": settings.IDENTITY_CACHE_TTL,
+            "negative_ttl_seconds": settings.IDENTITY_NEGATIVE_TTL,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "invalidation_signals": self.invalidation_signals,
+            "broker": self._broker.stats(),
+        }
+
+
+# 싱글톤 인스턴스
+identity_cache = IdentityCache()
@@ -5,6 +5,14 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from app.core.middleware import LoggingMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from app.controllers import all_routers
+from app.utils.http_pool import http_pool
+from app.core.database import aws_manager
+from app.core.chat_broker import chat_broker
+from app.core.identity_cache import identity_cache
+from app.services.chat_writer import chat_writer
+from app.services.unread_feed import unread_feed
+from app.services.notification_feed import notification_feed
+from app.utils.rate_limit import RateLimitMiddleware, rate_limiter
 import logging
 import sys
 
@@ -23,6 +31,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 0. 쓰기 요청 공통 제한 (가장 안쪽에 두어 429 응답에도 로그/CORS 헤더가 적용되도록 먼저 등록)
+app.add_middleware(RateLimitMiddleware, policy="write")
+
 # 1. 로그 미들웨어 등록
 app.add_middleware(LoggingMiddleware)
 
@@ -42,6 +53,70 @@ Instrumentator().instrument(app).expose(app)
 for router, prefix, tag in all_routers:
     app.include_router(router, prefix=prefix, tags=[tag])
 
+# 서비스 간 통신용 HTTP 커넥션 풀 (프로세스당 1개, keep-alive 재사용)
+@app.on_event("startup")
+async def start_http_pool():
+    await http_pool.start()
+
+@app.on_event("shutdown")
+async def close_http_pool():
+    await http_pool.close()
+
+# 사용자 정보 캐시 무효화 신호 구독 (Pod 간 전달)
+@app.on_event("startup")
+async def start_identity_cache():
+    await identity_cache.start()
+
+@app.on_event("shutdown")
+async def close_identity_cache():
+    await identity_cache.close()
+
+# 채팅 Pub/Sub 브로커 (Pod 간 WebSocket 브로드캐스트)
+@app.on_event("startup")
+async def start_chat_broker():
+    await chat_broker.start()
+
+@app.on_event("shutdown")
+async def close_chat_broker():
+    await chat_broker.close()
+
+# 채팅 메시지 write-behind 저장 (종료 시 남은 메시지 flush)
+@app.on_event("startup")
+async def start_chat_writer():
+    await chat_writer.start()
+
+@app.on_event("shutdown")
+async def flush_chat_writer():
+    await chat_writer.close()
+
+# 채팅 안 읽은 수 WebSocket push
+@app.on_event("startup")
+async def start_unread_feed():
+    await unread_feed.start()
+
+@app.on_event("shutdown")
+async def close_unread_feed():
+    await unread_feed.close()
+
+# 알림 push 신호 (Pod 간 새 알림 도착 알림)
+@app.on_event("startup")
+async def start_notification_feed():
+    await notification_feed.start()
+
+@app.on_event("shutdown")
+async def close_notification_feed():
+    await notification_feed.close()
+
+# 요청 제한 Redis 연결 종료
+@app.on_event("shutdown")
+async def close_rate_limiter():
+    await rate_limiter.close()
+
+# 공유 AWS 클라이언트 (DynamoDB/S3 등) 종료 - write-behind flush 이후에 실행
+@app.on_event("shutdown")
+async def close_aws_clients():
+    await aws_manager.close()
+
 # 전역 예외 핸들러: 한 번 등록하면 팀원들은 신경 안 써도 됨
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
@@ -52,7 +127,8 @@ async def business_exception_handler(request: Request, exc: BusinessException):
             "code": exc.error_code.biz_code,
             "message": exc.message,
             "data": None
-        }
+        },
+        headers=getattr(exc, "headers", None)
     )
 
 @app.get("/")
@@ -5,6 +5,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum as SAEnum,
+    Index,
     String,
     Text,
     func,
@@ -48,13 +49,20 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     notification_id = Column(BigInteger, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), nullable=False, index=True)
+    user_id = Column(String(36), nullable=False)
     message = Column(Text)
     link = Column(Text)
     is_read = Column(Boolean, nullable=False, server_default="0")
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # 목록 (최신순 커서 페이지)
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # 안 읽은 수 COUNT (인덱스만으로 처리) / 안 읽은 알림 목록
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+    )
+
 
 class Notice(Base):
     __tablename__ = "notices"
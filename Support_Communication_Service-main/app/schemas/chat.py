@@ -14,4 +14,6 @@ class ChatLogResponse(BaseModel):
 class ChatMessageRequest(BaseModel):
     user_id: str
     message: str
-    timestamp: Optional[str] = None
\ No newline at end of file
+    timestamp: Optional[str] = None
+    # 재전송 중복 방지용 클라이언트 메시지 ID (timestamp와 함께 보내면 같은 정렬 키로 저장)
+    client_msg_id: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+채팅 메시지 계층 저장소 (DynamoDB 최근분 + S3 일별 아카이브)
+
+- compaction 작업(chat_compactor)이 CHAT_ARCHIVE_AFTER_DAYS보다 오래된 날짜를
+  방/날짜별 gzip JSONL 파일로 S3에 저장 (teams/{room_id}/chats/{date}/messages.jsonl.gz)
+- DynamoDB 항목의 expire_at(TTL)은 파일 저장에 성공한 뒤에만 compaction 작업이 붙임
+  (CHAT_ARCHIVE_GRACE_DAYS일 뒤 자동 삭제) → 아카이브되지 않은 메시지는 삭제되지 않음
+- 조회 시 아카이브 경계(cutoff) 이전 날짜는 S3 파일을 읽고, 파일이 없으면 DynamoDB로 대체
+  → 여러 달 기간 조회(포트폴리오 생성용)도 DynamoDB 쿼리 없이 파일 몇 개로 처리
+
+날짜는 정렬 키(UTC ISO)의 앞 10자리(YYYY-MM-DD) 기준입니다.
+"""
+import asyncio
+import gzip
+import json
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.database import aws_manager
+from app.utils.s3_paths import s3_path_manager
+
+logger = logging.getLogger(__name__)
+
+
+def cutoff_day() -> str:
+    """이 날짜(UTC)보다 이전은 아카이브 대상"""
+    return (datetime.now(timezone.utc).date() - timedelta(days=settings.CHAT_ARCHIVE_AFTER_DAYS)).isoformat()
+
+
+def days_between(start_day: str, end_day: str) -> List[str]:
+    """start_day ~ end_day (포함) 날짜 목록"""
+    start, end = date.fromisoformat(start_day), date.fromisoformat(end_day)
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+def encode_archive(messages: Iterable[Dict[str, Any]]) -> bytes:
+    lines = "".join(json.dumps(m, ensure_ascii=False, separators=(",", ":")) + "\n" for m in messages)
+    return gzip.compress(lines.encode("utf-8"))
+
+
+def decode_archive(body: bytes) -> List[Dict[str, Any]]:
+    text = gzip.decompress(body).decode("utf-8")
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+class ChatArchiveStore:
+    """S3 일별 아카이브 읽기/쓰기"""
+
+    def __init__(self):
+        self.reads = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.CHAT_ARCHIVE_ENABLED
+
+    @staticmethod
+    def key(room_id: int, day: str) -> str:
+        return s3_path_manager.team_chat_archive(room_id, day)
+
+    async def get(self, room_id: int, day: str) -> Optional[List[Dict[str, Any]]]:
+        """아카이브 파일 읽기 (없으면 None)"""
+        async with aws_manager.get_s3_client() as s3:
+            try:
+                resp = await s3.get_object(Bucket=settings.S3_BUCKET_TEAM, Key=self.key(room_id, day))
+            except Exception as e:
+                if "NoSuchKey" in str(e) or "404" in str(e):
+                    self.misses += 1
+                    return None
+                raise
+            body = await resp["Body"].read()
+        self.reads += 1
+        return decode_archive(body)
+
+    async def put(self, room_id: int, day: str, messages: List[Dict[str, Any]]) -> None:
+        async with aws_manager.get_s3_client() as s3:
+            await s3.put_object(
+                Bucket=settings.S3_BUCKET_TEAM,
+                Key=self.key(room_id, day),
+                Body=encode_archive(messages),
+                ContentType="application/x-ndjson",
+                ContentEncoding="gzip",
+            )
+        self.writes += 1
+
+    async def get_many(self, room_id: int, days: List[str]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """여러 날짜 파일을 병렬로 읽기 (동시 요청 수 CHAT_ARCHIVE_READ_CONCURRENCY)"""
+        sem = asyncio.Semaphore(settings.CHAT_ARCHIVE_READ_CONCURRENCY)
+
+        async def one(day: str):
+            async with sem:
+                return day, await self.get(room_id, day)
+
+        return dict(await asyncio.gather(*[one(day) for day in days]))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "after_days": settings.CHAT_ARCHIVE_AFTER_DAYS,
+            "cutoff_day": cutoff_day(),
+            "reads": self.reads,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+
+# 싱글톤 인스턴스
+chat_archive = ChatArchiveStore()
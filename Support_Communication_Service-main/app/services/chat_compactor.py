@@ -0,0 +1,145 @@
+"""
+채팅 일별 compaction (DynamoDB → S3)
+
+CHAT_ARCHIVE_AFTER_DAYS보다 오래된 날짜의 메시지를 방/날짜별 gzip JSONL로 S3에 저장합니다.
+(k8s CronJob에서 `python compact_chats.py`로 하루 한 번 실행)
+
+- 기간 전체를 Scan 한 번으로 읽어 (방, 날짜)별로 묶음 → 샤드 파티션도 원래 방으로 합침
+- 기본 범위는 아카이브 경계 전날까지 TTL(expire_at)이 없는 모든 항목
+  → 실패했거나 건너뛴 날짜도 다음 실행에서 다시 아카이브됨
+- 이미 파일이 있으면 sort_key 기준으로 합쳐 다시 저장 (여러 번 실행해도 결과 동일)
+- 파일 저장에 성공한 (방, 날짜)의 항목에만 CHAT_ARCHIVE_GRACE_DAYS 뒤 만료되도록 TTL 설정
+  (새 메시지는 TTL 없이 저장되므로 아카이브되지 않은 메시지는 삭제되지 않음)
+- 테이블 TTL 속성(expire_at)이 꺼져 있으면 켬
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.chat_archive import chat_archive, cutoff_day
+from app.services.chat_service import TEAM_CHATS_TABLE, _ddb_client_ctx, _parse_chat_item
+from app.services.chat_shards import room_of_partition
+
+logger = logging.getLogger(__name__)
+
+TTL_ATTRIBUTE = "expire_at"
+
+
+class ChatCompactor:
+
+    async def ensure_ttl(self) -> None:
+        """team_chats 테이블의 TTL 속성 활성화"""
+        async with _ddb_client_ctx() as client:
+            desc = await client.describe_time_to_live(TableName=TEAM_CHATS_TABLE)
+            status = desc.get("TimeToLiveDescription", {}).get("TimeToLiveStatus")
+            if status in ("ENABLED", "ENABLING"):
+                return
+            await client.update_time_to_live(
+                TableName=TEAM_CHATS_TABLE,
+                TimeToLiveSpecification={"Enabled": True, "AttributeName": TTL_ATTRIBUTE},
+            )
+            logger.info(f"{TEAM_CHATS_TABLE} TTL 활성화 ({TTL_ATTRIBUTE})")
+
+    async def _scan(self, start_day: Optional[str], end_day: str) -> Dict[Tuple[int, str], List[Dict[str, Any]]]:
+        """
+        기간 내 메시지를 (방, 날짜)별로 묶어 반환
+        start_day가 없으면 end_day까지 아직 아카이브되지 않은(TTL 없는) 항목 전체
+        """
+        groups: Dict[Tuple[int, str], List[Dict[str, Any]]] = defaultdict(list)
+        values: Dict[str, Any] = {":end": {"S": f"{end_day}T~"}}
+        if start_day:
+            condition = "#ts BETWEEN :start AND :end"
+            values[":start"] = {"S": f"{start_day}T"}
+        else:
+            condition = f"#ts <= :end AND attribute_not_exists({TTL_ATTRIBUTE})"
+        params: Dict[str, Any] = {
+            "TableName": TEAM_CHATS_TABLE,
+            "FilterExpression": condition,
+            "ExpressionAttributeNames": {"#ts": "timestamp"},
+            "ExpressionAttributeValues": values,
+        }
+        async with _ddb_client_ctx() as client:
+            while True:
+                resp = await client.scan(**params)
+                for item in resp.get("Items", []):
+                    room_id = room_of_partition(int(item["project_id"]["N"]))
+                    if room_id <= 0:
+                        continue
+                    groups[(room_id, item["timestamp"]["S"][:10])].append(item)
+                last_key = resp.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                params["ExclusiveStartKey"] = last_key
+        return groups
+
+    async def _archive(self, room_id: int, day: str, items: List[Dict[str, Any]]) -> int:
+        existing = await chat_archive.get(room_id, day) or []
+        merged = {m["sort_key"]: m for m in existing}
+        for it in items:
+            m = _parse_chat_item(room_id, it)
+            m.pop("project_id", None)
+            merged[m["sort_key"]] = m
+        messages = [merged[k] for k in sorted(merged)]
+        await chat_archive.put(room_id, day, messages)
+        return len(messages)
+
+    async def _expire_archived(self, items: List[Dict[str, Any]]) -> int:
+        """TTL이 없는 항목에 expire_at 설정 (아카이브 저장 후에만 호출)"""
+        pending = [it for it in items if TTL_ATTRIBUTE not in it]
+        if not pending:
+            return 0
+        expires = str(int(time.time()) + settings.CHAT_ARCHIVE_GRACE_DAYS * 86400)
+        sem = asyncio.Semaphore(16)
+        async with _ddb_client_ctx() as client:
+            async def one(it):
+                async with sem:
+                    await client.update_item(
+                        TableName=TEAM_CHATS_TABLE,
+                        Key={"project_id": it["project_id"], "timestamp": it["timestamp"]},
+                        UpdateExpression=f"SET {TTL_ATTRIBUTE} = :exp",
+                        ExpressionAttributeValues={":exp": {"N": expires}},
+                    )
+            await asyncio.gather(*[one(it) for it in pending])
+        return len(pending)
+
+    async def run(self, start_day: Optional[str] = None, end_day: Optional[str] = None) -> Dict[str, Any]:
+        """
+        start_day ~ end_day(포함) 날짜를 아카이브
+        기본값: 아카이브 경계 전날까지 아직 아카이브되지 않은 모든 날짜
+        반환값의 failed가 비어 있지 않으면 실패한 (방, 날짜)가 있는 것 (실행 스크립트가 0이 아닌 코드로 종료)
+        """
+        last_archivable = (date.fromisoformat(cutoff_day()) - timedelta(days=1)).isoformat()
+        end_day = min(end_day or last_archivable, last_archivable)
+        started = time.perf_counter()
+
+        await self.ensure_ttl()
+        groups = await self._scan(start_day, end_day)
+        archived = expired = 0
+        failed: List[str] = []
+        for (room_id, day), items in sorted(groups.items()):
+            try:
+                archived += await self._archive(room_id, day, items)
+                expired += await self._expire_archived(items)
+            except Exception:
+                # 실패한 방/날짜는 TTL을 붙이지 않으므로 삭제되지 않고 다음 실행에서 다시 시도됨
+                logger.exception(f"채팅 아카이브 실패: room={room_id}, day={day}")
+                failed.append(f"{room_id}/{day}")
+        result = {
+            "start_day": start_day,
+            "end_day": end_day,
+            "files": len(groups),
+            "messages": archived,
+            "ttl_set": expired,
+            "failed": failed,
+            "elapsed_seconds": round(time.perf_counter() - started, 1),
+        }
+        logger.info(f"채팅 compaction 완료: {result}")
+        return result
+
+
+# 싱글톤 인스턴스
+chat_compactor = ChatCompactor()
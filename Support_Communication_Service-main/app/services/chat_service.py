@@ -1,4 +1,8 @@
+import asyncio
+import base64
 import datetime
+import heapq
+import json
 import uuid
 from typing import Any, Dict, List
 
@@ -6,10 +10,18 @@ from botocore.exceptions import ClientError
 
 from app.core.database import aws_manager
 from app.core.config import settings
+from app.services.chat_archive import chat_archive, cutoff_day, days_between
+from app.services.chat_shards import shard_directory
+from app.services.recent_messages import recent_messages
+from app.utils.sort_keys import iso_to_us, message_id_for, sort_key_generator, us_to_iso
 
 TEAM_CHATS_TABLE = settings.DYNAMODB_TABLE_CHATS
 CHAT_ROOMS_TABLE = settings.DYNAMODB_TABLE_ROOMS
 
+# team_chats 정렬 키: "{UTC ISO 시각}#{노드 ID 또는 idempotency 접미사}"
+# 시각이 앞에 있으므로 기존 ISO 문자열 기간 조회(BETWEEN/>=/<=)가 그대로 동작
+SORT_KEY_SEP = "#"
+
 
 def _iso_now() -> str:
     return datetime.datetime.utcnow().isoformat()
@@ -17,9 +29,11 @@ def _iso_now() -> str:
 
 def _ddb_client_ctx():
     """
-    aioboto3 client context factory (async with 사용).
+    공유 aioboto3 DynamoDB client (async with 사용, 종료 시 닫지 않음).
+    프로세스당 한 번만 생성되고 shutdown 시 aws_manager.close()에서 정리됩니다.
     """
-    return aws_manager.session.client(
+    return aws_manager.clients.client(
+        "dynamodb:chat",
         "dynamodb",
         endpoint_url=settings.DDB_ENDPOINT_URL or None,
         region_name=settings.AWS_REGION,
@@ -28,35 +42,241 @@ def _ddb_client_ctx():
     )
 
 
-async def save_chat_message(project_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+def make_sort_key(client_msg_id: str | None = None, client_time: str | None = None) -> str:
     """
-    Save a chat message to DynamoDB with all required fields.
+    Time-ordered, collision-free sort key for team_chats.
+    With a client_msg_id and the client's send time the key is deterministic,
+    so a retried send overwrites the same item instead of adding a duplicate.
+    """
+    us, suffix = sort_key_generator.next(client_msg_id, iso_to_us(client_time))
+    return f"{us_to_iso(us)}{SORT_KEY_SEP}{suffix}"
+
+
+def sort_key_time(sort_key: str | None) -> str | None:
+    """ISO time part of a sort key (legacy keys are plain ISO strings)."""
+    if not sort_key:
+        return sort_key
+    return sort_key.split(SORT_KEY_SEP, 1)[0]
+
+
+def build_chat_item(project_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the DynamoDB item for a chat message with all required fields.
     Ensures: project_id, timestamp (sort key), message_id, user_id, message, created_at.
+    The client's `timestamp` is only used for the key together with `client_msg_id`.
     """
-    now = _iso_now()
+    client_msg_id = payload.get("client_msg_id")
+    sort_key = make_sort_key(client_msg_id, payload.get("timestamp"))
+    if payload.get("message_id"):
+        message_id = payload["message_id"]
+    elif client_msg_id:
+        message_id = message_id_for(str(project_id), client_msg_id)
+    else:
+        message_id = str(uuid.uuid4())
     item = {
         "project_id": {"N": str(project_id)},
-        "timestamp": {"S": payload.get("timestamp") or now},
-        "message_id": {"S": payload.get("message_id") or str(uuid.uuid4())},
+        "timestamp": {"S": sort_key},
+        "message_id": {"S": message_id},
         "user_id": {"S": str(payload.get("user_id") or "unknown")},
         "message": {"S": payload.get("message") or payload.get("text") or ""},
-        "created_at": {"S": payload.get("created_at") or now},
+        "created_at": {"S": payload.get("created_at") or sort_key_time(sort_key)},
     }
+    if client_msg_id:
+        item["client_msg_id"] = {"S": client_msg_id}
+    return item
+
+
+def chat_item_to_dict(project_id: int, item: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a simplified dict for API responses"""
+    return _parse_chat_item(project_id, item)
+
+
+def build_chat_room_item(user_id: str, room_id: int, updated_at: str | None = None) -> Dict[str, Any]:
+    return {
+        "user_id": {"S": user_id},
+        "room_id": {"N": str(room_id)},
+        "updated_at": {"S": updated_at or _iso_now()},
+    }
+
+
+async def save_chat_message(project_id: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Save a chat message to DynamoDB with all required fields.
+    Ensures: project_id, timestamp (sort key), message_id, user_id, message, created_at.
+    """
+    item = build_chat_item(project_id, payload)
+    await assign_shard(project_id, item)
+    return await put_chat_item(project_id, item)
+
+
+async def assign_shard(project_id: int, item: Dict[str, Any]) -> None:
+    """Point the item at one of the room's write shards (no-op for normal rooms)."""
+    client_msg_id = item.get("client_msg_id", {}).get("S")
+    partition = await shard_directory.partition_for_write(project_id, client_msg_id)
+    item["project_id"] = {"N": str(partition)}
+
 
+async def put_chat_item(project_id: int, item: Dict[str, Any]) -> Dict[str, Any]:
+    """Write an item built by build_chat_item (same key on retry → no duplicate)."""
     async with _ddb_client_ctx() as client:
         try:
             await client.put_item(TableName=TEAM_CHATS_TABLE, Item=item)
         except ClientError as e:
             raise e
 
-    # Return a simplified dict for API responses
+    return chat_item_to_dict(project_id, item)
+
+
+def _parse_chat_item(project_id: int, it: Dict[str, Any]) -> Dict[str, Any]:
+    sort_key = it.get("timestamp", {}).get("S")
     return {
-        "message_id": item["message_id"]["S"],
+        "message_id": it.get("message_id", {}).get("S"),
         "project_id": project_id,
-        "user_id": item["user_id"]["S"],
-        "message": item["message"]["S"],
-        "timestamp": item["timestamp"]["S"],
-        "created_at": item["created_at"]["S"],
+        "user_id": it.get("user_id", {}).get("S"),
+        "message": it.get("message", {}).get("S"),
+        "timestamp": sort_key_time(sort_key),
+        "sort_key": sort_key,  # cursor / dedupe key
+        "client_msg_id": it.get("client_msg_id", {}).get("S"),
+        "created_at": it.get("created_at", {}).get("S"),
+    }
+
+
+def encode_cursor(sort_key: str) -> str:
+    """Opaque pagination cursor for a message sort key."""
+    raw = json.dumps({"k": sort_key}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Return the sort key inside a cursor (ValueError if malformed)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))["k"]
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+    return value
+
+
+async def _query_partition(
+    partition: int,
+    key_expr: str,
+    expr_values: Dict[str, Dict[str, str]],
+    ascending: bool,
+    limit: int | None,
+) -> tuple[List[Dict[str, Any]], bool]:
+    """Query one team_chats partition, following LastEvaluatedKey."""
+    query_params: Dict[str, Any] = {
+        "TableName": TEAM_CHATS_TABLE,
+        "KeyConditionExpression": key_expr,
+        "ExpressionAttributeValues": {**expr_values, ":pid": {"N": str(partition)}},
+        "ScanIndexForward": ascending,
+    }
+    if "#ts" in key_expr:
+        query_params["ExpressionAttributeNames"] = {"#ts": "timestamp"}
+
+    items: List[Dict[str, Any]] = []
+    last_key = None
+    async with _ddb_client_ctx() as client:
+        while True:
+            if limit is not None:
+                query_params["Limit"] = limit - len(items)
+            if last_key:
+                query_params["ExclusiveStartKey"] = last_key
+            resp = await client.query(**query_params)
+            items.extend(resp.get("Items", []))
+            last_key = resp.get("LastEvaluatedKey")
+            if not last_key or (limit is not None and len(items) >= limit):
+                break
+    return items, bool(last_key)
+
+
+async def _query_pages(
+    project_id: int,
+    key_expr: str,
+    expr_values: Dict[str, Dict[str, str]],
+    ascending: bool,
+    limit: int | None,
+) -> tuple[List[Dict[str, Any]], bool]:
+    """
+    Run a key-condition query and follow LastEvaluatedKey until `limit` items
+    are collected (or the range is exhausted when limit is None).
+    Hot rooms written across shards are queried in parallel and merged by sort key.
+    Returns (raw items in query order, has_more).
+    """
+    partitions = await shard_directory.partitions(project_id)
+    if len(partitions) == 1:
+        return await _query_partition(project_id, key_expr, expr_values, ascending, limit)
+
+    results = await asyncio.gather(
+        *[_query_partition(p, key_expr, expr_values, ascending, limit) for p in partitions]
+    )
+    merged = list(heapq.merge(
+        *[items for items, _ in results],
+        key=lambda it: it["timestamp"]["S"],
+        reverse=not ascending,
+    ))
+    has_more = any(more for _, more in results)
+    if limit is not None and len(merged) > limit:
+        merged, has_more = merged[:limit], True
+    return merged, has_more
+
+
+async def list_chat_page(
+    project_id: int,
+    limit: int = 50,
+    before: str | None = None,
+    after: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Cursor page of chat messages, always returned oldest → newest for display.
+    - no cursor: latest `limit` messages (descending query, reversed)
+    - before: `limit` messages older than the cursor (infinite scroll up)
+    - after: `limit` messages newer than the cursor (catch-up)
+    The no-cursor page is served from the in-memory recent buffer when this
+    pod is subscribed to the room.
+    """
+    if not before and not after:
+        cached = recent_messages.latest(project_id, limit)
+        if cached is not None:
+            messages, has_more = cached
+            return {
+                "messages": messages,
+                "has_more": has_more,
+                "next_before": encode_cursor(messages[0]["sort_key"]) if messages and has_more else None,
+                "next_after": encode_cursor(messages[-1]["sort_key"]) if messages else None,
+            }
+
+    expr_values: Dict[str, Dict[str, str]] = {":pid": {"N": str(project_id)}}
+    key_expr = "project_id = :pid"
+
+    if after:
+        key_expr += " AND #ts > :cursor"
+        expr_values[":cursor"] = {"S": decode_cursor(after)}
+        items, has_more = await _query_pages(project_id, key_expr, expr_values, True, limit)
+    else:
+        if before:
+            key_expr += " AND #ts < :cursor"
+            expr_values[":cursor"] = {"S": decode_cursor(before)}
+        items, has_more = await _query_pages(project_id, key_expr, expr_values, False, limit)
+        items.reverse()
+
+    messages = [_parse_chat_item(project_id, it) for it in items]
+    if not before and not after:
+        recent_messages.prime(project_id, messages, complete=not has_more)
+    if after:
+        # catch-up page: keep the given cursor when nothing new arrived
+        next_before = None
+        next_after = encode_cursor(messages[-1]["sort_key"]) if messages else after
+    else:
+        next_before = encode_cursor(messages[0]["sort_key"]) if messages and has_more else None
+        next_after = encode_cursor(messages[-1]["sort_key"]) if messages else None
+    return {
+        "messages": messages,
+        "has_more": has_more,
+        "next_before": next_before,  # older page (scroll up)
+        "next_after": next_after,    # newer messages (live catch-up)
     }
 
 
@@ -68,64 +288,211 @@ async def list_chat_messages(
 ) -> List[Dict[str, Any]]:
     """
     Fetch chat messages for a project ordered by timestamp (ascending).
+    - without a time range: the latest `limit` messages
+    - with a time range: messages in the range from the start, following every
+      page (all of them when limit is None, e.g. meeting transcript exports)
+    - ranges starting before the archive cutoff read the daily S3 archives
     """
-    async with _ddb_client_ctx() as client:
-        expr_values: Dict[str, Dict[str, str]] = {":pid": {"N": str(project_id)}}
-        expr_names: Dict[str, str] | None = None
-        key_expr = "project_id = :pid"
-
-        if start_time and end_time:
-            expr_names = {"#ts": "timestamp"}
-            key_expr = "project_id = :pid AND #ts BETWEEN :start AND :end"
-            expr_values[":start"] = {"S": start_time}
-            expr_values[":end"] = {"S": end_time}
-        elif start_time:
-            expr_names = {"#ts": "timestamp"}
-            key_expr = "project_id = :pid AND #ts >= :start"
-            expr_values[":start"] = {"S": start_time}
-        elif end_time:
-            expr_names = {"#ts": "timestamp"}
-            key_expr = "project_id = :pid AND #ts <= :end"
-            expr_values[":end"] = {"S": end_time}
-
-        query_params: Dict[str, Any] = {
-            "TableName": TEAM_CHATS_TABLE,
-            "KeyConditionExpression": key_expr,
-            "ExpressionAttributeValues": expr_values,
-            "ScanIndexForward": True,
-        }
-        if expr_names:
-            query_params["ExpressionAttributeNames"] = expr_names
-        if limit is not None:
-            query_params["Limit"] = limit
-
-        resp = await client.query(**query_params)
-    items = resp.get("Items", [])
-    parsed: List[Dict[str, Any]] = []
-    for it in items:
-        parsed.append(
-            {
-                "message_id": it.get("message_id", {}).get("S"),
-                "project_id": project_id,
-                "user_id": it.get("user_id", {}).get("S"),
-                "message": it.get("message", {}).get("S"),
-                "timestamp": it.get("timestamp", {}).get("S"),
-                "created_at": it.get("created_at", {}).get("S"),
-            }
-        )
-    return parsed
+    if not start_time and not end_time and limit is not None:
+        page = await list_chat_page(project_id, limit=limit)
+        return page["messages"]
+
+    if start_time and chat_archive.enabled and start_time[:10] < cutoff_day():
+        return await _list_with_archive(project_id, limit, start_time, end_time)
+
+    expr_values: Dict[str, Dict[str, str]] = {":pid": {"N": str(project_id)}}
+    key_expr = "project_id = :pid"
+
+    if start_time and end_time:
+        key_expr = "project_id = :pid AND #ts BETWEEN :start AND :end"
+        expr_values[":start"] = {"S": start_time}
+        expr_values[":end"] = {"S": end_time}
+    elif start_time:
+        key_expr = "project_id = :pid AND #ts >= :start"
+        expr_values[":start"] = {"S": start_time}
+    elif end_time:
+        key_expr = "project_id = :pid AND #ts <= :end"
+        expr_values[":end"] = {"S": end_time}
+
+    items, _ = await _query_pages(project_id, key_expr, expr_values, True, limit)
+    return [_parse_chat_item(project_id, it) for it in items]
+
+
+async def _query_day(project_id: int, day: str) -> List[Dict[str, Any]]:
+    """All messages of one UTC day still held in DynamoDB."""
+    expr_values = {":pid": {"N": str(project_id)}, ":start": {"S": f"{day}T"}, ":end": {"S": f"{day}T~"}}
+    items, _ = await _query_pages(project_id, "project_id = :pid AND #ts BETWEEN :start AND :end", expr_values, True, None)
+    return [_parse_chat_item(project_id, it) for it in items]
 
 
-async def upsert_chat_room(user_id: str, room_id: int, updated_at: str | None = None) -> None:
+async def _list_with_archive(
+    project_id: int,
+    limit: int | None,
+    start_time: str,
+    end_time: str | None,
+) -> List[Dict[str, Any]]:
+    """
+    Read-through for ranges older than the archive cutoff: archived days come
+    from S3 (falling back to DynamoDB for days not compacted yet), the rest
+    from DynamoDB as usual.
+    """
+    cutoff = cutoff_day()
+    last_archived = (datetime.date.fromisoformat(cutoff) - datetime.timedelta(days=1)).isoformat()
+    end_day = min(end_time[:10], last_archived) if end_time else last_archived
+    days = days_between(start_time[:10], end_day) if start_time[:10] <= end_day else []
+
+    files = await chat_archive.get_many(project_id, days)
+    missing = [day for day in days if files[day] is None]
+    if missing:
+        fallback = await asyncio.gather(*[_query_day(project_id, day) for day in missing])
+        files.update(zip(missing, fallback))
+
+    def in_range(m: Dict[str, Any]) -> bool:
+        key = m.get("sort_key") or m.get("timestamp") or ""
+        return key >= start_time and (end_time is None or key <= end_time)
+
+    messages: List[Dict[str, Any]] = []
+    for day in days:
+        for m in files[day]:
+            if in_range(m):
+                messages.append({**m, "project_id": project_id})
+        if limit is not None and len(messages) >= limit:
+            return messages[:limit]
+
+    if end_time is None or end_time >= cutoff:
+        remaining = None if limit is None else limit - len(messages)
+        messages.extend(await list_chat_messages(project_id, remaining, f"{cutoff}T", end_time))
+    return messages
+
+
+async def upsert_chat_room(
+    user_id: str,
+    room_id: int,
+    updated_at: str | None = None,
+    read_seq: int | None = None,
+) -> None:
     """
     Ensure chat_rooms_ddb contains user_id, room_id, updated_at.
+    UpdateItem (not PutItem) so the user's read marker survives; pass
+    read_seq to also mark the room read up to that sequence (the sender
+    has seen everything up to their own message).
     """
+    expr = "SET updated_at = :u"
+    values: Dict[str, Dict[str, str]] = {":u": {"S": updated_at or _iso_now()}}
+    if read_seq is not None:
+        expr += ", read_seq = :s"
+        values[":s"] = {"N": str(read_seq)}
+    async with _ddb_client_ctx() as client:
+        await client.update_item(
+            TableName=CHAT_ROOMS_TABLE,
+            Key={"user_id": {"S": user_id}, "room_id": {"N": str(room_id)}},
+            UpdateExpression=expr,
+            ExpressionAttributeValues=values,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Unread counters
+# chat_rooms_ddb keeps, per room, a message sequence counter under the
+# reserved user_id ROOM_COUNTER_USER, and per (user, room) the sequence the
+# user has read up to (read_seq). unread = seq - read_seq, so writes bump one
+# counter per room instead of fanning out to every member.
+# ---------------------------------------------------------------------------
+ROOM_COUNTER_USER = "#room"
+
+
+def chat_user_key(user_id: Any) -> str:
+    """chat_rooms_ddb user_id for an auth user id (same uuid5 as message senders)."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(user_id)))
+
+# BatchGetItem 한 번에 읽을 수 있는 최대 키 수
+DDB_BATCH_GET_LIMIT = 100
+
+
+def _room_counter_key(room_id: int) -> Dict[str, Dict[str, str]]:
+    return {"user_id": {"S": ROOM_COUNTER_USER}, "room_id": {"N": str(room_id)}}
+
+
+async def bump_room_seq(room_id: int, count: int = 1, updated_at: str | None = None) -> int:
+    """Add `count` stored messages to the room's sequence; returns the new value."""
     async with _ddb_client_ctx() as client:
-        await client.put_item(
+        resp = await client.update_item(
             TableName=CHAT_ROOMS_TABLE,
-            Item={
-                "user_id": {"S": user_id},
-                "room_id": {"N": str(room_id)},
-                "updated_at": {"S": updated_at or _iso_now()},
-            },
+            Key=_room_counter_key(room_id),
+            UpdateExpression="ADD seq :n SET updated_at = :u",
+            ExpressionAttributeValues={":n": {"N": str(count)}, ":u": {"S": updated_at or _iso_now()}},
+            ReturnValues="UPDATED_NEW",
         )
+    return int(resp["Attributes"]["seq"]["N"])
+
+
+async def get_room_seqs(room_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """Current sequence and last activity of each room (BatchGetItem)."""
+    result: Dict[int, Dict[str, Any]] = {}
+    unique = list(dict.fromkeys(room_ids))
+    async with _ddb_client_ctx() as client:
+        for i in range(0, len(unique), DDB_BATCH_GET_LIMIT):
+            keys = [_room_counter_key(r) for r in unique[i:i + DDB_BATCH_GET_LIMIT]]
+            request = {CHAT_ROOMS_TABLE: {"Keys": keys}}
+            while request:
+                resp = await client.batch_get_item(RequestItems=request)
+                for it in resp.get("Responses", {}).get(CHAT_ROOMS_TABLE, []):
+                    result[int(it["room_id"]["N"])] = {
+                        "seq": int(it.get("seq", {}).get("N", "0")),
+                        "updated_at": it.get("updated_at", {}).get("S"),
+                    }
+                request = resp.get("UnprocessedKeys") or None
+    return result
+
+
+async def mark_room_read(user_id: str, room_id: int) -> int:
+    """Move the user's read marker to the room's current sequence (never backwards)."""
+    seq = (await get_room_seqs([room_id])).get(room_id, {}).get("seq", 0)
+    async with _ddb_client_ctx() as client:
+        try:
+            await client.update_item(
+                TableName=CHAT_ROOMS_TABLE,
+                Key={"user_id": {"S": user_id}, "room_id": {"N": str(room_id)}},
+                UpdateExpression="SET read_seq = :s, read_at = :now",
+                ConditionExpression="attribute_not_exists(read_seq) OR read_seq < :s",
+                ExpressionAttributeValues={":s": {"N": str(seq)}, ":now": {"S": _iso_now()}},
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+    return seq
+
+
+async def list_unread_counts(user_id: str) -> Dict[str, Any]:
+    """
+    Unread counts for every room the user has a row for: one Query over the
+    user's partition for the read markers plus one BatchGetItem for the room
+    counters.
+    """
+    markers: Dict[int, int] = {}
+    params: Dict[str, Any] = {
+        "TableName": CHAT_ROOMS_TABLE,
+        "KeyConditionExpression": "user_id = :uid",
+        "ExpressionAttributeValues": {":uid": {"S": user_id}},
+    }
+    async with _ddb_client_ctx() as client:
+        while True:
+            resp = await client.query(**params)
+            for it in resp.get("Items", []):
+                markers[int(it["room_id"]["N"])] = int(it.get("read_seq", {}).get("N", "0"))
+            if not resp.get("LastEvaluatedKey"):
+                break
+            params["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+    seqs = await get_room_seqs(list(markers)) if markers else {}
+    rooms = []
+    for room_id, read_seq in markers.items():
+        room = seqs.get(room_id, {"seq": 0, "updated_at": None})
+        rooms.append({
+            "room_id": room_id,
+            "unread": max(0, room["seq"] - read_seq),
+            "seq": room["seq"],
+            "updated_at": room["updated_at"],
+        })
+    rooms.sort(key=lambda r: r["updated_at"] or "", reverse=True)
+    return {"rooms": rooms, "total": sum(r["unread"] for r in rooms)}
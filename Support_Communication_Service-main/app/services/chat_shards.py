@@ -0,0 +1,190 @@
+"""
+핫 채팅방 쓰기 샤딩 (team_chats 파티션 분산)
+
+team_chats는 project_id 하나가 파티션 키라서, 메시지가 몰리는 방(해커톤 등)은
+파티션당 쓰기 한도를 넘을 수 있습니다. 핫 방은 메시지를 여러 파티션(샤드)에 나눠 쓰고
+읽을 때는 모든 샤드를 병렬로 조회해 정렬 키 순서로 병합합니다.
+
+- 샤드 0 = 기존 파티션(project_id) → 샤딩 전 메시지도 그대로 조회됨
+- 샤드 s(1..) = -(project_id * CHAT_SHARD_MAX + s) (음수라 실제 project_id와 겹치지 않음)
+- 샤드 수 결정
+  · CHAT_HOT_ROOMS="12:8,40:4" 처럼 설정으로 지정
+  · CHAT_SHARD_ADAPTIVE=true면 Pod별 쓰기 속도가 CHAT_SHARD_HOT_WRITES_PER_SEC를
+    CHAT_SHARD_WINDOW초 동안 넘을 때 2배로 늘림 (최대 CHAT_SHARD_MAX)
+- 샤드 수는 늘어나기만 하며 team_chats의 메타 항목(project_id=0, timestamp="shards#{room}")에 저장,
+  다른 Pod는 CHAT_SHARD_CACHE_TTL 주기로 다시 읽음
+"""
+import hashlib
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 샤드 수 메타 항목을 두는 파티션 (실제 프로젝트 ID는 1부터 시작)
+SHARD_META_PARTITION = 0
+
+
+def _parse_hot_rooms(value: str) -> Dict[int, int]:
+    rooms: Dict[int, int] = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            room, shards = part.split(":", 1)
+            rooms[int(room)] = max(1, min(int(shards), settings.CHAT_SHARD_MAX))
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 CHAT_HOT_ROOMS 항목 무시: {part}")
+    return rooms
+
+
+def partition_for(room_id: int, shard: int) -> int:
+    """샤드 번호 → team_chats 파티션 키 값"""
+    if shard == 0:
+        return room_id
+    return -(room_id * settings.CHAT_SHARD_MAX + shard)
+
+
+def room_of_partition(partition: int) -> int:
+    """team_chats 파티션 키 값 → 방 ID (메타 파티션은 0)"""
+    if partition >= 0:
+        return partition
+    return -partition // settings.CHAT_SHARD_MAX
+
+
+class _WriteRate:
+    __slots__ = ("window_start", "count", "hot_since")
+
+    def __init__(self):
+        self.window_start = time.monotonic()
+        self.count = 0
+        self.hot_since: Optional[float] = None
+
+
+class ShardDirectory:
+    """방별 샤드 수 조회/결정 (프로세스 로컬 캐시 + DynamoDB 메타 항목)"""
+
+    def __init__(self):
+        self._static = _parse_hot_rooms(settings.CHAT_HOT_ROOMS)
+        # room_id -> (샤드 수, 만료 시각)
+        self._cache: Dict[int, Tuple[int, float]] = {}
+        self._rates: Dict[int, _WriteRate] = {}
+        self.promotions = 0
+
+    async def shard_count(self, room_id: int) -> int:
+        static = self._static.get(room_id, 1)
+        if not settings.CHAT_SHARD_ADAPTIVE:
+            return static
+        cached = self._cache.get(room_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return max(static, cached[0])
+        try:
+            stored = await self._load(room_id)
+        except Exception as e:
+            # 메타 조회 실패 시 마지막으로 알던 값 유지
+            logger.warning(f"채팅 샤드 수 조회 실패: room={room_id}, {e}")
+            stored = cached[0] if cached else 1
+        self._cache[room_id] = (stored, time.monotonic() + settings.CHAT_SHARD_CACHE_TTL)
+        return max(static, stored)
+
+    async def partitions(self, room_id: int) -> List[int]:
+        """조회 대상 파티션 목록"""
+        return [partition_for(room_id, s) for s in range(await self.shard_count(room_id))]
+
+    async def partition_for_write(self, room_id: int, client_msg_id: Optional[str] = None) -> int:
+        """
+        이번 메시지를 쓸 파티션 (샤드 중 임의 선택)
+        client_msg_id가 있으면 재전송이 같은 샤드(같은 키)로 가도록 해시로 선택
+        """
+        count = await self.shard_count(room_id)
+        if settings.CHAT_SHARD_ADAPTIVE:
+            await self._record_write(room_id, count)
+        if count == 1:
+            return room_id
+        if client_msg_id:
+            shard = int(hashlib.sha256(client_msg_id.encode()).hexdigest()[:8], 16) % count
+        else:
+            shard = random.randrange(count)
+        return partition_for(room_id, shard)
+
+    # -----------------------------------------------------------------
+    # 적응형 샤딩
+    # -----------------------------------------------------------------
+    async def _record_write(self, room_id: int, count: int) -> None:
+        rate = self._rates.get(room_id)
+        if rate is None:
+            rate = self._rates[room_id] = _WriteRate()
+        rate.count += 1
+        now = time.monotonic()
+        elapsed = now - rate.window_start
+        if elapsed < 1.0:
+            return
+
+        per_sec = rate.count / elapsed
+        rate.window_start, rate.count = now, 0
+        if per_sec < settings.CHAT_SHARD_HOT_WRITES_PER_SEC:
+            rate.hot_since = None
+            if count == 1:
+                # 조용한 방은 추적 중단
+                self._rates.pop(room_id, None)
+            return
+        if rate.hot_since is None:
+            rate.hot_since = now
+            return
+        if now - rate.hot_since >= settings.CHAT_SHARD_WINDOW and count < settings.CHAT_SHARD_MAX:
+            rate.hot_since = None
+            await self._promote(room_id, min(count * 2, settings.CHAT_SHARD_MAX), per_sec)
+
+    async def _promote(self, room_id: int, shards: int, per_sec: float) -> None:
+        from app.services.chat_service import TEAM_CHATS_TABLE, _ddb_client_ctx
+
+        try:
+            async with _ddb_client_ctx() as client:
+                # 샤드 수는 늘어나기만 함 (여러 Pod가 동시에 올려도 큰 값이 남음)
+                await client.update_item(
+                    TableName=TEAM_CHATS_TABLE,
+                    Key=self._meta_key(room_id),
+                    UpdateExpression="SET shards = :n",
+                    ConditionExpression="attribute_not_exists(shards) OR shards < :n",
+                    ExpressionAttributeValues={":n": {"N": str(shards)}},
+                )
+        except Exception as e:
+            if "ConditionalCheckFailed" not in str(e):
+                logger.warning(f"채팅 샤드 수 저장 실패: room={room_id}, {e}")
+            self._cache.pop(room_id, None)
+            return
+        self.promotions += 1
+        self._cache[room_id] = (shards, time.monotonic() + settings.CHAT_SHARD_CACHE_TTL)
+        logger.info(f"🔥 핫 채팅방 샤드 확장: room={room_id}, shards={shards} ({per_sec:.0f} msg/s)")
+
+    # -----------------------------------------------------------------
+    # 메타 항목
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _meta_key(room_id: int) -> Dict[str, Dict[str, str]]:
+        return {"project_id": {"N": str(SHARD_META_PARTITION)}, "timestamp": {"S": f"shards#{room_id}"}}
+
+    async def _load(self, room_id: int) -> int:
+        from app.services.chat_service import TEAM_CHATS_TABLE, _ddb_client_ctx
+
+        async with _ddb_client_ctx() as client:
+            resp = await client.get_item(TableName=TEAM_CHATS_TABLE, Key=self._meta_key(room_id))
+        item = resp.get("Item") or {}
+        return max(1, int(item.get("shards", {}).get("N", "1")))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "adaptive": settings.CHAT_SHARD_ADAPTIVE,
+            "static_rooms": self._static,
+            "sharded_rooms": {room: n for room, (n, _) in self._cache.items() if n > 1},
+            "tracked_rooms": len(self._rates),
+            "promotions": self.promotions,
+        }
+
+
+# 싱글톤 인스턴스
+shard_directory = ShardDirectory()
@@ -0,0 +1,391 @@
+"""
+채팅 메시지 write-behind 저장 (DynamoDB BatchWriteItem)
+
+메시지마다 put_item 2번(team_chats + chat_rooms)을 요청 경로에서 기다리지 않도록
+큐에 쌓아두고 백그라운드에서 묶어서 저장합니다.
+
+- 최대 25건(BatchWriteItem 한도) 또는 CHAT_WRITE_FLUSH_INTERVAL마다 flush
+- UnprocessedItems는 지수 백오프로 재시도
+- chat_rooms 갱신은 flush 구간 안에서 (user_id, room_id)별 1건으로 합침
+- 저장된 메시지 수만큼 방 메시지 순번(안 읽은 수 계산용)을 방별로 합쳐서 한 번에 증가시키고,
+  보낸 사람의 읽음 위치는 그 순번으로 갱신 (읽음 위치를 덮어쓰지 않도록 chat_rooms는 UpdateItem)
+- CHAT_PERSIST_MODE
+  · write_behind: 큐에 넣고 즉시 반환 (브로드캐스트 지연 최소, 프로세스 비정상 종료 시 유실 가능)
+  · durable: 배치 저장은 하되 해당 배치가 저장될 때까지 기다린 후 반환
+  · sync: 기존처럼 요청 안에서 put_item
+- 종료(shutdown) 시 남은 큐를 모두 flush
+- client_msg_id가 있는 메시지는 CHAT_IDEMPOTENCY_TTL 동안 기억해 재전송 시 다시 저장/브로드캐스트하지 않음
+  (다른 Pod로 재전송된 경우에도 정렬 키가 같으므로 DynamoDB에는 한 건만 남음)
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.chat_service import (
+    TEAM_CHATS_TABLE,
+    _ddb_client_ctx,
+    assign_shard,
+    bump_room_seq,
+    build_chat_item,
+    chat_item_to_dict,
+    chat_user_key,
+    put_chat_item,
+    sort_key_time,
+    upsert_chat_room,
+)
+from app.services.chat_shards import room_of_partition
+
+logger = logging.getLogger(__name__)
+
+# BatchWriteItem 한 번에 넣을 수 있는 최대 요청 수
+DDB_BATCH_LIMIT = 25
+
+_STOP = object()
+
+
+class _WriteRequest:
+    __slots__ = ("table", "item", "key", "future")
+
+    def __init__(self, table: str, item: Dict[str, Any], key: Tuple, future: Optional[asyncio.Future] = None):
+        self.table = table
+        self.item = item
+        self.key = key
+        self.future = future
+
+
+def _chat_key(item: Dict[str, Any]) -> Tuple:
+    return (TEAM_CHATS_TABLE, item["project_id"]["N"], item["timestamp"]["S"])
+
+
+class ChatWriter:
+    """채팅 메시지/채팅방 갱신 write-behind 큐"""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # (user_id, room_id) -> updated_at, flush 때 한 번에 저장
+        self._pending_rooms: Dict[Tuple[str, int], str] = {}
+        # room_id -> (저장된 메시지 수, 마지막 메시지 시각), flush 때 방 순번에 한 번에 더함
+        self._pending_seq: Dict[int, Tuple[int, str]] = {}
+        # (project_id, client_msg_id) -> (만료 시각, 저장된 메시지)
+        self._recent: "OrderedDict[Tuple[int, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.duplicates = 0
+        self.enqueued = 0
+        self.written = 0
+        self.rooms_written = 0
+        self.rooms_coalesced = 0
+        self.seq_updates = 0
+        self.batches = 0
+        self.retries = 0
+        self.failed = 0
+        self.inline_writes = 0
+
+    @property
+    def mode(self) -> str:
+        return (settings.CHAT_PERSIST_MODE or "write_behind").lower()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # -----------------------------------------------------------------
+    # 수명 주기
+    # -----------------------------------------------------------------
+    async def start(self) -> None:
+        if self.mode == "sync" or self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=settings.CHAT_WRITE_QUEUE_MAX)
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"채팅 write-behind 시작 (mode={self.mode}, batch={settings.CHAT_WRITE_BATCH_SIZE}, "
+            f"interval={settings.CHAT_WRITE_FLUSH_INTERVAL}s)"
+        )
+
+    async def close(self) -> None:
+        """남은 큐를 모두 저장하고 종료 (shutdown 이벤트에서 호출)"""
+        if not self.running:
+            return
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(self._task, timeout=settings.CHAT_WRITE_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            logger.error(f"채팅 write-behind 종료 타임아웃 - 미저장 {self._queue.qsize()}건")
+        self._task = None
+        logger.info(f"채팅 write-behind 종료 (written={self.written}, failed={self.failed})")
+
+    # -----------------------------------------------------------------
+    # 저장 요청
+    # -----------------------------------------------------------------
+    async def persist(
+        self,
+        project_id: int,
+        payload: Dict[str, Any],
+        upsert_room: bool = True,
+        sender_id: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        채팅 메시지 저장 요청 후 API 응답/브로드캐스트용 dict 반환
+        - upsert_room이면 보낸 사람의 채팅방 행(읽음 위치 포함)을 chat_user_key(sender_id)로 갱신
+          (sender_id는 인증된 사용자 ID, 없으면 메시지의 user_id)
+        - sync/durable 모드에서는 저장 실패 시 예외
+        - 이미 처리한 client_msg_id면 처음 저장한 메시지에 duplicate=True를 붙여 반환
+          (호출 측은 다시 브로드캐스트하지 않음)
+        """
+        client_msg_id = payload.get("client_msg_id")
+        if client_msg_id:
+            previous = self._seen(project_id, client_msg_id)
+            if previous is not None:
+                self.duplicates += 1
+                return {**previous, "duplicate": True}
+
+        item = build_chat_item(project_id, payload)
+        await assign_shard(project_id, item)
+        saved = chat_item_to_dict(project_id, item)
+        room_user = chat_user_key(saved["user_id"] if sender_id is None else sender_id) if upsert_room else None
+
+        if self.mode == "sync" or not self.running:
+            saved = await self._write_inline(project_id, item, room_user)
+            self._remember(project_id, client_msg_id, saved)
+            return saved
+
+        future = asyncio.get_running_loop().create_future() if self.mode == "durable" else None
+        try:
+            self._queue.put_nowait(_WriteRequest(TEAM_CHATS_TABLE, item, _chat_key(item), future))
+        except asyncio.QueueFull:
+            # 큐가 가득 차면 요청 경로에서 직접 저장 (백프레셔)
+            logger.warning("⚠️ 채팅 write-behind 큐 가득 참 - 직접 저장")
+            saved = await self._write_inline(project_id, item, room_user)
+            self._remember(project_id, client_msg_id, saved)
+            return saved
+        self.enqueued += 1
+        if future is None:
+            # write_behind: 큐에 넣은 시점에 응답하므로 재전송은 바로 중복으로 처리
+            self._remember(project_id, client_msg_id, saved)
+
+        if room_user is not None:
+            room_key = (room_user, project_id)
+            if room_key in self._pending_rooms:
+                self.rooms_coalesced += 1
+            self._pending_rooms[room_key] = max(self._pending_rooms.get(room_key, ""), saved["timestamp"])
+
+        if future is not None:
+            # durable: 저장 실패로 예외가 나면 기억하지 않으므로 같은 client_msg_id 재전송이 다시 저장됨
+            await future
+            self._remember(project_id, client_msg_id, saved)
+        return saved
+
+    def _seen(self, project_id: int, client_msg_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._recent.get((project_id, client_msg_id))
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._recent.pop((project_id, client_msg_id), None)
+            return None
+        return entry[1]
+
+    def _remember(self, project_id: int, client_msg_id: Optional[str], saved: Dict[str, Any]) -> None:
+        if not client_msg_id:
+            return
+        self._recent[(project_id, client_msg_id)] = (time.monotonic() + settings.CHAT_IDEMPOTENCY_TTL, saved)
+        self._recent.move_to_end((project_id, client_msg_id))
+        while len(self._recent) > settings.CHAT_IDEMPOTENCY_CACHE_SIZE:
+            self._recent.popitem(last=False)
+
+    async def _write_inline(self, project_id: int, item: Dict[str, Any], room_user: Optional[str]) -> Dict[str, Any]:
+        self.inline_writes += 1
+        saved = await put_chat_item(project_id, item)
+        seq = None
+        try:
+            seq = await bump_room_seq(project_id, 1, saved["timestamp"])
+            self.seq_updates += 1
+        except Exception:
+            logger.exception("Failed to update chat room sequence")
+        if room_user is not None:
+            try:
+                await upsert_chat_room(room_user, project_id, saved["timestamp"], read_seq=seq)
+            except Exception:
+                logger.exception("Failed to upsert chat room")
+        return saved
+
+    # -----------------------------------------------------------------
+    # 백그라운드 flush
+    # -----------------------------------------------------------------
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch: List[_WriteRequest] = [first]
+            deadline = loop.time() + settings.CHAT_WRITE_FLUSH_INTERVAL
+            while len(batch) < settings.CHAT_WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    req = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if req is _STOP:
+                    stopping = True
+                    break
+                batch.append(req)
+            await self._flush(batch)
+
+        # 종료: 남은 요청 모두 저장
+        remaining: List[_WriteRequest] = []
+        while not self._queue.empty():
+            req = self._queue.get_nowait()
+            if req is not _STOP:
+                remaining.append(req)
+        await self._flush(remaining)
+
+    def _count_written(self, req: _WriteRequest) -> None:
+        room_id = room_of_partition(int(req.key[1]))
+        count, last = self._pending_seq.get(room_id, (0, ""))
+        self._pending_seq[room_id] = (count + 1, max(last, sort_key_time(req.key[2])))
+
+    async def _flush_rooms(self) -> None:
+        """방 순번 증가 후 보낸 사람의 채팅방 갱신/읽음 위치 저장"""
+        seqs, self._pending_seq = self._pending_seq, {}
+        rooms, self._pending_rooms = self._pending_rooms, {}
+        if not seqs and not rooms:
+            return
+
+        async def bump(room_id: int, count: int, updated_at: str) -> Optional[int]:
+            try:
+                seq = await bump_room_seq(room_id, count, updated_at)
+            except Exception as e:
+                # 다음 flush에서 다시 더함
+                logger.warning(f"채팅방 순번 갱신 실패: room={room_id}, {e}")
+                prev_count, prev_last = self._pending_seq.get(room_id, (0, ""))
+                self._pending_seq[room_id] = (prev_count + count, max(prev_last, updated_at))
+                return None
+            self.seq_updates += 1
+            return seq
+
+        room_ids = list(seqs)
+        results = await asyncio.gather(*[bump(r, *seqs[r]) for r in room_ids])
+        new_seq = dict(zip(room_ids, results))
+
+        async def upsert(user_id: str, room_id: int, updated_at: str) -> None:
+            try:
+                await upsert_chat_room(user_id, room_id, updated_at, read_seq=new_seq.get(room_id))
+                self.rooms_written += 1
+            except Exception as e:
+                logger.warning(f"채팅방 갱신 실패: user={user_id}, room={room_id}, {e}")
+
+        await asyncio.gather(*[upsert(u, r, t) for (u, r), t in rooms.items()])
+
+    @staticmethod
+    def _chunks(requests: List[_WriteRequest]) -> List[List[_WriteRequest]]:
+        """25건 단위로 나누되 같은 키가 한 배치에 두 번 들어가지 않도록 분리 (DynamoDB 제약)"""
+        size = min(settings.CHAT_WRITE_BATCH_SIZE, DDB_BATCH_LIMIT)
+        chunks = []
+        pending = requests
+        while pending:
+            chunk, keys, rest = [], set(), []
+            for req in pending:
+                if len(chunk) < size and req.key not in keys:
+                    chunk.append(req)
+                    keys.add(req.key)
+                else:
+                    rest.append(req)
+            chunks.append(chunk)
+            pending = rest
+        return chunks
+
+    async def _flush(self, batch: List[_WriteRequest]) -> None:
+        if batch:
+            await self._flush_chats(batch)
+        await self._flush_rooms()
+
+    async def _flush_chats(self, batch: List[_WriteRequest]) -> None:
+        chunks = self._chunks(batch)
+        settled = 0
+        try:
+            async with _ddb_client_ctx() as client:
+                for chunk in chunks:
+                    failed = await self._batch_write(client, chunk)
+                    self._settle(chunk, failed)
+                    settled += 1
+        except Exception as e:
+            # 클라이언트 생성 실패 등 - 아직 처리하지 못한 배치는 모두 실패 처리
+            logger.error(f"채팅 배치 저장 실패: {e}")
+            for chunk in chunks[settled:]:
+                self._settle(chunk, {req.key for req in chunk}, e)
+
+    async def _batch_write(self, client, chunk: List[_WriteRequest]) -> set:
+        """BatchWriteItem 실행, 끝내 저장되지 못한 요청 키 집합 반환"""
+        request_items: Dict[str, List[Dict[str, Any]]] = {}
+        for req in chunk:
+            request_items.setdefault(req.table, []).append({"PutRequest": {"Item": req.item}})
+
+        self.batches += 1
+        for attempt in range(settings.CHAT_WRITE_MAX_RETRIES + 1):
+            try:
+                resp = await client.batch_write_item(RequestItems=request_items)
+                unprocessed = resp.get("UnprocessedItems") or {}
+            except Exception as e:
+                logger.warning(f"BatchWriteItem 오류 (시도 {attempt + 1}): {e}")
+                unprocessed = request_items
+            if not unprocessed:
+                return set()
+            request_items = unprocessed
+            if attempt < settings.CHAT_WRITE_MAX_RETRIES:
+                self.retries += 1
+                delay = settings.CHAT_WRITE_RETRY_BASE * (2 ** attempt)
+                await asyncio.sleep(delay + random.uniform(0, delay))
+
+        failed = set()
+        for table, writes in request_items.items():
+            for w in writes:
+                item = w["PutRequest"]["Item"]
+                failed.add(_chat_key(item))
+        return failed
+
+    def _settle(self, chunk: List[_WriteRequest], failed: set, error: Optional[Exception] = None) -> None:
+        for req in chunk:
+            ok = req.key not in failed
+            if ok:
+                self.written += 1
+                self._count_written(req)
+            else:
+                self.failed += 1
+                logger.error(f"채팅 저장 최종 실패: {req.key}")
+            if req.future is not None and not req.future.done():
+                if ok:
+                    req.future.set_result(None)
+                else:
+                    req.future.set_exception(error or RuntimeError("DynamoDB BatchWriteItem 재시도 초과"))
+
+    def stats(self) -> Dict[str, Any]:
+        """write-behind 현황 (모니터링용)"""
+        return {
+            "mode": self.mode,
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "pending_rooms": len(self._pending_rooms),
+            "pending_seq_rooms": len(self._pending_seq),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "rooms_written": self.rooms_written,
+            "rooms_coalesced": self.rooms_coalesced,
+            "seq_updates": self.seq_updates,
+            "batches": self.batches,
+            "retries": self.retries,
+            "failed": self.failed,
+            "inline_writes": self.inline_writes,
+            "duplicates": self.duplicates,
+            "idempotency_keys": len(self._recent),
+        }
+
+
+# 싱글톤 인스턴스
+chat_writer = ChatWriter()
@@ -0,0 +1,216 @@
+"""
+회의 중 채팅 메시지 카운터 (방별 증분 집계)
+
+FE는 회의 시작/종료를 `__MEETING_EVENT__{json}` 형태의 채팅 메시지로 남깁니다.
+예전에는 회의 중 5초마다 전체 메시지를 내려받아 브라우저에서 세었지만,
+서버가 방별 상태(진행 여부, 시작 시각, 회의 메시지 수, 마지막으로 본 정렬 키)를 들고
+마지막 정렬 키 이후의 새 메시지만 조회해 갱신합니다.
+
+- 최초 1회: 최신 메시지부터 거꾸로 읽어 마지막 회의 이벤트를 찾고 그 이후 메시지 수 집계
+- 이후: 커서 이후 메시지만 조회 (대부분 빈 결과의 작은 쿼리)
+- 이 Pod로 브로드캐스트되는 메시지는 observe()로 바로 반영하고 WebSocket으로 카운터 push
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.services.chat_service import _query_pages, _parse_chat_item
+
+logger = logging.getLogger(__name__)
+
+MEETING_EVENT_PREFIX = "__MEETING_EVENT__"
+
+
+def parse_meeting_event(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """회의 이벤트 메시지면 payload(dict) 반환"""
+    if not isinstance(text, str) or not text.startswith(MEETING_EVENT_PREFIX):
+        return None
+    try:
+        payload = json.loads(text[len(MEETING_EVENT_PREFIX):])
+    except (TypeError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+class MeetingState:
+    __slots__ = ("active", "started_at", "meeting_id", "message_count", "cursor", "checked_at")
+
+    def __init__(self):
+        self.active = False
+        self.started_at: Optional[str] = None
+        self.meeting_id: Any = None
+        self.message_count = 0
+        self.cursor: Optional[str] = None  # 마지막으로 반영한 메시지 정렬 키
+        self.checked_at = 0.0
+
+    def apply(self, message: Dict[str, Any]) -> bool:
+        """메시지 1건 반영 (이미 반영한 정렬 키 이하는 무시), 상태가 바뀌면 True"""
+        sort_key = message.get("sort_key") or message.get("timestamp")
+        if sort_key and self.cursor and sort_key <= self.cursor:
+            return False
+        if sort_key:
+            self.cursor = sort_key
+
+        event = parse_meeting_event(message.get("message"))
+        if event is not None:
+            action = event.get("action")
+            if action == "start":
+                self.active = True
+                self.started_at = event.get("startedAt") or message.get("timestamp")
+                self.meeting_id = event.get("meetingId")
+                self.message_count = 0
+                return True
+            if action == "end":
+                self.active = False
+                return True
+            return False
+
+        if self.active:
+            self.message_count += 1
+            return True
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "started_at": self.started_at,
+            "meeting_id": self.meeting_id,
+            "message_count": self.message_count,
+        }
+
+
+class MeetingTracker:
+    """방별 회의 상태 (프로세스 로컬)"""
+
+    def __init__(self):
+        self._rooms: "OrderedDict[int, MeetingState]" = OrderedDict()
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._push_handles: Dict[int, asyncio.TimerHandle] = {}
+        self._last_push: Dict[int, float] = {}
+
+    def _lock(self, room_id: int) -> asyncio.Lock:
+        lock = self._locks.get(room_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[room_id] = lock
+        return lock
+
+    async def _bootstrap(self, room_id: int) -> MeetingState:
+        """최신 메시지부터 거꾸로 읽어 마지막 회의 이벤트 이후 상태 복원 (방마다 1회)"""
+        state = MeetingState()
+        expr_values = {":pid": {"N": str(room_id)}}
+        key_expr = "project_id = :pid"
+        scanned = 0
+        newest: Optional[str] = None
+        count = 0
+        page_size = settings.CHAT_MEETING_BOOTSTRAP_PAGE
+
+        while scanned < settings.CHAT_MEETING_BOOTSTRAP_MAX:
+            items, has_more = await _query_pages(room_id, key_expr, expr_values, False, page_size)
+            for it in items:
+                msg = _parse_chat_item(room_id, it)
+                newest = newest or msg["sort_key"]
+                event = parse_meeting_event(msg["message"])
+                if event is None:
+                    count += 1
+                    continue
+                if event.get("action") == "start":
+                    state.active = True
+                    state.started_at = event.get("startedAt") or msg["timestamp"]
+                    state.meeting_id = event.get("meetingId")
+                    state.message_count = count
+                state.cursor = newest
+                return state
+            scanned += len(items)
+            if not has_more or not items:
+                break
+            key_expr = "project_id = :pid AND #ts < :cursor"
+            expr_values = {":pid": {"N": str(room_id)}, ":cursor": {"S": items[-1]["timestamp"]["S"]}}
+
+        # 회의 이벤트가 없으면 진행 중인 회의 없음
+        state.cursor = newest
+        return state
+
+    async def _catch_up(self, room_id: int, state: MeetingState) -> None:
+        """커서 이후 새 메시지만 조회해 반영"""
+        if state.cursor is None:
+            key_expr = "project_id = :pid"
+            expr_values = {":pid": {"N": str(room_id)}}
+        else:
+            key_expr = "project_id = :pid AND #ts > :cursor"
+            expr_values = {":pid": {"N": str(room_id)}, ":cursor": {"S": state.cursor}}
+        items, _ = await _query_pages(room_id, key_expr, expr_values, True, None)
+        for it in items:
+            state.apply(_parse_chat_item(room_id, it))
+
+    async def snapshot(self, room_id: int, refresh: bool = True) -> Dict[str, Any]:
+        """
+        방의 회의 상태 반환
+        refresh=True면 CHAT_MEETING_REFRESH_INTERVAL이 지났을 때 커서 이후 메시지를 조회해 갱신
+        """
+        async with self._lock(room_id):
+            state = self._rooms.get(room_id)
+            if state is None:
+                state = await self._bootstrap(room_id)
+                state.checked_at = time.monotonic()
+                self._rooms[room_id] = state
+                # 폴링만 하는 방도 쌓이므로 오래된 방부터 정리
+                while len(self._rooms) > settings.CHAT_MEETING_ROOMS_MAX:
+                    self.forget(next(iter(self._rooms)))
+            elif refresh and time.monotonic() - state.checked_at >= settings.CHAT_MEETING_REFRESH_INTERVAL:
+                await self._catch_up(room_id, state)
+                state.checked_at = time.monotonic()
+            self._rooms.move_to_end(room_id)
+            return state.to_dict()
+
+    def observe(self, room_id: int, message: Dict[str, Any]) -> bool:
+        """이 Pod로 브로드캐스트된 메시지 반영 (상태를 들고 있는 방만), 바뀌면 True"""
+        state = self._rooms.get(room_id)
+        if state is None:
+            return False
+        return state.apply(message)
+
+    def forget(self, room_id: int) -> None:
+        """로컬 구독이 끝난 방 정리 (다음 조회 때 다시 복원)"""
+        self._rooms.pop(room_id, None)
+        self._locks.pop(room_id, None)
+        self._last_push.pop(room_id, None)
+        handle = self._push_handles.pop(room_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def schedule_push(self, room_id: int, push: Callable[[int, Dict[str, Any]], Awaitable[None]], immediate: bool = False) -> None:
+        """
+        카운터 push 예약 - 메시지마다 보내지 않고 CHAT_MEETING_PUSH_INTERVAL 단위로 묶어서 전송
+        (회의 시작/종료는 immediate=True로 바로 전송)
+        """
+        if room_id in self._push_handles and not immediate:
+            return
+
+        def fire():
+            self._push_handles.pop(room_id, None)
+            state = self._rooms.get(room_id)
+            if state is None:
+                return
+            self._last_push[room_id] = time.monotonic()
+            asyncio.create_task(push(room_id, meeting_counter_frame(room_id, state.to_dict())))
+
+        handle = self._push_handles.pop(room_id, None)
+        if handle is not None:
+            handle.cancel()
+        elapsed = time.monotonic() - self._last_push.get(room_id, 0.0)
+        delay = 0.0 if immediate else max(0.0, settings.CHAT_MEETING_PUSH_INTERVAL - elapsed)
+        self._push_handles[room_id] = asyncio.get_running_loop().call_later(delay, fire)
+
+
+def meeting_counter_frame(room_id: int, meeting: Dict[str, Any]) -> Dict[str, Any]:
+    """WebSocket으로 보내는 회의 카운터 프레임"""
+    return {"type": "meeting_counter", "project_id": room_id, **meeting}
+
+
+# 싱글톤 인스턴스
+meeting_tracker = MeetingTracker()
@@ -0,0 +1,105 @@
+"""
+알림 push (SSE) - Pod 간 알림 도착 신호
+
+헤더 배지가 30초마다 폴링하던 것을, `/notifications/stream` SSE 연결로 새 알림이 커밋되는 즉시 보냅니다.
+
+- create_notification(s)가 커밋 후 notify(user_ids) → 채팅과 같은 브로커(CHAT_BROKER)로
+  NOTIFICATION_CHANNEL_PREFIX 채널 하나에 발행 (알림은 채팅보다 훨씬 드물어 Pod별 필터링으로 충분)
+- 각 Pod는 로컬에 스트림이 있는 사용자의 신호만 깨움 → 스트림이 자기 커서 이후 알림을 DB에서 읽어 전송
+  (신호에는 알림 내용을 싣지 않으므로 순서/중복/누락은 항상 커서 기준으로 맞춰짐)
+- 브로커 재연결 사이에 놓친 신호는 스트림이 heartbeat 때 generation 변화를 보고 커서로 다시 확인
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, Set
+
+from app.core.chat_broker import create_chat_broker
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 알림 신호는 채널 하나(room 0)로 발행
+NOTIFICATION_ROOM = 0
+
+
+class NotificationFeed:
+    """사용자별 로컬 SSE 스트림 대기열 + Pod 간 알림 신호"""
+
+    def __init__(self):
+        self._broker = create_chat_broker(settings.NOTIFICATION_CHANNEL_PREFIX)
+        self._broker.set_handler(self._on_signal)
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+        self.signals = 0
+        self.wakeups = 0
+
+    @property
+    def generation(self) -> int:
+        """브로커 구독 재연결 횟수 (바뀌었으면 그 사이 신호를 놓쳤을 수 있음)"""
+        return getattr(self._broker, "reconnects", 0)
+
+    async def start(self) -> None:
+        if not settings.NOTIFICATION_PUSH_ENABLED:
+            return
+        await self._broker.start()
+        await self._broker.subscribe(NOTIFICATION_ROOM)
+
+    async def close(self) -> None:
+        await self._broker.close()
+        # 대기 중인 스트림을 깨워 종료 확인하도록
+        for events in self._waiters.values():
+            for event in events:
+                event.set()
+
+    # -----------------------------------------------------------------
+    # 스트림 등록
+    # -----------------------------------------------------------------
+    def register(self, user_id: str) -> asyncio.Event:
+        event = asyncio.Event()
+        self._waiters.setdefault(user_id, set()).add(event)
+        return event
+
+    def unregister(self, user_id: str, event: asyncio.Event) -> None:
+        events = self._waiters.get(user_id)
+        if events is not None:
+            events.discard(event)
+            if not events:
+                self._waiters.pop(user_id, None)
+
+    # -----------------------------------------------------------------
+    # 신호
+    # -----------------------------------------------------------------
+    async def notify(self, user_ids: Iterable[str]) -> None:
+        """새 알림이 커밋된 사용자들 (실패해도 폴링/재연결 커서로 복구되므로 예외를 올리지 않음)"""
+        if not settings.NOTIFICATION_PUSH_ENABLED:
+            return
+        targets = sorted({str(u) for u in user_ids if u})
+        if not targets:
+            return
+        try:
+            await self._broker.publish(NOTIFICATION_ROOM, {"user_ids": targets})
+        except Exception as e:
+            logger.warning(f"알림 신호 발행 실패: {len(targets)}명, {e}")
+
+    async def _on_signal(self, room_id: int, message: Dict[str, Any]) -> None:
+        self.signals += 1
+        self._wake(message.get("user_ids") or [])
+
+    def _wake(self, user_ids: Iterable[str]) -> None:
+        for user_id in user_ids:
+            for event in self._waiters.get(str(user_id), ()):
+                self.wakeups += 1
+                event.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.NOTIFICATION_PUSH_ENABLED,
+            "broker": self._broker.stats(),
+            "streaming_users": len(self._waiters),
+            "streams": sum(len(e) for e in self._waiters.values()),
+            "signals": self.signals,
+            "wakeups": self.wakeups,
+        }
+
+
+# 싱글톤 인스턴스
+notification_feed = NotificationFeed()
@@ -1,10 +1,32 @@
-from typing import Optional, List, Dict, Any
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
 from app.models import Notification
+from app.services.notification_feed import notification_feed
+
+
+# Default / maximum page size for list_notifications
+NOTIFICATION_PAGE_SIZE = 20
+NOTIFICATION_PAGE_MAX = 100
+# Max rows per multi-row INSERT in create_notifications
+NOTIFICATION_BATCH_CHUNK = 500
+
+
+def _to_dict(n: Notification) -> Dict[str, Any]:
+    return {
+        "notification_id": n.notification_id,
+        "user_id": n.user_id,
+        "message": n.message,
+        "link": n.link,
+        "is_read": n.is_read,
+        "created_at": n.created_at,
+    }
 
 
 async def create_notification(
@@ -24,57 +46,153 @@ async def create_notification(
         session.add(notif)
         await session.commit()
         await session.refresh(notif)
-        return {
-            "notification_id": notif.notification_id,
-            "user_id": notif.user_id,
-            "message": notif.message,
-            "link": notif.link,
-            "is_read": notif.is_read,
-            "created_at": notif.created_at,
-        }
+        data = _to_dict(notif)
+    await notification_feed.notify([user_id])
+    return data
+
+
+async def create_notifications(notifications: Sequence[Dict[str, Any]]) -> int:
+    """
+    Insert many notifications (dicts with user_id, message, link) in one
+    transaction using multi-row INSERT statements, NOTIFICATION_BATCH_CHUNK
+    rows each. Returns the number of inserted rows.
+    """
+    rows = [
+        {"user_id": n["user_id"], "message": n.get("message"), "link": n.get("link")}
+        for n in notifications
+    ]
+    if not rows:
+        return 0
+    async with AsyncSessionLocal() as session:  # type: AsyncSession
+        for start in range(0, len(rows), NOTIFICATION_BATCH_CHUNK):
+            await session.execute(insert(Notification).values(rows[start:start + NOTIFICATION_BATCH_CHUNK]))
+        await session.commit()
+    await notification_feed.notify(r["user_id"] for r in rows)
+    return len(rows)
 
 
-async def list_notifications(user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+def encode_cursor(created_at: datetime, notification_id: int) -> str:
+    """Opaque keyset cursor for the last notification of a page."""
+    raw = json.dumps({"t": created_at.isoformat(), "i": notification_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Return (created_at, notification_id) inside a cursor (ValueError if malformed)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(value["t"]), int(value["i"])
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+async def list_notifications(
+    user_id: str,
+    limit: int = NOTIFICATION_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    unread_only: bool = False,
+) -> Dict[str, Any]:
     """
-    Fetch notifications, optionally filtered by user_id.
+    Fetch one page of a user's notifications, newest first.
+
+    Keyset pagination on (created_at, notification_id): pass the returned
+    next_cursor to get the following page. Served by the (user_id, created_at)
+    index, or (user_id, is_read, created_at) when unread_only is set.
+    Raises ValueError for a malformed cursor.
     """
     async with AsyncSessionLocal() as session:  # type: AsyncSession
-        stmt = select(Notification)
-        if user_id:
-            stmt = stmt.where(Notification.user_id == user_id)
+        stmt = select(Notification).where(Notification.user_id == user_id)
+        if unread_only:
+            stmt = stmt.where(Notification.is_read == False)
+        if cursor:
+            created_at, notification_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    Notification.created_at < created_at,
+                    and_(Notification.created_at == created_at, Notification.notification_id < notification_id),
+                )
+            )
+        stmt = stmt.order_by(Notification.created_at.desc(), Notification.notification_id.desc()).limit(limit + 1)
         result = await session.execute(stmt)
         rows = result.scalars().all()
-        return [
-            {
-                "notification_id": n.notification_id,
-                "user_id": n.user_id,
-                "message": n.message,
-                "link": n.link,
-                "is_read": n.is_read,
-                "created_at": n.created_at,
-            }
-            for n in rows
-        ]
-
-
-async def mark_notifications_read(user_id: str) -> int:
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "notifications": [_to_dict(n) for n in rows],
+        "next_cursor": encode_cursor(rows[-1].created_at, rows[-1].notification_id) if rows and has_more else None,
+        "has_more": has_more,
+    }
+
+
+async def list_notifications_after(user_id: str, cursor: str, limit: int) -> List[Dict[str, Any]]:
     """
-    Mark all notifications for a user as read.
+    Notifications newer than a cursor, oldest first (push stream catch-up).
+    Each item carries its own "cursor" so the stream can use it as the event id.
+    Raises ValueError for a malformed cursor.
+    """
+    created_at, notification_id = decode_cursor(cursor)
+    async with AsyncSessionLocal() as session:  # type: AsyncSession
+        stmt = (
+            select(Notification)
+            .where(
+                Notification.user_id == user_id,
+                or_(
+                    Notification.created_at > created_at,
+                    and_(Notification.created_at == created_at, Notification.notification_id > notification_id),
+                ),
+            )
+            .order_by(Notification.created_at.asc(), Notification.notification_id.asc())
+            .limit(limit)
+        )
+        rows = (await session.execute(stmt)).scalars().all()
+    return [{**_to_dict(n), "cursor": encode_cursor(n.created_at, n.notification_id)} for n in rows]
+
+
+async def latest_notification_cursor(user_id: str) -> str:
+    """Cursor at the user's newest notification (epoch cursor if none) - where a fresh stream starts."""
+    async with AsyncSessionLocal() as session:  # type: AsyncSession
+        stmt = (
+            select(Notification.created_at, Notification.notification_id)
+            .where(Notification.user_id == user_id)
+            .order_by(Notification.created_at.desc(), Notification.notification_id.desc())
+            .limit(1)
+        )
+        row = (await session.execute(stmt)).first()
+    if row is None:
+        return encode_cursor(datetime(1970, 1, 1), 0)
+    return encode_cursor(row[0], row[1])
+
+
+async def count_unread_notifications(user_id: str) -> int:
+    """
+    Number of unread notifications for a user.
+    Index-only COUNT on (user_id, is_read, created_at) - cheap enough for polling.
+    """
+    async with AsyncSessionLocal() as session:  # type: AsyncSession
+        stmt = select(func.count()).select_from(Notification).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False,
+        )
+        return (await session.execute(stmt)).scalar_one()
+
+
+async def mark_notifications_read(user_id: str, notification_ids: Optional[List[int]] = None) -> int:
+    """
+    Mark a user's unread notifications as read with a single UPDATE
+    (only the given ids when notification_ids is passed).
     Returns the number of updated rows.
     """
+    if notification_ids is not None and not notification_ids:
+        return 0
     async with AsyncSessionLocal() as session:  # type: AsyncSession
-        stmt = select(Notification).where(
+        stmt = update(Notification).where(
             Notification.user_id == user_id,
-            Notification.is_read == False
+            Notification.is_read == False,
         )
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
-        
-        count = 0
-        for n in rows:
-            n.is_read = True
-            count += 1
-        
+        if notification_ids is not None:
+            stmt = stmt.where(Notification.notification_id.in_(notification_ids))
+        result = await session.execute(stmt.values(is_read=True))
         await session.commit()
-        return count
-
+        return result.rowcount
@@ -0,0 +1,185 @@
+"""
+방별 최근 메시지 링 버퍼 (Pod 로컬)
+
+TeamSpace 접속/새로고침마다 최근 100개를 DynamoDB에서 읽던 것을,
+이 Pod에 WebSocket 구독이 있는 방은 메모리에 든 최근 CHAT_RECENT_PER_ROOM개로 바로 응답합니다.
+
+- 채우기: 첫 조회 때 DynamoDB 결과로 채우고(prime), 이후 브로드캐스트 경로(_deliver)에서 추가
+  → 구독 중인 방의 메시지는 모두 이 Pod로 전달되므로 버퍼가 최신 상태로 유지됨
+- 구독이 끝난 방은 더 이상 메시지를 받지 못하므로 버퍼를 버림 (forget)
+- Redis 구독이 재연결되면 그 사이 메시지를 놓쳤을 수 있으므로 전체 비움
+- 전체 크기가 CHAT_RECENT_MAX_BYTES를 넘으면 가장 오래 안 쓴 방부터 제거 (LRU)
+"""
+import bisect
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.chat_broker import chat_broker
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 버퍼에 보관하는 필드 (chat_service._parse_chat_item 결과와 같은 모양)
+MESSAGE_FIELDS = ("message_id", "project_id", "user_id", "message", "timestamp", "sort_key", "client_msg_id", "created_at")
+
+# dict/문자열 객체 자체 크기 대략치 (메시지 1건당)
+_MESSAGE_OVERHEAD = 600
+
+
+def _message_size(message: Dict[str, Any]) -> int:
+    return _MESSAGE_OVERHEAD + sum(len(v) for v in message.values() if isinstance(v, str))
+
+
+class _RoomBuffer:
+    __slots__ = ("keys", "messages", "bytes", "primed", "complete")
+
+    def __init__(self):
+        self.keys: List[str] = []                # 정렬 키 (오름차순)
+        self.messages: List[Dict[str, Any]] = []
+        self.bytes = 0
+        self.primed = False     # DynamoDB 최근 메시지로 채워졌는지
+        self.complete = False   # 방의 전체 기록이 버퍼 안에 있는지 (메시지가 적은 방)
+
+
+class RecentMessageCache:
+    """방별 최근 메시지 링 버퍼 + 방 단위 LRU"""
+
+    def __init__(self):
+        self._rooms: "OrderedDict[int, _RoomBuffer]" = OrderedDict()
+        self._active: set = set()
+        self._generation = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.CHAT_RECENT_PER_ROOM > 0
+
+    def _check_generation(self) -> None:
+        generation = getattr(chat_broker, "reconnects", 0)
+        if generation != self._generation:
+            self._generation = generation
+            if self._rooms:
+                logger.info(f"채팅 브로커 재연결 - 최근 메시지 버퍼 {len(self._rooms)}개 방 비움")
+            for room_id in list(self._rooms):
+                self._drop(room_id)
+
+    # -----------------------------------------------------------------
+    # 구독 상태
+    # -----------------------------------------------------------------
+    def activate(self, room_id: int) -> None:
+        """이 Pod가 방을 구독하기 시작함 (이후 메시지가 _deliver로 들어옴)"""
+        if self.enabled:
+            self._active.add(room_id)
+
+    def forget(self, room_id: int) -> None:
+        """로컬 구독이 끝난 방 정리"""
+        self._active.discard(room_id)
+        self._drop(room_id)
+
+    def _drop(self, room_id: int) -> None:
+        buf = self._rooms.pop(room_id, None)
+        if buf is not None:
+            self.bytes -= buf.bytes
+
+    # -----------------------------------------------------------------
+    # 쓰기
+    # -----------------------------------------------------------------
+    def _buffer(self, room_id: int) -> Optional[_RoomBuffer]:
+        if room_id not in self._active:
+            return None
+        self._check_generation()
+        buf = self._rooms.get(room_id)
+        if buf is None:
+            buf = self._rooms[room_id] = _RoomBuffer()
+        return buf
+
+    def _insert(self, buf: _RoomBuffer, message: Dict[str, Any]) -> None:
+        sort_key = message.get("sort_key")
+        if not sort_key:
+            return
+        pos = bisect.bisect_left(buf.keys, sort_key)
+        if pos < len(buf.keys) and buf.keys[pos] == sort_key:
+            return
+        entry = {field: message.get(field) for field in MESSAGE_FIELDS}
+        buf.keys.insert(pos, sort_key)
+        buf.messages.insert(pos, entry)
+        size = _message_size(entry)
+        buf.bytes += size
+        self.bytes += size
+
+    def _trim(self, room_id: int, buf: _RoomBuffer) -> None:
+        while len(buf.messages) > settings.CHAT_RECENT_PER_ROOM:
+            size = _message_size(buf.messages[0])
+            del buf.keys[0], buf.messages[0]
+            buf.bytes -= size
+            self.bytes -= size
+            buf.complete = False
+        self._rooms.move_to_end(room_id)
+        while self.bytes > settings.CHAT_RECENT_MAX_BYTES and len(self._rooms) > 1:
+            oldest = next(iter(self._rooms))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def observe(self, room_id: int, message: Dict[str, Any]) -> None:
+        """브로드캐스트된 메시지 추가 (이 Pod가 구독 중인 방만)"""
+        buf = self._buffer(room_id)
+        if buf is None:
+            return
+        self._insert(buf, message)
+        self._trim(room_id, buf)
+
+    def prime(self, room_id: int, messages: List[Dict[str, Any]], complete: bool) -> None:
+        """DynamoDB에서 읽은 최근 메시지로 채움 (그 사이 브로드캐스트된 메시지와 합침)"""
+        buf = self._buffer(room_id)
+        if buf is None or buf.primed:
+            return
+        for message in messages:
+            self._insert(buf, message)
+        buf.primed = True
+        buf.complete = complete
+        self._trim(room_id, buf)
+
+    # -----------------------------------------------------------------
+    # 읽기
+    # -----------------------------------------------------------------
+    def latest(self, room_id: int, limit: int) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        최근 limit개 (오래된 것 → 최신)와 더 오래된 메시지가 있는지 여부
+        버퍼로 답할 수 없으면 None (DynamoDB 조회 후 prime 호출)
+        """
+        if room_id not in self._active:
+            return None
+        self._check_generation()
+        buf = self._rooms.get(room_id)
+        if buf is None or not buf.primed or (limit > len(buf.messages) and not buf.complete):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._rooms.move_to_end(room_id)
+        messages = [dict(m) for m in buf.messages[-limit:]] if limit > 0 else []
+        has_more = len(buf.messages) > limit or not buf.complete
+        return messages, has_more
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "per_room": settings.CHAT_RECENT_PER_ROOM,
+            "active_rooms": len(self._active),
+            "buffered_rooms": len(self._rooms),
+            "messages": sum(len(buf.messages) for buf in self._rooms.values()),
+            "bytes": self.bytes,
+            "max_bytes": settings.CHAT_RECENT_MAX_BYTES,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+# 싱글톤 인스턴스
+recent_messages = RecentMessageCache()
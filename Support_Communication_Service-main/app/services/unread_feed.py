@@ -0,0 +1,130 @@
+"""
+채팅 안 읽은 수 WebSocket push
+
+헤더 배지가 방마다 폴링하지 않도록, 채팅 WebSocket에서
+`{"type": "unread_subscribe", "user_id": ...}`를 보낸 연결에 사용자의 전체 방 안 읽은 수를 push합니다.
+
+- 구독 직후 현재 값 1회 전송
+- 이후 CHAT_UNREAD_PUSH_INTERVAL마다 사용자별로 다시 계산(Query 1번 + BatchGetItem 1번)해
+  값이 바뀐 경우에만 `{"type": "unread_counts", ...}` 프레임 전송
+- 같은 사용자의 연결이 여러 개여도 계산은 사용자당 1번
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from app.core.chat_hub import ChatConnection
+from app.core.config import settings
+from app.services.chat_service import list_unread_counts
+
+logger = logging.getLogger(__name__)
+
+
+def unread_frame(counts: Dict[str, Any]) -> Dict[str, Any]:
+    """WebSocket으로 보내는 안 읽은 수 프레임"""
+    return {"type": "unread_counts", **counts}
+
+
+class UnreadFeed:
+    """사용자별 안 읽은 수 구독 (프로세스 로컬)"""
+
+    def __init__(self):
+        self._watchers: Dict[str, Set[ChatConnection]] = {}
+        self._users: Dict[ChatConnection, str] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.pushes = 0
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running or settings.CHAT_UNREAD_PUSH_INTERVAL <= 0:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    async def watch(self, user_id: str, conn: ChatConnection) -> None:
+        """연결을 사용자 안 읽은 수 구독에 추가하고 현재 값 전송"""
+        self.unwatch(conn)
+        self._watchers.setdefault(user_id, set()).add(conn)
+        self._users[conn] = user_id
+        counts = await self._refresh(user_id)
+        if counts is not None:
+            await conn.send_json(unread_frame(counts))
+
+    def unwatch(self, conn: ChatConnection) -> None:
+        user_id = self._users.pop(conn, None)
+        if user_id is None:
+            return
+        conns = self._watchers.get(user_id)
+        if conns is not None:
+            conns.discard(conn)
+            if not conns:
+                self._watchers.pop(user_id, None)
+                self._last.pop(user_id, None)
+
+    async def refresh_user(self, user_id: str) -> None:
+        """읽음 처리 등으로 값이 바뀐 사용자에게 바로 push"""
+        if user_id in self._watchers:
+            await self._push(user_id)
+
+    async def _refresh(self, user_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            counts = await list_unread_counts(user_id)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"안 읽은 수 조회 실패: user={user_id}, {e}")
+            return None
+        self.refreshes += 1
+        self._last[user_id] = counts
+        return counts
+
+    async def _push(self, user_id: str) -> None:
+        previous = self._last.get(user_id)
+        counts = await self._refresh(user_id)
+        if counts is None or counts == previous:
+            return
+        frame = unread_frame(counts)
+        for conn in list(self._watchers.get(user_id, ())):
+            self.pushes += 1
+            await conn.send_json(frame)
+
+    async def _run(self) -> None:
+        sem = asyncio.Semaphore(settings.CHAT_UNREAD_REFRESH_CONCURRENCY)
+
+        async def one(user_id: str) -> None:
+            async with sem:
+                await self._push(user_id)
+
+        while True:
+            await asyncio.sleep(settings.CHAT_UNREAD_PUSH_INTERVAL)
+            users = list(self._watchers)
+            if users:
+                await asyncio.gather(*[one(u) for u in users])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval": settings.CHAT_UNREAD_PUSH_INTERVAL,
+            "watched_users": len(self._watchers),
+            "watching_connections": len(self._users),
+            "refreshes": self.refreshes,
+            "pushes": self.pushes,
+            "errors": self.errors,
+        }
+
+
+# 싱글톤 인스턴스
+unread_feed = UnreadFeed()
@@ -1,3 +1,4 @@
 from .msa_client import msa_client, get_user_info, get_project_info, enrich_data_with_user_info
+from .http_pool import http_pool
 
-__all__ = ["msa_client", "get_user_info", "get_project_info", "enrich_data_with_user_info"]
+__all__ = ["msa_client", "get_user_info", "get_project_info", "enrich_data_with_user_info", "http_pool"]
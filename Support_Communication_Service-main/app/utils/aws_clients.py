@@ -0,0 +1,110 @@
+"""
+프로세스 단위로 재사용하는 aioboto3 클라이언트 레지스트리
+각 서비스에서 이 파일을 복사해서 사용 (http_pool.py와 동일)
+
+- `async with session.client(...)`를 호출마다 열고 닫으면 자격 증명 조회, 엔드포인트 설정,
+  커넥션 풀 생성이 매번 반복되므로 클라이언트를 한 번만 열어 계속 공유
+- 기존 `async with aws_manager.get_ddb_client() as client:` 코드는 그대로 동작
+  (컨텍스트 종료 시 클라이언트를 닫지 않음)
+- 커넥션 풀 크기: AWS_MAX_POOL_CONNECTIONS
+- shutdown 이벤트에서 close()로 모든 클라이언트 정리, health()로 상태 확인
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import aioboto3
+from botocore.config import Config
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SharedClient:
+    """공유 클라이언트를 `async with`로 꺼내 쓰기 위한 뷰"""
+
+    def __init__(self, registry: "AWSClientRegistry", key: str, service_name: str, kwargs: Dict[str, Any]):
+        self._registry = registry
+        self._key = key
+        self._service_name = service_name
+        self._kwargs = kwargs
+
+    async def __aenter__(self):
+        return await self._registry.get(self._key, self._service_name, **self._kwargs)
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+class AWSClientRegistry:
+    """key별로 aioboto3 클라이언트를 한 번만 열어 공유"""
+
+    def __init__(self, session: Optional[aioboto3.Session] = None):
+        self.session = session or aioboto3.Session()
+        # key -> (클라이언트 컨텍스트, 클라이언트, 서비스명, 생성 시각)
+        self._clients: Dict[str, Tuple[Any, Any, str, float]] = {}
+        self._lock = asyncio.Lock()
+
+    def client(self, key: str, service_name: str, **kwargs: Any) -> SharedClient:
+        """`async with registry.client(...) as client:` 형태로 사용"""
+        return SharedClient(self, key, service_name, kwargs)
+
+    async def get(self, key: str, service_name: str, **kwargs: Any):
+        """key에 해당하는 클라이언트 반환 (없으면 생성)"""
+        entry = self._clients.get(key)
+        if entry is not None:
+            return entry[1]
+
+        async with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                return entry[1]
+            kwargs.setdefault("config", Config(max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS))
+            ctx = self.session.client(service_name, **kwargs)
+            client = await ctx.__aenter__()
+            self._clients[key] = (ctx, client, service_name, time.monotonic())
+            logger.info(f"AWS 클라이언트 생성: {key} ({service_name})")
+            return client
+
+    async def close(self) -> None:
+        """모든 클라이언트 종료 (shutdown 이벤트에서 호출)"""
+        async with self._lock:
+            clients, self._clients = self._clients, {}
+        for key, (ctx, _, _, _) in clients.items():
+            try:
+                await ctx.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"AWS 클라이언트 종료 실패: {key} - {e}")
+        if clients:
+            logger.info(f"AWS 클라이언트 종료: {list(clients.keys())}")
+
+    async def health(self, probes: Dict[str, Callable[[Any], Awaitable[Any]]]) -> Dict[str, Any]:
+        """
+        열려 있는 클라이언트에 가벼운 호출을 보내 상태 확인
+        probes: 서비스명(dynamodb, s3 ...) -> async fn(client), probe가 없는 서비스는 "open"으로 표시
+        """
+        result: Dict[str, Any] = {}
+        for key, (_, client, service_name, _) in list(self._clients.items()):
+            probe = probes.get(service_name)
+            if probe is None:
+                result[key] = "open"
+                continue
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(probe(client), timeout=settings.AWS_HEALTH_TIMEOUT)
+                result[key] = f"ok ({(time.perf_counter() - started) * 1000:.1f}ms)"
+            except Exception as e:
+                result[key] = f"error: {e.__class__.__name__}"
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "max_pool_connections": settings.AWS_MAX_POOL_CONNECTIONS,
+            "clients": {
+                key: {"service": service_name, "age_seconds": round(now - created, 1)}
+                for key, (_, _, service_name, created) in self._clients.items()
+            },
+        }
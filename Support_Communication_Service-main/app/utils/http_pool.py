@@ -0,0 +1,210 @@
+"""
+MSA 서비스 간 통신을 위한 공유 HTTP 커넥션 풀
+각 서비스에서 이 파일을 복사해서 사용 (msa_client.py와 동일)
+
+- 프로세스당 httpx.AsyncClient 하나를 startup/shutdown 이벤트에서 관리
+- keep-alive 커넥션을 재사용하여 호출마다 TCP 연결/풀 생성 비용을 없앰
+- 대상 서비스별 동시 요청 수 제한 (한 서비스 장애가 풀 전체를 잡아먹지 않도록)
+- 대상별 요청 수/에러/지연시간 및 커넥션 현황 메트릭 제공
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TargetClient:
+    """
+    특정 대상 서비스용 클라이언트 뷰
+    httpx.AsyncClient와 같은 메서드(get/post/put/patch/delete/request)를 제공하므로
+    기존 `async with httpx.AsyncClient() as client:` 블록을 그대로 대체할 수 있음
+    (컨텍스트 종료 시 커넥션을 닫지 않고 풀에 반환)
+    """
+
+    def __init__(self, pool: "HTTPPool", target: Optional[str], timeout: Optional[float]):
+        self._pool = pool
+        self._target = target
+        self._timeout = timeout
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        return await self._pool.request(method, url, target=self._target, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def __aenter__(self) -> "TargetClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+class HTTPPool:
+    """프로세스 단위로 공유하는 httpx.AsyncClient 풀"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._http2 = False
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _build_client(self) -> httpx.AsyncClient:
+        http2 = settings.MSA_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("⚠️ h2 패키지가 설치되지 않아 HTTP/1.1로 동작합니다. (pip install 'httpx[http2]')")
+                http2 = False
+        self._http2 = http2
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.MSA_HTTP_TIMEOUT, connect=settings.MSA_HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=settings.MSA_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.MSA_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=settings.MSA_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            http2=http2,
+        )
+
+    async def start(self) -> None:
+        """startup 이벤트에서 호출"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+            logger.info(
+                f"HTTP 커넥션 풀 시작 (max={settings.MSA_HTTP_MAX_CONNECTIONS}, "
+                f"keepalive={settings.MSA_HTTP_MAX_KEEPALIVE}, per_target={settings.MSA_HTTP_PER_TARGET_LIMIT}, "
+                f"http2={self._http2})"
+            )
+
+    async def close(self) -> None:
+        """shutdown 이벤트에서 호출"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("HTTP 커넥션 풀 종료")
+        self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # startup 이벤트 없이 사용되는 경우(스크립트 등)를 위해 지연 생성
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+        return self._client
+
+    def target(self, name: Optional[str] = None, timeout: Optional[float] = None) -> TargetClient:
+        """대상 서비스용 클라이언트 뷰 반환 (name이 없으면 URL 호스트 기준으로 집계)"""
+        return TargetClient(self, name, timeout)
+
+    def _semaphore(self, target: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(target)
+        if sem is None:
+            sem = asyncio.Semaphore(settings.MSA_HTTP_PER_TARGET_LIMIT)
+            self._semaphores[target] = sem
+        return sem
+
+    def _target_stats(self, target: str) -> Dict[str, float]:
+        stats = self._stats.get(target)
+        if stats is None:
+            stats = {
+                "requests": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "in_flight": 0,
+                "waiting": 0,
+                "latency_ms_total": 0.0,
+                "latency_ms_max": 0.0,
+            }
+            self._stats[target] = stats
+        return stats
+
+    async def request(self, method: str, url: str, target: Optional[str] = None, **kwargs: Any) -> httpx.Response:
+        """대상별 동시성 제한과 메트릭 집계를 적용하여 요청 실행"""
+        target = target or urlsplit(url).netloc or "default"
+        stats = self._target_stats(target)
+
+        stats["waiting"] += 1
+        try:
+            await self._semaphore(target).acquire()
+        finally:
+            stats["waiting"] -= 1
+
+        stats["in_flight"] += 1
+        started = time.perf_counter()
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except httpx.TimeoutException:
+            stats["timeouts"] += 1
+            raise
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats["in_flight"] -= 1
+            stats["requests"] += 1
+            stats["latency_ms_total"] += elapsed_ms
+            stats["latency_ms_max"] = max(stats["latency_ms_max"], elapsed_ms)
+            self._semaphores[target].release()
+
+    def _connection_stats(self) -> Dict[str, int]:
+        """httpcore 내부 풀에서 커넥션 현황 조회 (내부 API라 실패 시 빈 값)"""
+        if self._client is None or self._client.is_closed:
+            return {"total": 0, "idle": 0}
+        try:
+            connections = self._client._transport._pool.connections
+            idle = sum(1 for c in connections if c.is_idle())
+            return {"total": len(connections), "idle": idle}
+        except Exception:
+            return {}
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 메트릭 스냅샷"""
+        targets = {}
+        for name, s in self._stats.items():
+            targets[name] = {
+                "requests": int(s["requests"]),
+                "errors": int(s["errors"]),
+                "timeouts": int(s["timeouts"]),
+                "in_flight": int(s["in_flight"]),
+                "waiting": int(s["waiting"]),
+                "avg_latency_ms": round(s["latency_ms_total"] / s["requests"], 2) if s["requests"] else 0.0,
+                "max_latency_ms": round(s["latency_ms_max"], 2),
+            }
+        return {
+            "started": self._client is not None and not self._client.is_closed,
+            "http2": self._http2,
+            "limits": {
+                "max_connections": settings.MSA_HTTP_MAX_CONNECTIONS,
+                "max_keepalive_connections": settings.MSA_HTTP_MAX_KEEPALIVE,
+                "keepalive_expiry": settings.MSA_HTTP_KEEPALIVE_EXPIRY,
+                "per_target": settings.MSA_HTTP_PER_TARGET_LIMIT,
+            },
+            "connections": self._connection_stats(),
+            "targets": targets,
+        }
+
+
+# 싱글톤 인스턴스
+http_pool = HTTPPool()
@@ -0,0 +1,345 @@
+"""
+토큰 버킷 기반 요청 제한 (사용자별 + IP별)
+각 서비스에서 이 파일을 복사해서 사용 (http_pool.py와 동일, redis_resp.py 필요)
+
+- 정책: 설정 RATE_LIMIT_{이름}="user=20/10,ip=60/10"
+  · "20/10" = 10초에 20회 (버킷 크기 20, 초당 2개씩 채워짐 → 순간 20회까지 허용)
+  · user 버킷은 서명을 확인한 JWT의 sub 기준, ip 버킷은 클라이언트 IP 기준
+    (토큰이 없거나 검증에 실패하면 user 버킷은 생략하고 ip 버킷만 적용
+     → 남의 sub를 넣은 위조 토큰으로 그 사용자의 버킷을 소진시킬 수 없음)
+- 백엔드 (RATE_LIMIT_BACKEND)
+  · memory: 프로세스 로컬 (Pod마다 따로 셈)
+  · redis: Lua 스크립트로 Redis에서 원자적으로 계산 → 여러 Pod가 한 버킷을 공유
+    Redis 오류 시 RATE_LIMIT_REDIS_RETRY초 동안 memory 백엔드로 대체 (Pod 보호는 유지)
+- 사용법
+  · 엔드포인트: `dependencies=[Depends(rate_limit("chat_send"))]`
+  · 앱 전체 쓰기 요청: `app.add_middleware(RateLimitMiddleware, policy="write")`
+  · WebSocket 등 직접 호출: `retry_after = await rate_limiter.hit("chat_send", user=..., ip=...)`
+- 초과 시 429 + Retry-After 헤더
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import Request
+from starlette.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.exceptions import BusinessException, ErrorCode
+from app.core.security import cognito_verifier
+from app.utils.redis_resp import RedisConnection
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]=버킷 키, ARGV = 버킷 크기, 초당 충전량, 비용
+# 반환: {허용 여부(1/0), 재시도까지 남은 초(문자열)}
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, tostring(retry)}
+"""
+
+
+def parse_rate(value: str) -> Tuple[float, float]:
+    """"20/10" → (버킷 크기 20, 초당 충전량 2.0)"""
+    count, _, seconds = value.partition("/")
+    capacity = float(count)
+    period = float(seconds or 1)
+    if capacity <= 0 or period <= 0:
+        raise ValueError(value)
+    return capacity, capacity / period
+
+
+class RateLimitPolicy:
+    __slots__ = ("name", "limits")
+
+    def __init__(self, name: str, spec: str):
+        self.name = name
+        # scope("user"/"ip") -> (버킷 크기, 초당 충전량)
+        self.limits: Dict[str, Tuple[float, float]] = {}
+        for part in (spec or "").split(","):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                scope, rate = part.split("=", 1)
+                self.limits[scope.strip()] = parse_rate(rate.strip())
+            except ValueError:
+                logger.warning(f"⚠️ 잘못된 요청 제한 정책 무시: {name}={part}")
+
+
+class MemoryBucketStore:
+    """프로세스 로컬 토큰 버킷 (오래 안 쓴 키부터 정리)"""
+
+    def __init__(self):
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> float:
+        """허용되면 0, 아니면 재시도까지 남은 초"""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [capacity, now]
+        else:
+            self._buckets.move_to_end(key)
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens >= cost:
+            bucket[0] = tokens - cost
+            retry = 0.0
+        else:
+            bucket[0] = tokens
+            retry = (cost - tokens) / rate
+        while len(self._buckets) > settings.RATE_LIMIT_MEMORY_KEYS:
+            self._buckets.popitem(last=False)
+        return retry
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RedisBucketStore:
+    """Redis 공유 토큰 버킷 (연결 여러 개를 돌려 쓰며 연결마다 요청/응답을 직렬화)"""
+
+    def __init__(self, url: str):
+        self._conns = [RedisConnection(url, settings.RATE_LIMIT_REDIS_TIMEOUT) for _ in range(max(1, settings.RATE_LIMIT_REDIS_POOL))]
+        self._locks = [asyncio.Lock() for _ in self._conns]
+        self._next = 0
+        self._sha: Optional[str] = None
+
+    async def take(self, key: str, capacity: float, rate: float, cost: float = 1.0) -> float:
+        index = self._next
+        self._next = (self._next + 1) % len(self._conns)
+        conn = self._conns[index]
+        async with self._locks[index]:
+            try:
+                if not conn.connected:
+                    await conn.connect()
+                reply = await asyncio.wait_for(self._eval(conn, key, capacity, rate, cost), settings.RATE_LIMIT_REDIS_TIMEOUT)
+            except BaseException:
+                # 응답을 다 읽지 못한 연결은 재사용하지 않음
+                await conn.close()
+                raise
+        allowed, retry = reply
+        return 0.0 if int(allowed) == 1 else float(retry)
+
+    async def _eval(self, conn: RedisConnection, key: str, capacity: float, rate: float, cost: float) -> Any:
+        args = (1, key, capacity, rate, cost)
+        if self._sha is not None:
+            try:
+                return await conn.execute("EVALSHA", self._sha, *args)
+            except Exception as e:
+                if "NOSCRIPT" not in str(e):
+                    raise
+        self._sha = (await conn.execute("SCRIPT", "LOAD", _TOKEN_BUCKET_LUA)).decode()
+        return await conn.execute("EVALSHA", self._sha, *args)
+
+    async def close(self) -> None:
+        for conn in self._conns:
+            await conn.close()
+
+
+class RateLimiter:
+    """정책별 사용자/IP 토큰 버킷"""
+
+    def __init__(self):
+        self._policies: Dict[str, RateLimitPolicy] = {}
+        self._memory = MemoryBucketStore()
+        self._redis: Optional[RedisBucketStore] = None
+        self._redis_down_until = 0.0
+        self.allowed: Dict[str, int] = {}
+        self.limited: Dict[str, int] = {}
+        self.redis_errors = 0
+        self.fallbacks = 0
+
+    @property
+    def backend(self) -> str:
+        if settings.RATE_LIMIT_BACKEND.lower() == "redis" and settings.RATE_LIMIT_REDIS_URL:
+            return "redis"
+        return "memory"
+
+    def policy(self, name: str) -> RateLimitPolicy:
+        policy = self._policies.get(name)
+        if policy is None:
+            spec = getattr(settings, f"RATE_LIMIT_{name.upper()}", "")
+            policy = self._policies[name] = RateLimitPolicy(name, spec)
+        return policy
+
+    async def _take(self, key: str, capacity: float, rate: float, cost: float) -> float:
+        if self.backend == "redis" and time.monotonic() >= self._redis_down_until:
+            if self._redis is None:
+                self._redis = RedisBucketStore(settings.RATE_LIMIT_REDIS_URL)
+            try:
+                return await self._redis.take(key, capacity, rate, cost)
+            except Exception as e:
+                self.redis_errors += 1
+                self._redis_down_until = time.monotonic() + settings.RATE_LIMIT_REDIS_RETRY
+                logger.warning(f"요청 제한 Redis 오류 - {settings.RATE_LIMIT_REDIS_RETRY}초 동안 로컬 버킷 사용: {e}")
+        if self.backend == "redis":
+            self.fallbacks += 1
+        return self._memory.take(key, capacity, rate, cost)
+
+    async def hit(self, name: str, user: Optional[str] = None, ip: Optional[str] = None, cost: float = 1.0) -> float:
+        """
+        요청 1건 기록. 허용되면 0, 초과면 Retry-After 초 반환
+        (user/ip 중 하나라도 초과면 초과, 둘 중 긴 대기 시간 반환)
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return 0.0
+        retry = 0.0
+        for scope, ident in (("user", user), ("ip", ip)):
+            limit = self.policy(name).limits.get(scope)
+            if limit is None or not ident:
+                continue
+            key = f"{settings.RATE_LIMIT_KEY_PREFIX}{name}:{scope}:{ident}"
+            retry = max(retry, await self._take(key, limit[0], limit[1], cost))
+        if retry > 0:
+            self.limited[name] = self.limited.get(name, 0) + 1
+        else:
+            self.allowed[name] = self.allowed.get(name, 0) + 1
+        return retry
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.RATE_LIMIT_ENABLED,
+            "backend": self.backend,
+            "redis_available": self.backend == "redis" and time.monotonic() >= self._redis_down_until,
+            "policies": {name: p.limits for name, p in self._policies.items()},
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "memory_keys": len(self._memory),
+            "redis_errors": self.redis_errors,
+            "fallbacks": self.fallbacks,
+        }
+
+
+# 싱글톤 인스턴스
+rate_limiter = RateLimiter()
+
+
+# =================================================================
+# 요청 식별 (사용자 / IP)
+# =================================================================
+def client_ip(headers, fallback: Optional[str]) -> Optional[str]:
+    """
+    클라이언트 IP
+    ALB 등 프록시는 X-Forwarded-For 끝에 실제 접속 IP를 붙이므로, 클라이언트가 넣은 앞부분은 믿지 않고
+    오른쪽에서 RATE_LIMIT_TRUSTED_PROXIES번째 값을 사용
+    프록시 뒤(TRUSTED_PROXIES > 0)인데 헤더가 없으면 클러스터 내부 서비스 간 호출로 보고 None (IP 제한 안 함)
+    """
+    hops = settings.RATE_LIMIT_TRUSTED_PROXIES
+    if hops <= 0:
+        return fallback
+    parts = [p.strip() for p in (headers.get("x-forwarded-for") or "").split(",") if p.strip()]
+    if not parts:
+        return None
+    return parts[-min(hops, len(parts))]
+
+
+# 검증한 토큰 → (만료 시각, sub) 캐시 (요청마다 RS256 검증을 반복하지 않도록)
+_SUBJECT_CACHE_SIZE = 10000
+_subjects: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+async def verified_subject(authorization: Optional[str]) -> Optional[str]:
+    """Bearer JWT의 sub (Cognito 서명 검증에 성공한 경우만, 아니면 None → ip 버킷만 적용)"""
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    token = authorization[7:]
+    key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _subjects.get(key)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+    try:
+        payload = await cognito_verifier.verify_token(token)
+    except Exception:
+        return None
+    subject = payload.get("sub") or payload.get("email")
+    if not subject:
+        return None
+    _subjects[key] = (float(payload.get("exp") or time.time()), str(subject))
+    _subjects.move_to_end(key)
+    while len(_subjects) > _SUBJECT_CACHE_SIZE:
+        _subjects.popitem(last=False)
+    return str(subject)
+
+
+def retry_after_header(retry: float) -> Dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(retry)))}
+
+
+def rate_limit(name: str):
+    """엔드포인트별 요청 제한 의존성 - 초과 시 429 (Retry-After)"""
+
+    async def dependency(request: Request) -> None:
+        retry = await rate_limiter.hit(
+            name,
+            user=await verified_subject(request.headers.get("authorization")),
+            ip=client_ip(request.headers, request.client.host if request.client else None),
+        )
+        if retry > 0:
+            raise BusinessException(ErrorCode.TOO_MANY_REQUESTS, headers=retry_after_header(retry))
+
+    return dependency
+
+
+class RateLimitMiddleware:
+    """
+    앱 전체 쓰기 요청(POST/PUT/PATCH/DELETE)에 공통 정책 적용 (ASGI 미들웨어)
+    엔드포인트별 정책보다 느슨한 상한으로, 한 클라이언트가 Pod 전체를 잡아먹지 않도록 함
+    """
+
+    WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+    def __init__(self, app, policy: str = "write", exclude_prefixes: Tuple[str, ...] = ("/health",)):
+        self.app = app
+        self.policy = policy
+        self.exclude_prefixes = exclude_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.WRITE_METHODS or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        client = scope.get("client")
+        retry = await rate_limiter.hit(
+            self.policy,
+            user=await verified_subject(headers.get("authorization")),
+            ip=client_ip(headers, client[0] if client else None),
+        )
+        if retry > 0:
+            code = ErrorCode.TOO_MANY_REQUESTS
+            response = JSONResponse(
+                status_code=code.http_status,
+                content={"success": False, "code": code.biz_code, "message": code.default_message, "data": None},
+                headers=retry_after_header(retry),
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,96 @@
+"""
+Redis(RESP2) 최소 클라이언트 - 추가 의존성 없이 asyncio 스트림으로 직접 구현
+각 서비스에서 이 파일을 복사해서 사용 (http_pool.py와 동일)
+
+- RedisConnection: 단일 연결 (AUTH/SELECT 포함), execute()는 요청/응답 1회
+- 동시에 여러 코루틴이 쓰는 경우 호출 측에서 Lock 또는 연결 풀로 직렬화해야 함
+"""
+import asyncio
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+
+class RedisProtocolError(Exception):
+    pass
+
+
+def encode_command(*args: Any) -> bytes:
+    out = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        out.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(out)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Redis 연결이 끊어졌습니다.")
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b"+":
+        return body.decode()
+    if prefix == b"-":
+        raise RedisProtocolError(body.decode())
+    if prefix == b":":
+        return int(body)
+    if prefix == b"$":
+        length = int(body)
+        if length == -1:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        count = int(body)
+        if count == -1:
+            return None
+        return [await read_reply(reader) for _ in range(count)]
+    raise RedisProtocolError(f"알 수 없는 응답: {line!r}")
+
+
+class RedisConnection:
+    """단일 Redis 연결 (AUTH/SELECT 포함)"""
+
+    def __init__(self, url: str, connect_timeout: float = 3.0):
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.username = parts.username or None
+        self.password = parts.password or None
+        path = (parts.path or "").lstrip("/")
+        self.db = int(path) if path.isdigit() else 0
+        self.connect_timeout = connect_timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    @property
+    def connected(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    async def connect(self) -> None:
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            timeout=self.connect_timeout,
+        )
+        if self.password:
+            args = ["AUTH", self.username, self.password] if self.username else ["AUTH", self.password]
+            await self.execute(*args)
+        if self.db:
+            await self.execute("SELECT", self.db)
+
+    async def send(self, *args: Any) -> None:
+        self.writer.write(encode_command(*args))
+        await self.writer.drain()
+
+    async def execute(self, *args: Any) -> Any:
+        await self.send(*args)
+        return await read_reply(self.reader)
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+        self.reader = None
+        self.writer = None
@@ -0,0 +1,78 @@
+"""
+채팅 메시지 정렬 키 생성 (Snowflake 방식: 시각 + 노드 ID)
+각 서비스에서 이 파일을 복사해서 사용 (http_pool.py와 동일)
+
+- 같은 밀리초에 들어온 메시지가 같은 키로 덮어써지지 않도록 마이크로초 시각 + 노드 ID 사용
+  · 한 프로세스 안에서는 시각이 같거나 뒤로 가면 1µs씩 올려 단조 증가 보장
+  · 노드 ID(프로세스마다 랜덤)로 Pod 간 충돌 방지
+- 클라이언트가 idempotency key(client_msg_id)와 보낸 시각을 함께 주면 두 값으로 키를 결정적으로 생성
+  → 재전송된 메시지는 같은 키로 저장되어 중복이 생기지 않음
+  (클라이언트 시각이 서버 시각과 CHAT_CLIENT_TS_SKEW 이상 차이 나면 서버 시각 사용)
+"""
+import hashlib
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+_EPOCH = datetime(1970, 1, 1)
+
+# message_id를 client_msg_id에서 만들 때 쓰는 네임스페이스
+MESSAGE_ID_NAMESPACE = uuid.UUID("6f1c1f5e-4b7a-4f38-9a55-3c2d2b7e9a10")
+
+
+def idempotency_suffix(client_msg_id: str) -> str:
+    """client_msg_id로 만든 키 접미사 (노드 ID와 겹치지 않도록 'c' 접두)"""
+    return "c" + hashlib.sha256(client_msg_id.encode()).hexdigest()[:15]
+
+
+def message_id_for(scope: str, client_msg_id: str) -> str:
+    """재전송돼도 같은 message_id가 나오도록 client_msg_id에서 UUID 생성"""
+    return str(uuid.uuid5(MESSAGE_ID_NAMESPACE, f"{scope}:{client_msg_id}"))
+
+
+def us_to_iso(us: int) -> str:
+    """epoch 마이크로초 → UTC ISO 문자열 (예: 2026-01-01T00:00:00.000000Z)"""
+    return (_EPOCH + timedelta(microseconds=us)).isoformat(timespec="microseconds") + "Z"
+
+
+def iso_to_us(value: Optional[str]) -> Optional[int]:
+    """ISO 문자열 → epoch 마이크로초 (타임존이 없으면 UTC로 간주, 파싱 실패 시 None)"""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+class SortKeyGenerator:
+    """프로세스 단위 정렬 키 생성기"""
+
+    def __init__(self, node_id: Optional[str] = None):
+        self.node_id = node_id or uuid.uuid4().hex[:8]
+        self._last_us = 0
+
+    def _next_us(self) -> int:
+        now_us = time.time_ns() // 1000
+        if now_us <= self._last_us:
+            now_us = self._last_us + 1
+        self._last_us = now_us
+        return now_us
+
+    def next(self, client_msg_id: Optional[str] = None, client_us: Optional[int] = None) -> Tuple[int, str]:
+        """(epoch 마이크로초, 키 접미사) 반환"""
+        if client_msg_id and client_us is not None:
+            skew_us = settings.CHAT_CLIENT_TS_SKEW * 1_000_000
+            if abs(time.time_ns() // 1000 - client_us) <= skew_us:
+                return client_us, idempotency_suffix(client_msg_id)
+        return self._next_us(), self.node_id
+
+
+# 싱글톤 인스턴스
+sort_key_generator = SortKeyGenerator()
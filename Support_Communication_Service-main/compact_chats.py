@@ -0,0 +1,41 @@
+"""
+채팅 일별 compaction 실행 스크립트 (DynamoDB → S3 gzip JSONL)
+k8s CronJob에서 하루 한 번 실행합니다.
+실패한 방/날짜가 있으면 종료 코드 1로 끝나 CronJob이 다시 시도합니다.
+
+사용법:
+    python compact_chats.py                                   # 아카이브 경계 전날까지 아직 아카이브되지 않은 날짜
+    python compact_chats.py --from 2026-01-01 --to 2026-01-31  # 기존 데이터 일괄 이전
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import aws_manager  # noqa: E402
+from app.services.chat_compactor import chat_compactor  # noqa: E402
+
+
+async def run(args: argparse.Namespace) -> bool:
+    try:
+        result = await chat_compactor.run(args.start_day, args.end_day)
+        print(result)
+        return not result["failed"]
+    finally:
+        await aws_manager.close()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="채팅 일별 compaction (DynamoDB → S3)")
+    parser.add_argument("--from", dest="start_day", default=None, help="시작 날짜 (YYYY-MM-DD, UTC, 생략 시 아카이브되지 않은 가장 오래된 날짜부터)")
+    parser.add_argument("--to", dest="end_day", default=None, help="종료 날짜 (YYYY-MM-DD, UTC, 경계 전날까지만)")
+    if not asyncio.run(run(parser.parse_args())):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
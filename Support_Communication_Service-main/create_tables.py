@@ -27,7 +27,7 @@ def create_tables():
         engine = create_engine(DATABASE_URL, echo=True)
         Base = declarative_base()
         
-        from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, BigInteger, Text, Boolean
+        from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, BigInteger, Text, Boolean, Index
         import enum
         
         class ProjectReportType(str, enum.Enum):
@@ -62,12 +62,17 @@ def create_tables():
             __tablename__ = "notifications"
             
             notification_id = Column(BigInteger, primary_key=True, autoincrement=True)
-            user_id = Column(String(36), nullable=False, index=True)
+            user_id = Column(String(36), nullable=False)
             message = Column(Text)
             link = Column(Text)
             is_read = Column(Boolean, nullable=False, server_default="0")
             created_at = Column(DateTime, nullable=False, server_default=func.now())
             updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+            
+            __table_args__ = (
+                Index("ix_notifications_user_created", "user_id", "created_at"),
+                Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+            )
         
         class Notice(Base):
             __tablename__ = "notices"
@@ -0,0 +1,37 @@
+"""Notification composite indexes
+
+Revision ID: 002_notification_indexes
+Revises: 001_create_support_tables
+Create Date: 2026-10-17
+
+알림 목록을 커서 페이지로, 안 읽은 수를 별도 COUNT로 조회하도록 바꾸면서 인덱스 교체:
+- ix_notifications_user_read_created (user_id, is_read, created_at)
+  → 안 읽은 수 COUNT를 인덱스만으로 처리 (30초 폴링), 안 읽은 알림 목록
+- ix_notifications_user_created (user_id, created_at)
+  → 최신순 목록을 정렬 없이 limit개만 읽음
+- ix_notifications_user_id는 위 두 인덱스의 앞부분과 겹치므로 삭제
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_notification_indexes'
+down_revision: Union[str, Sequence[str], None] = '001_create_support_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the user_id index with composite indexes."""
+    op.create_index('ix_notifications_user_read_created', 'notifications', ['user_id', 'is_read', 'created_at'], unique=False)
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.drop_index('ix_notifications_user_id', table_name='notifications')
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index."""
+    op.create_index('ix_notifications_user_id', 'notifications', ['user_id'], unique=False)
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_index('ix_notifications_user_read_created', table_name='notifications')
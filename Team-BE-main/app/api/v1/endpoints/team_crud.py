@@ -314,6 +314,62 @@ async def get_team_stats(project_id: int, db: AsyncSession = Depends(get_db)):
             "stats": {"total_members": 0, "total_tasks": 0, "completed_tasks": 0, "total_files": 0}
         }
 
+# =====================================================
+# 4-1. 팀장 일괄 조회 (Project Service 프로젝트 목록용)
+# =====================================================
+@router.post("/leaders/batch")
+async def get_team_leaders_batch(request_body: dict, db: AsyncSession = Depends(get_db)):
+    """
+    여러 프로젝트의 팀장 user_id/닉네임 일괄 조회
+    - 프로젝트 N개에 대해 팀 조회 쿼리 1회 + Auth /users/batch 1회
+    - 팀이 없는 프로젝트는 결과에서 제외
+    """
+    project_ids = request_body.get("project_ids") or []
+    try:
+        project_ids = list({int(pid) for pid in project_ids})
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="project_ids는 정수 목록이어야 합니다.")
+
+    if not project_ids:
+        return {"status": "success", "data": []}
+
+    try:
+        result = await db.execute(
+            select(Team.project_id, TeamMember.user_id)
+            .join(TeamMember, Team.team_id == TeamMember.team_id)
+            .where(Team.project_id.in_(project_ids), TeamMember.role == TeamRole.LEADER)
+        )
+        # 프로젝트당 팀장 1명 (중복 시 첫 번째 사용)
+        leaders = {}
+        for project_id, user_id in result.all():
+            leaders.setdefault(project_id, user_id)
+
+        # Auth 서비스에서 닉네임 일괄 조회
+        users_dict = {}
+        if leaders:
+            from app.utils.msa_client import msa_client
+            users_data = await msa_client.get_users_batch(list(set(leaders.values())))
+            if users_data:
+                users_dict = {u.get("user_id"): u for u in users_data}
+            else:
+                logger.warning("Auth 서비스 응답이 비어있습니다 - 닉네임 없이 반환")
+
+        return {
+            "status": "success",
+            "data": [
+                {
+                    "project_id": project_id,
+                    "user_id": user_id,
+                    "nickname": users_dict.get(user_id, {}).get("nickname"),
+                }
+                for project_id, user_id in leaders.items()
+            ],
+        }
+
+    except Exception as e:
+        logger.error(f"팀장 일괄 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"팀장 일괄 조회 실패: {str(e)}")
+
 # =====================================================
 # 5. 팀 삭제 (Project Service에서 프로젝트 삭제 시 호출)
 # =====================================================
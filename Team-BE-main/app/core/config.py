@@ -30,6 +30,15 @@ class Settings(BaseSettings):
     AI_SERVICE_URL: str = "http://ai-service"
     SUPPORT_SERVICE_URL: str = "http://support-service"
     
+    # [MSA HTTP Connection Pool]
+    MSA_HTTP_TIMEOUT: float = 30.0
+    MSA_HTTP_CONNECT_TIMEOUT: float = 5.0
+    MSA_HTTP_MAX_CONNECTIONS: int = 100
+    MSA_HTTP_MAX_KEEPALIVE: int = 20
+    MSA_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    MSA_HTTP_PER_TARGET_LIMIT: int = 50
+    MSA_HTTP2: bool = False
+    
     # [Frontend URL]
     FRONTEND_URL: str = "http://localhost:3000"
     
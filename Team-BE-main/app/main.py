@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from prometheus_fastapi_instrumentator import Instrumentator
+from app.utils.http_pool import http_pool
 import logging
 import os
 
@@ -41,6 +42,20 @@ app.include_router(teams.router, prefix="/api/v1/teams", tags=["teams"])
 # MSA 분리용 팀 API (Project Service에서 호출)
 app.include_router(team_crud.router, prefix="/api/v1/teams", tags=["team-msa"])
 
+# 서비스 간 통신용 HTTP 커넥션 풀 (프로세스당 1개, keep-alive 재사용)
+@app.on_event("startup")
+async def start_http_pool():
+    await http_pool.start()
+
+@app.on_event("shutdown")
+async def close_http_pool():
+    await http_pool.close()
+
+@app.get("/health/http-pool")
+async def http_pool_check():
+    """서비스 간 HTTP 커넥션 풀 현황 (대상별 요청/에러/지연시간, 커넥션 수)"""
+    return http_pool.stats()
+
 @app.get("/")
 async def root():
     logger.info("Root endpoint accessed")
@@ -67,7 +82,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
 from datetime import datetime
-import httpx
 
 @app.get("/api/v1/integration/project-team-info/{project_id}")
 async def get_project_team_info(project_id: int, db: AsyncSession = Depends(get_db)):
@@ -85,7 +99,7 @@ async def get_project_team_info(project_id: int, db: AsyncSession = Depends(get_
     # 1. Project Service에서 프로젝트 정보 가져오기
     PROJECT_SERVICE_URL = os.getenv("PROJECT_SERVICE_URL", "http://project-service")
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with http_pool.target("project", timeout=5.0) as client:
             resp = await client.get(f"{PROJECT_SERVICE_URL}/projects/{project_id}")
             if resp.status_code == 200:
                 result = resp.json()